@@ -0,0 +1,98 @@
+"""Per-call logging overhead on the tool hot path.
+
+Logs are emitted at INFO (the production level), so every DEBUG statement on
+the hot path is filtered out and whatever it still costs is pure overhead.
+Two views are reported:
+
+* message styles: the cost of one filtered DEBUG statement written as an eager
+  f-string (the previous style), with positional arguments, with
+  `logger.opt(lazy=True)`, and with a single deferred argument;
+* hot paths: tool filtering, MCP conversion and result formatting with a
+  discarding sink at INFO and at DEBUG. Run it against an older revision to
+  compare before/after.
+
+Usage:
+    python benchmarks/bench_logging_overhead.py [--tools 1000] [--repeat 5]
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+
+from loguru import logger
+
+from universal_mcp.tools.adapters import convert_tool_to_mcp_tool, format_to_mcp_result
+from universal_mcp.tools.manager import _Deferred, _filter_by_name, _filter_by_tags
+from universal_mcp.tools.tools import Tool
+
+
+def _make_tool(index: int) -> Tool:
+    def fn(query: str, limit: int = 10) -> str:
+        return query
+
+    fn.__name__ = f"tool_{index}"
+    fn.__doc__ = f"Tool number {index}.\n\nArgs:\n    query: The query.\n    limit: Max results.\n\nTags:\n    group_{index % 10}, important\n"
+    tool = Tool.from_function(fn)
+    tool.app_name = "bench"
+    return tool
+
+
+def best_per_call(fn: Callable[[], object], calls: int, repeat: int) -> float:
+    """Returns the best observed time per call, in microseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        best = min(best, (time.perf_counter() - start) / calls)
+    return best * 1e6
+
+
+def bench_message_styles(tools: list[Tool], calls: int, repeat: int) -> None:
+    print(f"Filtered DEBUG statement over {len(tools)} tool names (us/call):")
+    cases = {
+        "eager f-string": lambda: logger.debug(f"All tools: {[tool.name for tool in tools]}"),
+        "positional": lambda: logger.debug("Tool count: {}", len(tools)),
+        "lazy": lambda: logger.opt(lazy=True).debug("All tools: {}", lambda: [tool.name for tool in tools]),
+        "deferred": lambda: logger.debug("All tools: {}", _Deferred(lambda: [tool.name for tool in tools])),
+    }
+    for label, fn in cases.items():
+        print(f"  {label:<16}{best_per_call(fn, calls, repeat):>10.3f}")
+
+
+def bench_hot_paths(tools: list[Tool], calls: int, repeat: int) -> None:
+    names = [tool.name for tool in tools[:: max(1, len(tools) // 50)]]
+    cases = {
+        "_filter_by_name": lambda: _filter_by_name(tools, names),
+        "_filter_by_tags": lambda: _filter_by_tags(tools, ["group_3"]),
+        "convert_tool_to_mcp_tool": lambda: convert_tool_to_mcp_tool(tools[0]),
+        "format_to_mcp_result": lambda: format_to_mcp_result("ok"),
+    }
+    print("Hot paths (us/call):")
+    print(f"  {'':<26}{'INFO':>10}{'DEBUG':>10}")
+    for label, fn in cases.items():
+        logger.remove()
+        logger.add(lambda message: None, level="INFO")
+        production = best_per_call(fn, calls, repeat)
+        logger.remove()
+        logger.add(lambda message: None, level="DEBUG")
+        debug = best_per_call(fn, calls, repeat)
+        print(f"  {label:<26}{production:>10.3f}{debug:>10.3f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tools", type=int, default=1000, help="Number of synthesized tools")
+    parser.add_argument("--calls", type=int, default=2000, help="Calls per timed pass")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed passes; the best pass is reported")
+    options = parser.parse_args()
+
+    logger.remove()
+    logger.add(lambda message: None, level="INFO")
+    tools = [_make_tool(index) for index in range(options.tools)]
+    bench_message_styles(tools, options.calls, options.repeat)
+    bench_hot_paths(tools, options.calls, options.repeat)
+
+
+if __name__ == "__main__":
+    main()
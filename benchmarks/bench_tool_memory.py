@@ -0,0 +1,53 @@
+"""Memory held per registered tool, full `Tool` versus `CompactTool`.
+
+Registers the tools of a synthesized generated-style application (see
+`bench_tool_pipeline.py`) into a fresh `ToolManager` and reports the memory
+still allocated afterwards, divided by the number of tools. Caches are cleared
+first, and memory they hold for the registered tools (docstring parses,
+argument models) is counted, since it lives as long as the process does.
+
+Usage:
+    python benchmarks/bench_tool_memory.py [--tools 10000]
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from bench_tool_pipeline import clear_caches, make_app
+from loguru import logger
+
+from universal_mcp.tools.manager import ToolManager
+from universal_mcp.tools.schema_interning import clear_interned_schemas
+
+
+def retained_bytes_per_tool(size: int, compact: bool) -> float:
+    app = make_app(size)
+    clear_caches()
+    clear_interned_schemas()
+    gc.collect()
+    tracemalloc.start()
+    manager = ToolManager(compact_tools=compact)
+    manager.register_tools_from_app(app)
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(manager.get_tools()) == size
+    return retained / size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tools", type=int, default=10_000, help="Number of synthesized tools")
+    options = parser.parse_args()
+
+    logger.remove()
+    full = retained_bytes_per_tool(options.tools, compact=False)
+    compact = retained_bytes_per_tool(options.tools, compact=True)
+    print(f"{options.tools} tools, bytes retained per tool:")
+    print(f"  Tool         {full:>10,.0f}")
+    print(f"  CompactTool  {compact:>10,.0f}  ({compact / full - 1:+.0%})")
+
+
+if __name__ == "__main__":
+    main()
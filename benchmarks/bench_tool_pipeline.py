@@ -0,0 +1,263 @@
+"""Benchmarks of the tool registration and invocation pipeline.
+
+Synthesizes applications shaped like generated API apps with 10, 100, 1000
+and 5000 tools and measures, for each size:
+
+* `Tool.from_function` cost per tool, cold (docstring and schema caches
+  cleared) and warm;
+* `ToolManager.register_tools_from_app` time, and the memory it allocates;
+* `ToolManager.get_tools` latency unfiltered, by tag and by name;
+* `convert_tools` time per format (LangChain only if it is installed);
+* `Tool.run` overhead over calling a no-op function directly.
+
+Every stored metric is lower-is-better. Results can be saved as a baseline
+and later runs compared against it; the comparison exits with status 1 when
+a metric regresses beyond the threshold. Baselines only compare meaningfully
+on the machine that recorded them.
+
+Usage:
+    python benchmarks/bench_tool_pipeline.py [--sizes 10 100 1000 5000] [--repeat 3]
+    python benchmarks/bench_tool_pipeline.py --save-baseline benchmarks/baselines/tool_pipeline.json
+    python benchmarks/bench_tool_pipeline.py --compare benchmarks/baselines/tool_pipeline.json [--threshold 0.25]
+"""
+
+import argparse
+import asyncio
+import gc
+import importlib.util
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from universal_mcp.applications.application import BaseApplication
+from universal_mcp.tools.adapters import convert_tools
+from universal_mcp.tools.docstring_parser import _parse_docstring_cached
+from universal_mcp.tools.func_metadata import _ARG_MODEL_CACHE, _arg_model_json_schema
+from universal_mcp.tools.manager import ToolManager
+from universal_mcp.tools.tools import Tool, _cached_return_type_schema
+from universal_mcp.types import ToolFormat
+
+DEFAULT_SIZES = (10, 100, 1000, 5000)
+DEFAULT_BASELINE = Path(__file__).parent / "baselines" / "tool_pipeline.json"
+
+_RESOURCES = ["contacts", "deals", "tickets", "emails", "products", "invoices", "calls", "notes", "tasks", "quotes"]
+# Parameter lists and return annotations cycled through by the generated tools.
+_SIGNATURES = [
+    ("self, id: str", "dict[str, Any]"),
+    ("self, limit: int = 10, after: str | None = None, properties: list[str] | None = None", "list[dict[str, Any]]"),
+    ("self, body: dict[str, Any], dry_run: bool = False", "dict[str, Any]"),
+    ("self, query: str, filters: list[dict[str, Any]] | None = None, sort: str | None = None, limit: int = 100", "Any"),
+    ("self, id: str, archived: bool = False", "None"),
+]
+
+
+def _generate_method(index: int) -> str:
+    resource = _RESOURCES[index % len(_RESOURCES)]
+    params, returns = _SIGNATURES[index % len(_SIGNATURES)]
+    names = [param.split(":")[0].strip() for param in params.split(",")[1:]]
+    args = "\n".join(f"            {name}: The {name} of {resource} request #{index}." for name in names)
+    return f'''
+    def tool_{index}({params}) -> {returns}:
+        """Calls {resource} endpoint #{index} of the API.
+
+        Args:
+{args}
+
+        Returns:
+            {returns}: The API response.
+
+        Raises:
+            HTTPError: Raised when the API request fails.
+
+        Tags:
+            {resource}, group_{index % 10}, important
+        """
+        return None
+'''
+
+
+def make_app(size: int) -> BaseApplication:
+    """Builds an application exposing `size` generated methods as tools."""
+    source = "class BenchApp(BaseApplication):\n"
+    source += "".join(_generate_method(index) for index in range(size))
+    source += f"""
+    def list_tools(self):
+        return [getattr(self, f"tool_{{index}}") for index in range({size})]
+"""
+    namespace: dict[str, Any] = {"BaseApplication": BaseApplication, "Any": Any}
+    exec(source, namespace)
+    return namespace["BenchApp"](name=f"bench{size}")
+
+
+def clear_caches() -> None:
+    """Clears the docstring and schema caches filled by `Tool.from_function`."""
+    _parse_docstring_cached.cache_clear()
+    _cached_return_type_schema.cache_clear()
+    _ARG_MODEL_CACHE.clear()
+    _arg_model_json_schema.cache_clear()
+
+
+def best_time(fn: Callable[[], object], repeat: int, setup: Callable[[], object] | None = None) -> float:
+    """Returns the best observed time of one call, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_size(size: int, repeat: int, formats: list[ToolFormat]) -> dict[str, float]:
+    app = make_app(size)
+    functions = app.list_tools()
+    results: dict[str, float] = {}
+
+    def build_tools() -> None:
+        for function in functions:
+            Tool.from_function(function)
+
+    results["from_function_cold_us_per_tool"] = best_time(build_tools, repeat, setup=clear_caches) / size * 1e6
+    results["from_function_warm_us_per_tool"] = best_time(build_tools, repeat) / size * 1e6
+
+    results["register_tools_from_app_ms"] = (
+        best_time(lambda: ToolManager().register_tools_from_app(app), repeat, setup=clear_caches) * 1e3
+    )
+    clear_caches()
+    gc.collect()
+    tracemalloc.start()
+    manager = ToolManager()
+    manager.register_tools_from_app(app)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    results["register_tools_from_app_peak_kib"] = peak / 1024
+    results["register_tools_from_app_retained_bytes_per_tool"] = retained / size
+
+    names = [tool.name for tool in manager.get_tools()[:: max(1, size // 10)]]
+    calls = max(10, 20_000 // size)
+    for label, fn in {
+        "all": lambda: manager.get_tools(),
+        "by_tag": lambda: manager.get_tools(tags=["group_3"]),
+        "by_name": lambda: manager.get_tools(tool_names=names),
+    }.items():
+        elapsed = best_time(lambda fn=fn: [fn() for _ in range(calls)], repeat)
+        results[f"get_tools_{label}_us"] = elapsed / calls * 1e6
+
+    tools = manager.get_tools()
+    for format in formats:
+        results[f"convert_tools_{format.value}_ms"] = best_time(lambda f=format: convert_tools(tools, f), repeat) * 1e3
+    return results
+
+
+def bench_run_overhead(calls: int, repeat: int) -> dict[str, float]:
+    def noop() -> None:
+        return None
+
+    async def async_noop() -> None:
+        return None
+
+    results: dict[str, float] = {}
+    for label, fn in {"sync": noop, "async": async_noop}.items():
+        tool = Tool.from_function(fn)
+        is_async = label == "async"
+
+        async def direct(fn=fn, is_async=is_async) -> None:
+            for _ in range(calls):
+                if is_async:
+                    await fn()
+                else:
+                    fn()
+
+        async def via_run(tool=tool) -> None:
+            for _ in range(calls):
+                await tool.run({})
+
+        baseline = best_time(lambda direct=direct: asyncio.run(direct()), repeat) / calls
+        run = best_time(lambda via_run=via_run: asyncio.run(via_run()), repeat) / calls
+        results[f"run_{label}_overhead_us"] = (run - baseline) * 1e6
+    return results
+
+
+def run(sizes: list[int], repeat: int, calls: int) -> dict[str, dict[str, float]]:
+    formats = [ToolFormat.NATIVE, ToolFormat.MCP, ToolFormat.OPENAI]
+    if importlib.util.find_spec("langchain_core") is not None:
+        formats.append(ToolFormat.LANGCHAIN)
+    results = {"run": bench_run_overhead(calls, repeat)}
+    for size in sizes:
+        results[str(size)] = bench_size(size, repeat, formats)
+    return results
+
+
+def print_results(results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]] | None = None) -> None:
+    for group, metrics in results.items():
+        print(f"{'Tool.run' if group == 'run' else f'{group} tools'}:")
+        for metric, value in metrics.items():
+            line = f"  {metric:<50}{value:>14,.2f}"
+            previous = (baseline or {}).get(group, {}).get(metric)
+            if previous:
+                line += f"{previous:>14,.2f}{value / previous - 1:>+9.1%}"
+            print(line)
+
+
+def find_regressions(
+    results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]], threshold: float
+) -> list[str]:
+    """Lists the metrics that are slower or larger than the baseline by more than `threshold`."""
+    regressions = []
+    for group, metrics in results.items():
+        for metric, value in metrics.items():
+            previous = baseline.get(group, {}).get(metric)
+            if previous and value > previous * (1 + threshold):
+                regressions.append(f"{group}/{metric}: {previous:,.2f} -> {value:,.2f} ({value / previous - 1:+.1%})")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="Tool counts to benchmark")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of timed passes; the best pass is reported")
+    parser.add_argument("--calls", type=int, default=5000, help="Tool.run calls per timed pass")
+    parser.add_argument("--save-baseline", type=Path, nargs="?", const=DEFAULT_BASELINE, help="Write results here")
+    parser.add_argument("--compare", type=Path, nargs="?", const=DEFAULT_BASELINE, help="Compare to this baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed relative regression when comparing")
+    options = parser.parse_args()
+
+    logger.remove()
+    logger.add(lambda message: None, level="INFO")
+    baseline = json.loads(options.compare.read_text())["results"] if options.compare else None
+
+    results = run(options.sizes, options.repeat, options.calls)
+    print_results(results, baseline)
+
+    if options.save_baseline:
+        options.save_baseline.parent.mkdir(parents=True, exist_ok=True)
+        document = {
+            "recorded_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": results,
+        }
+        options.save_baseline.write_text(json.dumps(document, indent=2) + "\n")
+        print(f"Saved baseline to {options.save_baseline}")
+
+    if baseline is not None:
+        regressions = find_regressions(results, baseline, options.threshold)
+        if regressions:
+            print(f"Regressions beyond {options.threshold:.0%}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print(f"No regressions beyond {options.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,388 @@
+"""End-to-end load test of a `LocalServer` against a local mock upstream API.
+
+Starts three kinds of processes:
+
+* a mock HTTP upstream answering `GET /items/{id}` after a configurable latency,
+  failing a configurable fraction of requests with a 500;
+* a `LocalServer` exposing a small API application whose tools call that
+  upstream, over streamable-http (one shared server) or stdio (one server
+  process per session, as stdio clients spawn their own server);
+* this driver, running N concurrent MCP client sessions that call a tool in a
+  loop for a fixed duration.
+
+It reports throughput, p50/p95/p99 latency, errors and the RSS of the server
+process(es) sampled over the run. RSS is read with psutil if it is installed,
+otherwise from /proc (Linux only).
+
+Tools: `get_item` (async, calls the upstream), `get_item_sync` (sync, calls
+the upstream on the event loop thread) and `noop` (no upstream call).
+
+Usage:
+    python benchmarks/load_test_server.py [--transport streamable-http] [--sessions 20] [--duration 30]
+        [--tool get_item] [--latency-ms 20] [--error-rate 0.01] [--json results.json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+APP_NAME = "loadtest"
+SERVER_MARKER = "--load-test-server"
+
+
+# --- Mock upstream ---
+
+
+def run_upstream(port: int, latency_ms: float, jitter_ms: float, error_rate: float) -> None:
+    import uvicorn
+    from starlette.applications import Starlette
+    from starlette.requests import Request
+    from starlette.responses import JSONResponse
+    from starlette.routing import Route
+
+    async def get_item(request: Request) -> JSONResponse:
+        delay = max(0.0, latency_ms + random.uniform(-jitter_ms, jitter_ms)) / 1000
+        if delay:
+            await asyncio.sleep(delay)
+        if random.random() < error_rate:
+            return JSONResponse({"error": "injected failure"}, status_code=500)
+        item_id = request.path_params["item_id"]
+        return JSONResponse({"id": item_id, "name": f"item {item_id}", "tags": ["load", "test"]})
+
+    async def health(request: Request) -> JSONResponse:
+        return JSONResponse({"status": "ok"})
+
+    app = Starlette(routes=[Route("/items/{item_id:int}", get_item), Route("/health", health)])
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+
+
+# --- MCP server under test ---
+
+
+def run_server(transport: str, port: int, upstream_url: str) -> None:
+    from loguru import logger
+
+    from universal_mcp.applications.application import APIApplication
+    from universal_mcp.config import ServerConfig
+    from universal_mcp.servers.server import LocalServer
+    from universal_mcp.tools.local_registry import LocalRegistry
+
+    # Tools are left without return annotations: the MCP server returns unstructured content, which clients
+    # reject as errors when the tool advertises an output schema.
+    class LoadTestApp(APIApplication):
+        def __init__(self, base_url: str):
+            super().__init__(name=APP_NAME)
+            self.base_url = base_url
+
+        async def get_item(self, item_id: int):
+            """Fetches an item from the upstream API.
+
+            Args:
+                item_id: The item ID.
+
+            Returns:
+                The item.
+
+            Tags:
+                important
+            """
+            return self._handle_response(await self._aget(f"/items/{item_id}"))
+
+        def get_item_sync(self, item_id: int):
+            """Fetches an item from the upstream API with a blocking client.
+
+            Args:
+                item_id: The item ID.
+
+            Returns:
+                The item.
+
+            Tags:
+                important
+            """
+            return self._handle_response(self._get(f"/items/{item_id}"))
+
+        def noop(self):
+            """Returns immediately without calling the upstream API.
+
+            Tags:
+                important
+            """
+            return "ok"
+
+        def list_tools(self):
+            return [self.get_item, self.get_item_sync, self.noop]
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+    config = ServerConfig(name="load-test", transport=transport, port=port, use_tool_catalog=False)
+    server = LocalServer(config, registry=LocalRegistry(output_dir=tempfile.mkdtemp()), log_level="WARNING")
+    server.tool_manager.register_tools_from_app(LoadTestApp(upstream_url))
+    server.run(transport=transport)
+
+
+# --- Driver ---
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def spawn(*args: str) -> subprocess.Popen:
+    return subprocess.Popen([sys.executable, __file__, *args], env={**os.environ, "PYTHONUNBUFFERED": "1"})
+
+
+async def wait_until_ready(url: str, process: subprocess.Popen, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                raise RuntimeError(f"Process serving {url} exited with status {process.returncode}")
+            try:
+                await client.get(url)
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.1)
+    raise TimeoutError(f"{url} did not become ready within {timeout}s")
+
+
+def server_pids(http_server: subprocess.Popen | None) -> list[int]:
+    """PIDs of the MCP server processes under test."""
+    if http_server is not None:
+        return [http_server.pid]
+    pids = []
+    for entry in Path("/proc").glob("[0-9]*"):
+        try:
+            if SERVER_MARKER in (entry / "cmdline").read_bytes().decode(errors="replace"):
+                pids.append(int(entry.name))
+        except OSError:
+            continue
+    return pids
+
+
+def rss_bytes(pid: int) -> int | None:
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+    try:
+        if psutil is not None:
+            return psutil.Process(pid).memory_info().rss
+        for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+    except Exception:
+        return None
+    return None
+
+
+@asynccontextmanager
+async def open_session(options: argparse.Namespace, server_url: str, upstream_url: str) -> AsyncIterator[Any]:
+    from mcp import ClientSession, StdioServerParameters
+    from mcp.client.stdio import stdio_client
+    from mcp.client.streamable_http import streamablehttp_client
+
+    if options.transport == "stdio":
+        params = StdioServerParameters(
+            command=sys.executable,
+            args=[__file__, "serve", SERVER_MARKER, "--transport", "stdio", "--upstream-url", upstream_url],
+            env=dict(os.environ),
+        )
+        async with stdio_client(params) as (read, write), ClientSession(read, write) as session:
+            await session.initialize()
+            yield session
+    else:
+        async with streamablehttp_client(server_url) as (read, write, _), ClientSession(read, write) as session:
+            await session.initialize()
+            yield session
+
+
+class LoadRun:
+    """Shared state of the sessions: when to start and stop, and what they measured."""
+
+    def __init__(self):
+        self.started = asyncio.Event()
+        self.stop_at = float("inf")
+        self.latencies: list[float] = []
+        self.errors = 0
+        self.rss: list[tuple[float, int]] = []
+
+
+async def run_session(
+    options: argparse.Namespace, server_url: str, upstream_url: str, run: LoadRun, connected: asyncio.Event
+) -> None:
+    tool_name = f"{APP_NAME}__{options.tool}"
+    async with open_session(options, server_url, upstream_url) as session:
+        connected.set()
+        await run.started.wait()
+        while time.monotonic() < run.stop_at:
+            arguments = {} if options.tool == "noop" else {"item_id": random.randint(1, 1000)}
+            begin = time.perf_counter()
+            try:
+                result = await session.call_tool(tool_name, arguments)
+                failed = result.isError
+            except Exception:
+                failed = True
+            run.latencies.append(time.perf_counter() - begin)
+            run.errors += failed
+
+
+async def sample_rss(http_server: subprocess.Popen | None, run: LoadRun, interval: float, origin: float) -> None:
+    while True:
+        sizes = [size for pid in server_pids(http_server) if (size := rss_bytes(pid)) is not None]
+        if sizes:
+            run.rss.append((time.monotonic() - origin, sum(sizes)))
+        if time.monotonic() >= run.stop_at:
+            return
+        await asyncio.sleep(min(interval, max(0.0, run.stop_at - time.monotonic())))
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def report(options: argparse.Namespace, run: LoadRun, elapsed: float) -> dict[str, Any]:
+    calls = len(run.latencies)
+    summary = {
+        "transport": options.transport,
+        "tool": options.tool,
+        "sessions": options.sessions,
+        "duration_s": round(elapsed, 3),
+        "upstream_latency_ms": options.latency_ms,
+        "upstream_error_rate": options.error_rate,
+        "calls": calls,
+        "errors": run.errors,
+        "throughput_per_s": calls / elapsed if elapsed else 0.0,
+        "latency_ms": {
+            name: percentile(run.latencies, fraction) * 1000 if calls else None
+            for name, fraction in (("p50", 0.50), ("p95", 0.95), ("p99", 0.99))
+        },
+        "rss_mib": [(round(at, 2), round(size / 2**20, 1)) for at, size in run.rss],
+    }
+    print(f"{options.transport}, {options.sessions} sessions calling {options.tool} for {elapsed:.1f}s")
+    print(f"  calls:      {calls} ({run.errors} errors)")
+    print(f"  throughput: {summary['throughput_per_s']:,.1f} calls/s")
+    if calls:
+        latency = summary["latency_ms"]
+        print(f"  latency:    p50 {latency['p50']:.2f} ms, p95 {latency['p95']:.2f} ms, p99 {latency['p99']:.2f} ms")
+    if summary["rss_mib"]:
+        print("  server RSS (MiB) over time:")
+        for at, size in summary["rss_mib"]:
+            print(f"    {at:>7.1f}s {size:>9.1f}")
+    else:
+        print("  server RSS: unavailable (install psutil on non-Linux platforms)")
+    return summary
+
+
+async def drive(options: argparse.Namespace) -> dict[str, Any]:
+    upstream_port = free_port()
+    upstream_url = f"http://127.0.0.1:{upstream_port}"
+    processes = [
+        spawn(
+            "upstream",
+            "--port",
+            str(upstream_port),
+            "--latency-ms",
+            str(options.latency_ms),
+            "--jitter-ms",
+            str(options.jitter_ms),
+            "--error-rate",
+            str(options.error_rate),
+        )
+    ]
+    http_server = None
+    server_url = ""
+    try:
+        await wait_until_ready(f"{upstream_url}/health", processes[0])
+        if options.transport == "streamable-http":
+            server_port = free_port()
+            server_url = f"http://127.0.0.1:{server_port}/mcp"
+            http_server = spawn(
+                "serve", SERVER_MARKER, "--transport", options.transport, "--port", str(server_port),
+                "--upstream-url", upstream_url,
+            )  # fmt: skip
+            processes.append(http_server)
+            await wait_until_ready(f"http://127.0.0.1:{server_port}/metrics", http_server)
+
+        # Sessions connect first so that connection setup is not measured, then all start together.
+        run = LoadRun()
+        connected = [asyncio.Event() for _ in range(options.sessions)]
+        tasks = [asyncio.create_task(run_session(options, server_url, upstream_url, run, event)) for event in connected]
+        waiting = asyncio.gather(*(event.wait() for event in connected))
+        done, _ = await asyncio.wait([waiting, *tasks], timeout=options.connect_timeout, return_when="FIRST_COMPLETED")
+        if waiting not in done:
+            for task in tasks:
+                task.cancel()
+            waiting.cancel()
+            failed = [task for task in tasks if task in done]
+            raise RuntimeError(f"Sessions failed to connect: {failed[0].exception() if failed else 'timed out'}")
+
+        origin = time.monotonic()
+        run.stop_at = origin + options.duration
+        run.started.set()
+        sampler = asyncio.create_task(sample_rss(http_server, run, options.sample_interval, origin))
+        await asyncio.gather(*tasks)
+        elapsed = time.monotonic() - origin
+        await sampler
+        return report(options, run, elapsed)
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command")
+    upstream = subparsers.add_parser("upstream", help="Run only the mock upstream API")
+    upstream.add_argument("--port", type=int, required=True)
+    serve = subparsers.add_parser("serve", help="Run only the MCP server under test")
+    serve.add_argument(SERVER_MARKER, action="store_true", help=argparse.SUPPRESS)
+    serve.add_argument("--transport", choices=["stdio", "streamable-http"], default="stdio")
+    serve.add_argument("--port", type=int, default=8005)
+    serve.add_argument("--upstream-url", required=True)
+    for command in (parser, upstream):
+        command.add_argument("--latency-ms", type=float, default=20.0, help="Upstream response latency")
+        command.add_argument("--jitter-ms", type=float, default=5.0, help="Random +/- variation of the latency")
+        command.add_argument("--error-rate", type=float, default=0.01, help="Fraction of upstream requests failing")
+    parser.add_argument("--transport", choices=["stdio", "streamable-http"], default="streamable-http")
+    parser.add_argument("--sessions", type=int, default=20, help="Concurrent MCP client sessions")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds of load after all sessions connected")
+    parser.add_argument("--tool", choices=["get_item", "get_item_sync", "noop"], default="get_item")
+    parser.add_argument("--sample-interval", type=float, default=1.0, help="Seconds between RSS samples")
+    parser.add_argument("--connect-timeout", type=float, default=60.0, help="Seconds allowed for sessions to connect")
+    parser.add_argument("--json", type=Path, help="Also write the results to this file")
+    options = parser.parse_args()
+
+    if options.command == "upstream":
+        run_upstream(options.port, options.latency_ms, options.jitter_ms, options.error_rate)
+    elif options.command == "serve":
+        run_server(options.transport, options.port, options.upstream_url)
+    else:
+        summary = asyncio.run(drive(options))
+        if options.json:
+            options.json.write_text(json.dumps(summary, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,15 @@
 import os
 
+import pytest
+
 os.environ["TELEMETRY_DISABLED"] = "true"
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dirs(tmp_path, monkeypatch):
+    """Keep tool catalogs and tool lists written during tests out of the user's cache directory."""
+    from universal_mcp.client import tool_cache
+    from universal_mcp.tools import catalog
+
+    monkeypatch.setattr(catalog, "get_default_catalog_dir", lambda: tmp_path / "tool_catalog")
+    monkeypatch.setattr(tool_cache, "get_default_tool_list_cache_dir", lambda: tmp_path / "tool_lists")
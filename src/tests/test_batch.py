@@ -0,0 +1,37 @@
+import asyncio
+
+import pytest
+
+from universal_mcp.tools.batch import run_tool_batch
+
+
+@pytest.mark.asyncio
+async def test_run_tool_batch_respects_group_limits():
+    running: dict[str, int] = {}
+    peak: dict[str, int] = {}
+    peak_total = 0
+
+    async def call(tool_name: str, arguments: dict) -> int:
+        nonlocal peak_total
+        group = tool_name.split("__")[0]
+        running[group] = running.get(group, 0) + 1
+        peak[group] = max(peak.get(group, 0), running[group])
+        peak_total = max(peak_total, sum(running.values()))
+        await asyncio.sleep(0.01)
+        running[group] -= 1
+        return arguments["n"]
+
+    batch = [(f"{app}__tool", {"n": i}) for i, app in enumerate(["a", "b"] * 6)]
+    results = await run_tool_batch(
+        batch, call, group_key=lambda name: name.split("__")[0], max_concurrency=3, max_concurrency_per_group=2
+    )
+
+    assert [r.result for r in results] == list(range(12))
+    assert max(peak.values()) <= 2
+    assert peak_total <= 3
+
+
+@pytest.mark.asyncio
+async def test_run_tool_batch_rejects_invalid_limits():
+    with pytest.raises(ValueError):
+        await run_tool_batch([], lambda name, args: None, group_key=str, max_concurrency=0)
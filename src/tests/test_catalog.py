@@ -0,0 +1,157 @@
+from types import SimpleNamespace
+
+import pytest
+
+from universal_mcp.applications.sample.app import SampleApp
+from universal_mcp.config import AppConfig, ServerConfig
+from universal_mcp.servers.server import LocalServer
+from universal_mcp.tools import catalog as catalog_module
+from universal_mcp.tools import registry as registry_module
+from universal_mcp.tools.adapters import convert_tools
+from universal_mcp.tools.catalog import (
+    CachedTool,
+    ToolCatalog,
+    build_app_manifest,
+    load_app_manifest,
+    write_app_manifest,
+)
+from universal_mcp.tools.local_registry import LocalRegistry
+from universal_mcp.types import ToolFormat
+
+
+def _make_server(tmp_path, actions=None) -> LocalServer:
+    config = ServerConfig(
+        apps=[AppConfig(name="sample", actions=actions)], use_tool_catalog=True, tool_catalog_dir=tmp_path
+    )
+    return LocalServer(config, registry=LocalRegistry())
+
+
+@pytest.mark.asyncio
+async def test_catalog_is_written_on_first_boot(tmp_path):
+    server = _make_server(tmp_path, actions=["calculate", "get_current_date"])
+
+    assert not any(isinstance(tool, CachedTool) for tool in server.tool_manager.get_tools())
+    catalog = ToolCatalog.for_tool_config({"sample": ["calculate", "get_current_date"]}, tmp_path)
+    entries = catalog.get_app_tools("sample", ["calculate", "get_current_date"])
+    assert {entry["tool_name"] for entry in entries} == {"calculate", "get_current_date"}
+
+
+@pytest.mark.asyncio
+async def test_catalog_serves_tools_and_binds_on_first_call(tmp_path):
+    first = _make_server(tmp_path, actions=["calculate"])
+    second = _make_server(tmp_path, actions=["calculate"])
+
+    tools = second.tool_manager.get_tools()
+    assert len(tools) == 1
+    cached = tools[0]
+    assert isinstance(cached, CachedTool)
+    assert not cached.is_bound
+    assert second.registry._app_instances == {}
+
+    first_listing = await first.list_tools()
+    second_listing = await second.list_tools()
+    assert [tool.model_dump() for tool in second_listing] == [tool.model_dump() for tool in first_listing]
+
+    result = await second.call_tool("sample__calculate", {"expression": "2 * 21"})
+    assert result[0].text == "Result: 42"
+    assert cached.is_bound
+    assert "sample" in second.registry._app_instances
+
+
+@pytest.mark.asyncio
+async def test_catalog_entry_is_invalidated_when_sources_change(tmp_path, monkeypatch):
+    _make_server(tmp_path, actions=["calculate"])
+    monkeypatch.setattr(catalog_module, "get_app_source_hash", lambda slug: "changed")
+
+    server = _make_server(tmp_path, actions=["calculate"])
+    assert not any(isinstance(tool, CachedTool) for tool in server.tool_manager.get_tools())
+
+
+@pytest.mark.asyncio
+async def test_catalog_is_ignored_for_other_package_versions(tmp_path, monkeypatch):
+    _make_server(tmp_path, actions=["calculate"])
+    monkeypatch.setattr(catalog_module, "get_package_versions", lambda: {"universal-mcp": "0.0.0"})
+
+    server = _make_server(tmp_path, actions=["calculate"])
+    assert not any(isinstance(tool, CachedTool) for tool in server.tool_manager.get_tools())
+
+
+@pytest.mark.asyncio
+async def test_catalog_is_ignored_when_universal_mcp_sources_change(tmp_path, monkeypatch):
+    _make_server(tmp_path, actions=["calculate"])
+    monkeypatch.setattr(catalog_module, "get_universal_mcp_source_hash", lambda: "changed")
+
+    server = _make_server(tmp_path, actions=["calculate"])
+    assert not any(isinstance(tool, CachedTool) for tool in server.tool_manager.get_tools())
+
+
+def test_catalog_is_opt_in(tmp_path, monkeypatch):
+    monkeypatch.setattr(catalog_module, "get_default_catalog_dir", lambda: tmp_path)
+    LocalServer(ServerConfig(apps=[AppConfig(name="sample", actions=["calculate"])]), registry=LocalRegistry())
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_manifest_registers_tools_without_loading_app(tmp_path, monkeypatch):
+    manifest = build_app_manifest(SampleApp())
+    monkeypatch.setattr(registry_module, "load_app_manifest", lambda slug: manifest)
+
+    server = _make_server(tmp_path, actions=["calculate", "get_current_date"])
+    tools = server.tool_manager.get_tools()
+    assert {tool.name for tool in tools} == {"sample__calculate", "sample__get_current_date"}
+    assert all(isinstance(tool, CachedTool) and "sample" in tool.tags for tool in tools)
+    assert server.registry._app_instances == {}
+
+    result = await server.call_tool("sample__calculate", {"expression": "3 + 4"})
+    assert result[0].text == "Result: 7"
+    assert isinstance(server.registry._app_instances["sample"], SampleApp)
+
+
+@pytest.mark.asyncio
+async def test_manifest_tools_export_to_native_and_langchain(tmp_path, monkeypatch):
+    manifest = build_app_manifest(SampleApp())
+    monkeypatch.setattr(registry_module, "load_app_manifest", lambda slug: manifest)
+    server = _make_server(tmp_path, actions=["calculate"])
+
+    native = convert_tools(server.tool_manager.get_tools(), ToolFormat.NATIVE)
+    langchain = convert_tools(server.tool_manager.get_tools(), ToolFormat.LANGCHAIN)
+    assert server.registry._app_instances == {}
+
+    assert native[0].__name__ == "sample__calculate"
+    assert native[0].__doc__.startswith("Safely evaluate a mathematical expression.")
+    assert "expression: The mathematical expression to evaluate." in native[0].__doc__
+    assert langchain[0].description == native[0].__doc__
+    assert native[0](expression="6 * 7") == "Result: 42"
+    assert await langchain[0].ainvoke({"expression": "1 + 1"}) == "Result: 2"
+
+
+def test_manifest_is_only_used_with_the_tool_catalog(monkeypatch):
+    manifest = build_app_manifest(SampleApp())
+    monkeypatch.setattr(registry_module, "load_app_manifest", lambda slug: manifest)
+
+    server = LocalServer(ServerConfig(apps=[AppConfig(name="sample", actions=["calculate"])]), registry=LocalRegistry())
+    assert not any(isinstance(tool, CachedTool) for tool in server.tool_manager.get_tools())
+    assert "sample" in server.registry._app_instances
+
+
+def test_manifest_default_selection_uses_important_tag(tmp_path, monkeypatch):
+    manifest = build_app_manifest(SampleApp())
+    monkeypatch.setattr(registry_module, "load_app_manifest", lambda slug: manifest)
+
+    server = _make_server(tmp_path)
+    tool_names = {tool.name for tool in server.tool_manager.get_tools()}
+    assert "sample__calculate" in tool_names
+    assert "sample__get_simple_weather" not in tool_names
+
+
+def test_write_and_load_app_manifest(tmp_path, monkeypatch):
+    path = write_app_manifest(SampleApp(), tmp_path)
+    spec = SimpleNamespace(submodule_search_locations=[str(tmp_path)])
+    monkeypatch.setattr(catalog_module, "_find_app_spec", lambda slug: spec)
+
+    entries = load_app_manifest("sample")
+    assert path.parent == tmp_path
+    assert {entry["tool_name"] for entry in entries} >= {"calculate", "get_current_date"}
+
+    (tmp_path / "app.py").write_text("class SampleApp: ...\n")
+    assert load_app_manifest("sample") is None
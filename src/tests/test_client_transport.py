@@ -0,0 +1,423 @@
+import asyncio
+import json
+
+import pytest
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED, CallToolResult, ErrorData, ListToolsResult, TextContent, ToolAnnotations
+from mcp.types import Tool as MCPTool
+
+from universal_mcp.client import transport as transport_module
+from universal_mcp.client.tool_cache import ToolListCache
+from universal_mcp.client.transport import ClientTransport, MultiClientTransport
+from universal_mcp.config import ClientConfig, ClientTransportConfig
+
+
+def _tool(name: str, description: str = "", read_only: bool = False) -> MCPTool:
+    return MCPTool(
+        name=name,
+        description=description,
+        inputSchema={"type": "object", "properties": {}},
+        annotations=ToolAnnotations(readOnlyHint=True) if read_only else None,
+    )
+
+
+class FakeServer:
+    """An MCP server reached through `FakeSession`s, one per connection."""
+
+    def __init__(self, name: str, tools: list[MCPTool]):
+        self.name = name
+        self.tools = tools
+        self.refuse = False
+        self.hang = False
+        self.list_delay = 0.0
+        self.connects = 0
+        self.lists = 0
+        self.calls: list[tuple[str, dict]] = []
+        self.sessions: list[FakeSession] = []
+
+
+class FakeSession:
+    def __init__(self, server: FakeServer):
+        self.server = server
+        self.dropped = False
+
+    def _check(self) -> None:
+        if self.dropped:
+            raise McpError(ErrorData(code=CONNECTION_CLOSED, message="Connection closed"))
+
+    async def list_tools(self) -> ListToolsResult:
+        self._check()
+        self.server.lists += 1
+        await asyncio.sleep(self.server.list_delay)
+        return ListToolsResult(tools=list(self.server.tools))
+
+    async def call_tool(self, name: str, arguments: dict, meta: dict | None = None) -> CallToolResult:
+        self._check()
+        self.server.calls.append((name, arguments))
+        if name == "fail":
+            raise RuntimeError("tool crashed")
+        return CallToolResult(content=[TextContent(type="text", text=f"{name} on {self.server.name}")])
+
+    async def send_ping(self) -> None:
+        self._check()
+
+
+@pytest.fixture
+def servers(monkeypatch) -> dict[str, FakeServer]:
+    """Routes every ClientTransport to the FakeServer registered under its name."""
+    fake_servers: dict[str, FakeServer] = {}
+
+    async def initialize(self: ClientTransport, exit_stack) -> None:
+        server = fake_servers[self.name]
+        server.connects += 1
+        if server.refuse:
+            raise ConnectionError(f"{server.name} refused the connection")
+        if server.hang:
+            # Never answers `initialize`.
+            await asyncio.Event().wait()
+        session = FakeSession(server)
+        server.sessions.append(session)
+        self.session = session
+
+    monkeypatch.setattr(ClientTransport, "initialize", initialize)
+    monkeypatch.setattr(transport_module, "RECONNECT_INITIAL_BACKOFF", 0.01)
+    return fake_servers
+
+
+def _add(servers: dict[str, FakeServer], name: str, *tools: MCPTool, remote: bool = False) -> ClientTransportConfig:
+    servers[name] = FakeServer(name, list(tools))
+    if remote:
+        return ClientTransportConfig(url=f"https://{name}.example.com/mcp")
+    return ClientTransportConfig(command=name)
+
+
+async def _until(condition, timeout: float = 2.0) -> None:
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.01)
+
+
+def test_client_transport_config_infers_transport(tmp_path):
+    assert ClientTransportConfig(command="server").transport == "stdio"
+    assert ClientTransportConfig(url="https://example.com/sse").transport == "sse"
+    assert ClientTransportConfig(url="https://example.com/mcp").transport == "streamable_http"
+    assert ClientTransportConfig(url="https://example.com/sse", transport="streamable_http").transport == (
+        "streamable_http"
+    )
+    assert ClientTransportConfig(command="server").get("url", "none") == "none"
+    with pytest.raises(ValueError):
+        ClientTransportConfig()
+
+    path = tmp_path / "servers.json"
+    path.write_text(json.dumps({"mcpServers": {"local": {"command": "server", "args": ["--stdio"]}}}))
+    config = ClientConfig.load_json_config(str(path))
+    assert config.mcpServers["local"].args == ["--stdio"]
+    config.save_json_config(str(path))
+    assert ClientConfig.load_json_config(str(path)) == config
+
+
+@pytest.mark.asyncio
+async def test_client_reconnects_with_backoff_after_failed_health_check(servers):
+    config = _add(servers, "alpha", _tool("search"))
+    client = ClientTransport("alpha", config, health_check_interval=0.01)
+    changed = asyncio.Event()
+
+    async def on_tools_changed(_client: ClientTransport) -> None:
+        changed.set()
+
+    client.on_tools_changed = on_tools_changed
+    await client.connect()
+    try:
+        servers["alpha"].refuse = True
+        servers["alpha"].sessions[0].dropped = True
+        await _until(lambda: servers["alpha"].connects >= 3)
+        assert not client.is_connected
+
+        servers["alpha"].refuse = False
+        await asyncio.wait_for(changed.wait(), 2)
+        assert client.is_connected
+        assert [tool.name for tool in await client.list_tools()] == ["search"]
+    finally:
+        await client.close()
+    assert not client.is_connected
+
+
+@pytest.mark.asyncio
+async def test_client_connect_failure_is_raised(servers):
+    config = _add(servers, "alpha")
+    servers["alpha"].refuse = True
+    client = ClientTransport("alpha", config)
+
+    with pytest.raises(ConnectionError):
+        await client.connect()
+    assert servers["alpha"].connects == 1
+    assert await client.list_tools() == []
+
+
+@pytest.mark.asyncio
+async def test_read_only_tools_are_retried_after_reconnect(servers):
+    config = _add(servers, "alpha", _tool("read", read_only=True), _tool("write"))
+    client = ClientTransport("alpha", config, health_check_interval=None)
+    await client.connect()
+    try:
+        await client.fetch_tools()
+
+        servers["alpha"].sessions[-1].dropped = True
+        result = await client.call_tool("read", {})
+        assert not result.isError
+        assert servers["alpha"].connects == 2
+
+        servers["alpha"].sessions[-1].dropped = True
+        result = await client.call_tool("write", {})
+        assert result.isError
+        assert servers["alpha"].calls == [("read", {})]
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_hung_server_is_bounded_by_connect_timeout(servers):
+    clients = {
+        "hung": _add(servers, "hung", _tool("never")),
+        "alpha": _add(servers, "alpha", _tool("search")),
+        "stuck": _add(servers, "stuck", _tool("never")),
+        "beta": _add(servers, "beta", _tool("fetch")),
+    }
+    servers["hung"].hang = servers["stuck"].hang = True
+
+    # Connecting one server after the other would take twice the connect timeout.
+    async with asyncio.timeout(0.5):
+        async with MultiClientTransport(clients, connect_timeout=0.3, use_tool_cache=False) as multi:
+            assert [tool.name for tool in await multi.list_tools()] == ["search", "fetch"]
+            assert [client.is_connected for client in multi.clients] == [False, True, False, True]
+            assert not (await multi.call_tool("search", {})).isError
+    assert servers["hung"].connects == servers["stuck"].connects == 1
+
+
+@pytest.mark.asyncio
+async def test_multi_client_reconnects_a_server_dropped_mid_session(servers):
+    clients = {"alpha": _add(servers, "alpha", _tool("search")), "beta": _add(servers, "beta", _tool("fetch"))}
+
+    async with MultiClientTransport(clients, use_tool_cache=False) as multi:
+        servers["alpha"].refuse = True
+        servers["alpha"].sessions[0].dropped = True
+        assert (await multi.call_tool("search", {})).isError
+        assert not (await multi.call_tool("fetch", {})).isError
+
+        await _until(lambda: servers["alpha"].connects >= 3)
+        servers["alpha"].refuse = False
+        await _until(lambda: multi.clients[0].is_connected)
+        assert not (await multi.call_tool("search", {})).isError
+        assert [tool.name for tool in await multi.list_tools()] == ["search", "fetch"]
+
+
+@pytest.mark.asyncio
+async def test_multi_client_maps_tools_and_balances_replicas(servers):
+    clients = {
+        "alpha": _add(servers, "alpha", _tool("search"), _tool("shared", "alpha's")),
+        "beta": _add(servers, "beta", _tool("search"), _tool("shared", "beta's")),
+        "gamma": _add(servers, "gamma", _tool("other")),
+    }
+    servers["gamma"].refuse = True
+
+    async with MultiClientTransport(clients, balancing="round_robin") as multi:
+        assert [tool.name for tool in await multi.list_tools()] == ["search", "shared"]
+        assert (await multi.list_tools())[1].description == "alpha's"
+        assert set(multi.replica_stats()["search"]) == {"alpha", "beta"}
+        assert set(multi.replica_stats()["shared"]) == {"alpha"}
+
+        for _ in range(4):
+            await multi.call_tool("search", {})
+        assert len(servers["alpha"].calls) == len(servers["beta"].calls) == 2
+
+        missing = await multi.call_tool("other", {})
+        assert missing.isError
+    assert multi.clients == []
+
+
+@pytest.mark.asyncio
+async def test_multi_client_updates_tool_mapping_incrementally(servers, tmp_path):
+    clients = {"alpha": _add(servers, "alpha", _tool("search", "alpha's"))}
+
+    async with MultiClientTransport(clients, use_tool_cache=False) as multi:
+        await multi.add_client("beta", _add(servers, "beta", _tool("search", "beta's"), _tool("fetch")))
+        assert [tool.name for tool in await multi.list_tools()] == ["search", "fetch"]
+        assert servers["alpha"].sessions[0] is servers["alpha"].sessions[-1]
+
+        await multi.remove_client("alpha")
+        tools = await multi.list_tools()
+        assert [(tool.name, tool.description) for tool in tools] == [("search", "beta's"), ("fetch", "")]
+
+        servers["beta"].tools.append(_tool("store"))
+        await multi._get_client("beta").on_tools_changed(multi._get_client("beta"))
+        assert [tool.name for tool in await multi.list_tools()] == ["search", "fetch", "store"]
+
+        multi.save_to_file(str(tmp_path / "servers.json"))
+        assert list(ClientConfig.load_json_config(str(tmp_path / "servers.json")).mcpServers) == ["beta"]
+
+
+@pytest.mark.asyncio
+async def test_adding_and_removing_clients_does_not_relist_the_others(servers):
+    clients = {"alpha": _add(servers, "alpha", _tool("search", "alpha's"), _tool("fetch"))}
+
+    async with MultiClientTransport(clients, use_tool_cache=False) as multi:
+        await multi.add_client("beta", _add(servers, "beta", _tool("search", "beta's"), _tool("fetch")))
+        await multi.add_client("gamma", _add(servers, "gamma", _tool("store")))
+        assert servers["alpha"].lists == 1
+        assert set(multi.replica_stats()["fetch"]) == {"alpha", "beta"}
+
+        await multi.remove_client("alpha")
+        assert servers["beta"].lists == servers["gamma"].lists == 1
+        assert [(tool.name, tool.description) for tool in await multi.list_tools()] == [
+            ("search", "beta's"),
+            ("fetch", ""),
+            ("store", ""),
+        ]
+        assert set(multi.replica_stats()["fetch"]) == {"beta"}
+        assert multi.tool_to_client["search"].name == "beta"
+
+
+@pytest.mark.asyncio
+async def test_multi_client_caches_converted_tool_lists(servers):
+    clients = {"alpha": _add(servers, "alpha", _tool("search", "Search things"))}
+
+    async with MultiClientTransport(clients, use_tool_cache=False) as multi:
+        openai_tools = await multi.list_tools("openai")
+        assert openai_tools[0]["function"] is (await multi.list_tools("openai"))[0]["function"]
+        tools_json = await multi.list_tools_json("openai")
+        assert await multi.list_tools_json("openai") is tools_json
+        assert json.loads(tools_json)[0]["function"]["name"] == "search"
+        assert json.loads(await multi.list_tools_json())[0]["name"] == "search"
+
+        servers["alpha"].tools.append(_tool("fetch"))
+        await multi._refresh_client_tools(multi.clients[0])
+        assert [tool["function"].name for tool in await multi.list_tools("openai")] == ["search", "fetch"]
+        assert len(json.loads(await multi.list_tools_json("openai"))) == 2
+
+        with pytest.raises(ValueError):
+            await multi.list_tools("langchain")
+
+
+@pytest.mark.asyncio
+async def test_converted_tool_lists_follow_client_changes(servers):
+    clients = {"alpha": _add(servers, "alpha", _tool("search"))}
+
+    async with MultiClientTransport(clients, use_tool_cache=False) as multi:
+        (await multi.list_tools("openai")).clear()
+        assert len(await multi.list_tools("openai")) == 1
+        assert len(json.loads(await multi.list_tools_json())) == 1
+
+        await multi.add_client("beta", _add(servers, "beta", _tool("fetch")))
+        assert [tool["function"].name for tool in await multi.list_tools("openai")] == ["search", "fetch"]
+        assert [tool["name"] for tool in json.loads(await multi.list_tools_json())] == ["search", "fetch"]
+
+        await multi.remove_client("alpha")
+        assert [tool["function"].name for tool in await multi.list_tools("openai")] == ["fetch"]
+        assert [tool["function"]["name"] for tool in json.loads(await multi.list_tools_json("openai"))] == ["fetch"]
+
+
+@pytest.mark.asyncio
+async def test_multi_client_starts_from_cached_tool_list_and_revalidates(servers, tmp_path):
+    clients = {"alpha": _add(servers, "alpha", _tool("search"), remote=True), "local": _add(servers, "local")}
+    ToolListCache(tmp_path).set("alpha", clients["alpha"], [_tool("stale")])
+    ToolListCache(tmp_path).set("local", clients["local"], [_tool("stale_local")])
+
+    async with MultiClientTransport(clients, use_tool_cache=True, tool_cache_dir=tmp_path) as multi:
+        assert [tool.name for tool in await multi.list_tools()] == ["stale"]
+        await _until(lambda: [tool.name for tool in multi._mcp_tools] == ["search"])
+    assert ToolListCache(tmp_path).get("alpha", clients["alpha"]) == [_tool("search")]
+    # Local servers are always listed, and their cached list is left alone.
+    assert servers["local"].lists == 1
+    assert ToolListCache(tmp_path).get("local", clients["local"]) == [_tool("stale_local")]
+
+
+@pytest.mark.asyncio
+async def test_tool_list_cache_is_off_by_default(servers, tmp_path):
+    clients = {"alpha": _add(servers, "alpha", _tool("search"), remote=True)}
+
+    async with MultiClientTransport(clients) as multi:
+        assert [tool.name for tool in await multi.list_tools()] == ["search"]
+    assert multi.tool_cache is None
+    assert not (tmp_path / "tool_lists").exists()
+
+
+@pytest.mark.asyncio
+async def test_revalidated_tool_list_is_not_overwritten_by_slow_clients(servers, tmp_path):
+    clients = {
+        "alpha": _add(servers, "alpha", _tool("search"), remote=True),
+        "beta": _add(servers, "beta", _tool("fetch"), remote=True),
+    }
+    servers["beta"].list_delay = 0.2
+    ToolListCache(tmp_path).set("alpha", clients["alpha"], [_tool("stale")])
+
+    async with MultiClientTransport(clients, use_tool_cache=True, tool_cache_dir=tmp_path) as multi:
+        await _until(lambda: not multi._background_tasks)
+        assert [tool.name for tool in await multi.list_tools()] == ["search", "fetch"]
+
+        gamma = _add(servers, "gamma", _tool("other"), remote=True)
+        ToolListCache(tmp_path).set("gamma", gamma, [_tool("stale_other")])
+        await multi.add_client("gamma", gamma)
+        await _until(lambda: not multi._background_tasks)
+        assert [tool.name for tool in await multi.list_tools()] == ["search", "fetch", "other"]
+
+
+@pytest.mark.asyncio
+async def test_multi_client_result_cache_reuses_read_only_results(servers):
+    clients = {"alpha": _add(servers, "alpha", _tool("read", read_only=True), _tool("write"))}
+
+    async with MultiClientTransport(clients, use_tool_cache=False, result_cache_ttl=60) as multi:
+        first = await multi.call_tool("read", {"id": 1})
+        second = await multi.call_tool("read", {"id": 1})
+        await multi.call_tool("write", {})
+        await multi.call_tool("write", {})
+
+        assert second == first
+        assert servers["alpha"].calls == [("read", {"id": 1}), ("write", {}), ("write", {})]
+        assert multi.result_cache_stats()["hits"] == 1
+
+        servers["alpha"].tools.append(_tool("fetch"))
+        await multi._refresh_client_tools(multi.clients[0])
+        await multi.call_tool("read", {"id": 1})
+        assert len(servers["alpha"].calls) == 4
+
+    assert MultiClientTransport({}, use_tool_cache=False).result_cache_stats() is None
+
+
+@pytest.mark.asyncio
+async def test_multi_client_call_tools_runs_a_batch(servers):
+    clients = {"alpha": _add(servers, "alpha", _tool("search"), _tool("fail"))}
+
+    async with MultiClientTransport(clients, use_tool_cache=False) as multi:
+        results = await multi.call_tools([("search", {"q": "a"}), ("missing", {}), ("fail", {}), ("search", {})])
+
+    assert [result.tool_name for result in results] == ["search", "missing", "fail", "search"]
+    assert all(result.ok for result in results)
+    assert [result.result.isError for result in results] == [False, True, True, False]
+    assert results[0].result.content[0].text == "search on alpha"
+
+
+@pytest.mark.asyncio
+async def test_multi_client_call_tools_groups_calls_by_replica(servers):
+    clients = {"alpha": _add(servers, "alpha", _tool("search")), "beta": _add(servers, "beta", _tool("search"))}
+    running: dict[str, int] = {"alpha": 0, "beta": 0}
+    peak: dict[str, int] = {"alpha": 0, "beta": 0}
+
+    async with MultiClientTransport(clients) as multi:
+        for client in multi.clients:
+            call_tool = client.call_tool
+
+            async def tracked_call(tool_name, arguments, name=client.name, call_tool=call_tool):
+                running[name] += 1
+                peak[name] = max(peak[name], running[name])
+                await asyncio.sleep(0.01)
+                try:
+                    return await call_tool(tool_name, arguments)
+                finally:
+                    running[name] -= 1
+
+            client.call_tool = tracked_call
+        results = await multi.call_tools([("search", {"n": n}) for n in range(8)], max_concurrency_per_server=2)
+
+    assert [result.result.content[0].text for result in results] == ["search on alpha", "search on beta"] * 4
+    assert len(servers["alpha"].calls) == len(servers["beta"].calls) == 4
+    assert peak == {"alpha": 2, "beta": 2}
@@ -0,0 +1,152 @@
+import pytest
+
+from universal_mcp.applications.application import BaseApplication
+from universal_mcp.config import AppConfig, ServerConfig
+from universal_mcp.exceptions import ToolError
+from universal_mcp.servers.server import LocalServer
+from universal_mcp.tools.adapters import convert_tool_to_mcp_tool, convert_tool_to_openai_tool
+from universal_mcp.tools.catalog import serialize_tool
+from universal_mcp.tools.compact import CompactTool
+from universal_mcp.tools.local_registry import LocalRegistry
+from universal_mcp.tools.manager import ToolManager
+from universal_mcp.tools.schema_interning import SchemaInterner, clear_interned_schemas, intern_tags, schema_interner
+from universal_mcp.tools.tools import Tool
+
+
+def list_contacts(limit: int = 10, after: str | None = None) -> list[dict]:
+    """Lists contacts.
+
+    Args:
+        limit: Maximum number of contacts.
+        after: Pagination cursor.
+
+    Returns:
+        The contacts.
+
+    Raises:
+        HTTPError: If the request fails.
+
+    Tags:
+        contacts, important
+    """
+    return [{"limit": limit, "after": after}]
+
+
+def list_deals(limit: int = 10, after: str | None = None) -> list[dict]:
+    """Lists deals.
+
+    Args:
+        limit: Maximum number of contacts.
+        after: Pagination cursor.
+
+    Tags:
+        contacts, important
+    """
+    return []
+
+
+class CrmApp(BaseApplication):
+    def __init__(self):
+        super().__init__(name="crm")
+
+    def list_tools(self):
+        return [list_contacts, list_deals]
+
+
+def test_compact_tool_exports_like_full_tool():
+    full = Tool.from_function(list_contacts)
+    compact = CompactTool.from_function(list_contacts)
+
+    assert not hasattr(compact, "__dict__")
+    assert compact.parameters == full.parameters
+    assert compact.output_schema == full.output_schema
+    assert convert_tool_to_mcp_tool(compact) == convert_tool_to_mcp_tool(full)
+    assert convert_tool_to_openai_tool(compact) == convert_tool_to_openai_tool(full)
+    assert compact.args_description == full.args_description
+    assert compact.raises_description == full.raises_description
+    assert CompactTool.from_tool(full, keep_docs=True).returns_description == full.returns_description
+
+
+def test_compact_tools_share_tags_and_schema_fragments():
+    contacts = CompactTool.from_function(list_contacts)
+    deals = CompactTool.from_function(list_deals)
+
+    assert contacts.tags is deals.tags
+    assert contacts.parameters["properties"] is deals.parameters["properties"]
+    assert contacts.output_schema is deals.output_schema
+
+
+@pytest.mark.asyncio
+async def test_manager_registers_and_runs_compact_tools():
+    manager = ToolManager(compact_tools=True)
+    manager.register_tools_from_app(CrmApp())
+
+    tools = manager.get_tools(tags=["crm"])
+    assert [type(tool) for tool in tools] == [CompactTool, CompactTool]
+    assert tools[0].tags == ("contacts", "important", "crm")
+    tool = manager.get_tool("crm__list_contacts")
+    assert await tool.run({"limit": 2}) == [{"limit": 2, "after": None}]
+    assert tool.fn_metadata is not None
+    with pytest.raises(ToolError):
+        await tool.run({"limit": "many"})
+
+
+def test_schema_interner_shares_equal_subtrees():
+    interner = SchemaInterner()
+    first = interner.intern({"a": {"type": "integer", "enum": [1, True]}, "b": [{"x": 1}]})
+    second = interner.intern({"c": {"type": "integer", "enum": [1, True]}, "d": [{"x": 1.0}]})
+
+    assert first == {"a": {"type": "integer", "enum": [1, True]}, "b": [{"x": 1}]}
+    assert first["a"] is second["c"]
+    assert first["b"] is not second["d"]
+    assert interner.intern([True]) is not interner.intern([1])
+    assert type(interner.intern([True])[0]) is bool
+    assert intern_tags(["a", "b"]) is intern_tags(("a", "b"))
+
+
+def test_exported_schemas_are_not_shared():
+    contacts = CompactTool.from_function(list_contacts)
+    deals = CompactTool.from_function(list_deals)
+
+    exported = convert_tool_to_mcp_tool(contacts)
+    exported.inputSchema["properties"]["limit"]["default"] = 0
+    exported.outputSchema["title"] = "Changed"
+    convert_tool_to_openai_tool(contacts, compact_schemas=True)["function"]["parameters"]["properties"].clear()
+
+    assert deals.parameters["properties"]["limit"]["default"] == 10
+    assert deals.output_schema["title"] == "Return Value"
+    assert convert_tool_to_mcp_tool(deals) == convert_tool_to_mcp_tool(Tool.from_function(list_deals))
+
+
+def test_clear_interned_schemas():
+    contacts = CompactTool.from_function(list_contacts)
+    manager = ToolManager(compact_tools=True)
+    manager.register_tools_from_app(CrmApp())
+    assert len(schema_interner) > 0
+
+    manager.clear_tools()
+    assert len(schema_interner) == 0
+    assert intern_tags(["a"]) is intern_tags(["a"])
+    clear_interned_schemas()
+    assert contacts.parameters == Tool.from_function(list_contacts).parameters
+    assert CompactTool.from_function(list_contacts).parameters is not contacts.parameters
+
+
+def test_serializing_compact_tool_does_not_bind_it():
+    compact = CompactTool.from_function(list_contacts)
+
+    assert serialize_tool(compact) == serialize_tool(Tool.from_function(list_contacts))
+    assert compact._bound_tool is None
+
+
+@pytest.mark.asyncio
+async def test_server_config_enables_compact_tools():
+    server = LocalServer(
+        ServerConfig(apps=[AppConfig(name="sample", actions=["calculate"])], compact_tools=True),
+        registry=LocalRegistry(),
+    )
+
+    tools = server.tool_manager.get_tools()
+    assert [type(tool) for tool in tools] == [CompactTool]
+    assert (await server.call_tool("sample__calculate", {"expression": "2 + 2"}))[0].text == "Result: 4"
+    assert isinstance(LocalRegistry(compact_tools=True).tool_manager._tool_from_function(list_contacts), CompactTool)
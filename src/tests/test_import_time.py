@@ -0,0 +1,41 @@
+import subprocess
+import sys
+
+import pytest
+
+# Optional dependencies that must only be imported when the feature using them is used.
+HEAVY_OPTIONAL_MODULES = {"gql", "graphql", "aiohttp", "openai", "langchain_core", "langgraph"}
+
+# Generous upper bound on the cumulative import time of the server entry point, in microseconds.
+IMPORT_TIME_BUDGET_US = 3_000_000
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """Imports `module` in a fresh interpreter and returns cumulative import times in microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize(
+    "module",
+    ["universal_mcp.servers", "universal_mcp.tools", "universal_mcp.applications.application"],
+)
+def test_import_does_not_load_heavy_optional_dependencies(module: str):
+    imported = {name.split(".")[0] for name in _import_times(module)}
+    assert not imported & HEAVY_OPTIONAL_MODULES
+
+
+def test_server_import_time_budget():
+    times = _import_times("universal_mcp.servers")
+    assert times["universal_mcp.servers"] < IMPORT_TIME_BUDGET_US
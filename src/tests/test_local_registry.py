@@ -5,7 +5,7 @@ import pytest
 from langchain_core.tools import StructuredTool
 from mcp.server.fastmcp.server import MCPTool
 
-from universal_mcp.exceptions import ToolNotFoundError
+from universal_mcp.exceptions import ToolError, ToolNotFoundError
 from universal_mcp.tools.local_registry import LocalRegistry
 from universal_mcp.types import ToolFormat
 
@@ -77,6 +77,16 @@ async def test_file_output_handling(registry: LocalRegistry):
     assert os.path.exists(file_path)
 
 
+@pytest.mark.asyncio
+async def test_app_that_fails_to_load_is_not_cached(registry: LocalRegistry):
+    """Verify that an app that cannot be imported registers nothing and is retried later."""
+    tools = await registry.export_tools(["missing_app__tool", "sample__calculate"], format=ToolFormat.MCP)
+
+    assert [tool.name for tool in tools] == ["sample__calculate"]
+    assert list(registry._app_instances) == ["sample"]
+    assert registry._app_instances["sample"].name == "sample"
+
+
 @pytest.mark.asyncio
 async def test_unimplemented_methods(registry: LocalRegistry):
     """Test that abstract methods raise NotImplementedError."""
@@ -92,3 +102,50 @@ async def test_unimplemented_methods(registry: LocalRegistry):
         await registry.search_tools("query")
     with pytest.raises(NotImplementedError):
         await registry.list_connected_apps()
+
+
+@pytest.mark.asyncio
+async def test_call_tools_batch(registry: LocalRegistry):
+    """Test that a batch returns results in order, with per-call errors."""
+    await registry.export_tools(["sample__calculate"], format=ToolFormat.NATIVE)  # Load the tool
+    results = await registry.call_tools(
+        [
+            ("sample__calculate", {"expression": "1 + 1"}),
+            ("nonexistent__tool", {}),
+            ("sample__calculate", {"expression": "2 * 3"}),
+        ],
+        max_concurrency=2,
+        max_concurrency_per_app=1,
+    )
+
+    assert [r.tool_name for r in results] == ["sample__calculate", "nonexistent__tool", "sample__calculate"]
+    assert results[0].ok and results[0].result == "Result: 2"
+    assert not results[1].ok and isinstance(results[1].error, ToolNotFoundError)
+    assert results[2].ok and results[2].result == "Result: 6"
+
+
+@pytest.mark.asyncio
+async def test_call_tools_reports_each_outcome(registry: LocalRegistry):
+    """Verify that a batch returns results and errors per call, in order."""
+    await registry.load_tools(["sample__calculate", "sample__get_current_date"])
+
+    results = await registry.call_tools(
+        [
+            ("sample__calculate", {"expression": "6 * 7"}),
+            ("sample__missing", {}),
+            ("sample__calculate", {}),
+            ("sample__get_current_date", {}),
+        ]
+    )
+
+    assert [result.tool_name for result in results] == [
+        "sample__calculate",
+        "sample__missing",
+        "sample__calculate",
+        "sample__get_current_date",
+    ]
+    assert [result.ok for result in results] == [True, False, False, True]
+    assert results[0].result == "Result: 42"
+    assert isinstance(results[1].error, ToolNotFoundError)
+    assert isinstance(results[2].error, ToolError)
+    assert "expression" in str(results[2].error)
@@ -0,0 +1,100 @@
+import io
+import json
+import sys
+import threading
+import time
+
+import pytest
+from loguru import logger
+
+from universal_mcp.logger import BackgroundSink, RateLimitFilter, get_log_stats, setup_logger
+
+
+class BlockingStream(io.StringIO):
+    """Stream whose writes wait until released, to back up the log queue."""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def write(self, s: str) -> int:
+        self.release.wait()
+        return super().write(s)
+
+
+@pytest.fixture
+def restore_logger():
+    yield
+    logger.remove()
+    logger.add(sys.stderr)
+
+
+def test_rate_limit_filter_samples_per_call_site():
+    sample = RateLimitFilter(limit=2, window=60)
+    stream = io.StringIO()
+    handler_id = logger.add(stream, format="{message}", filter=sample)
+    try:
+        for i in range(5):
+            logger.warning("upstream failed {}", i)
+        logger.warning("other call site")
+    finally:
+        logger.remove(handler_id)
+
+    assert stream.getvalue().splitlines() == ["upstream failed 0", "upstream failed 1", "other call site"]
+    assert sample.suppressed == 3
+
+
+def test_rate_limit_filter_reports_suppressed_in_next_window():
+    sample = RateLimitFilter(limit=1, window=0.05)
+    records = []
+    handler_id = logger.add(lambda m: records.append(m.record), filter=sample)
+    try:
+        for delay in (0, 0, 0, 0.06):
+            time.sleep(delay)
+            logger.info("repeated")
+    finally:
+        logger.remove(handler_id)
+
+    assert len(records) == 2
+    assert "suppressed" not in records[0]["extra"]
+    assert records[1]["extra"]["suppressed"] == 2
+
+
+def test_background_sink_drops_instead_of_blocking():
+    stream = BlockingStream()
+    sink = BackgroundSink([stream], maxsize=2)
+    handler_id = logger.add(sink, format="")
+    try:
+        for i in range(10):
+            logger.info("record {}", i)
+        assert sink.dropped >= 7
+    finally:
+        stream.release.set()
+        logger.remove(handler_id)
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [line["message"] for line in lines if "extra" not in line][0] == "record 0"
+    assert [line["extra"]["dropped"] for line in lines if "extra" in line] == [sink.dropped]
+    assert len(lines) == 10 - sink.dropped + 1
+
+
+def test_production_profile_writes_json(tmp_path, restore_logger):
+    log_file = tmp_path / "server.log"
+    setup_logger(log_file=log_file, profile="production", sample_limit=5)
+    try:
+        raise ValueError("bad {value}")
+    except ValueError:
+        logger.bind(tool="app__tool").exception("Tool failed")
+    logger.remove()
+
+    records = [json.loads(line) for line in log_file.read_text().splitlines()]
+    assert records[-1]["message"] == "Tool failed"
+    assert records[-1]["extra"] == {"tool": "app__tool"}
+    assert records[-1]["exception"]["type"] == "ValueError"
+    assert "Traceback" in records[-1]["exception"]["traceback"]
+    assert get_log_stats()["dropped"] == 0
+
+
+def test_invalid_profile():
+    with pytest.raises(ValueError):
+        setup_logger(profile="verbose")  # type: ignore[arg-type]
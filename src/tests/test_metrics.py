@@ -0,0 +1,148 @@
+import httpx
+import pytest
+from starlette.testclient import TestClient
+
+from universal_mcp.applications.application import APIApplication
+from universal_mcp.config import AppConfig, ServerConfig
+from universal_mcp.exceptions import ToolError
+from universal_mcp.servers.server import LocalServer
+from universal_mcp.tools.local_registry import LocalRegistry
+from universal_mcp.tools.tools import Tool
+from universal_mcp.utils.metrics import (
+    HTTP_REQUESTS,
+    AsyncInstrumentedClient,
+    InstrumentedClient,
+    MetricsRegistry,
+    get_metrics_snapshot,
+)
+
+
+def _samples(snapshot: dict, name: str, **labels) -> list:
+    return [
+        sample["value"]
+        for sample in snapshot[name]["samples"]
+        if all(sample["labels"].get(key) == value for key, value in labels.items())
+    ]
+
+
+def test_registry_snapshot_and_prometheus_text():
+    registry = MetricsRegistry()
+    calls = registry.counter("calls_total", "Calls.", ("tool",))
+    in_flight = registry.gauge("in_flight", "In flight.")
+    latency = registry.histogram("latency_seconds", "Latency.", ("tool",), buckets=(0.1, 1.0))
+
+    calls.inc(tool="a")
+    calls.inc(2, tool="a")
+    in_flight.inc()
+    latency.observe(0.05, tool="a")
+    latency.observe(0.5, tool="a")
+    latency.observe(5, tool="a")
+
+    snapshot = registry.snapshot()
+    assert _samples(snapshot, "calls_total", tool="a") == [3]
+    assert _samples(snapshot, "in_flight") == [1]
+    assert _samples(snapshot, "latency_seconds", tool="a") == [
+        {"count": 3, "sum": 5.55, "buckets": {"0.1": 1, "1": 2, "+Inf": 3}}
+    ]
+
+    text = registry.render_prometheus()
+    assert "# TYPE calls_total counter" in text
+    assert 'calls_total{tool="a"} 3' in text
+    assert 'latency_seconds_bucket{tool="a",le="+Inf"} 3' in text
+    assert 'latency_seconds_count{tool="a"} 3' in text
+
+    assert registry.counter("calls_total", "Calls.", ("tool",)) is calls
+    with pytest.raises(ValueError):
+        registry.gauge("calls_total", "Calls.", ("tool",))
+    with pytest.raises(ValueError):
+        calls.inc(other="a")
+
+
+@pytest.mark.asyncio
+async def test_tool_run_records_phases_and_outcome():
+    def metrics_probe(value: int) -> int:
+        """Returns the value."""
+        return value
+
+    tool = Tool.from_function(metrics_probe)
+    assert await tool.run({"value": 1}) == 1
+    with pytest.raises(ToolError):
+        await tool.run({"value": "not a number"})
+
+    snapshot = get_metrics_snapshot()
+    calls = "universal_mcp_tool_calls_total"
+    assert _samples(snapshot, calls, tool="metrics_probe", status="ok") == [1]
+    assert _samples(snapshot, calls, tool="metrics_probe", status="error") == [1]
+    durations = "universal_mcp_tool_call_duration_seconds"
+    assert _samples(snapshot, durations, tool="metrics_probe", phase="validation")[0]["count"] == 2
+    assert _samples(snapshot, durations, tool="metrics_probe", phase="execution")[0]["count"] == 1
+    assert _samples(snapshot, "universal_mcp_tool_calls_in_flight", tool="metrics_probe") == [0]
+
+
+def test_instrumented_client_records_status_by_host():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/down":
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(404 if request.url.path == "/missing" else 200)
+
+    transport = httpx.MockTransport(handler)
+    with InstrumentedClient("metrics_app", base_url="https://api.example.com", transport=transport) as client:
+        client.get("/ok")
+        client.get("/missing")
+        with pytest.raises(httpx.ConnectError):
+            client.post("/down")
+
+    values = {
+        (sample["labels"]["method"], sample["labels"]["status"]): sample["value"]
+        for sample in HTTP_REQUESTS.samples()
+        if sample["labels"]["app"] == "metrics_app"
+    }
+    assert values == {("GET", "200"): 1, ("GET", "404"): 1, ("POST", "error"): 1}
+    snapshot = get_metrics_snapshot()
+    assert _samples(snapshot, "universal_mcp_http_requests_in_flight", app="metrics_app", host="api.example.com") == [0]
+
+
+@pytest.mark.asyncio
+async def test_async_instrumented_client_records_requests():
+    transport = httpx.MockTransport(lambda request: httpx.Response(201))
+    async with AsyncInstrumentedClient(
+        "metrics_client_app", base_url="https://api.example.com", transport=transport
+    ) as client:
+        await client.post("/items")
+
+    values = [sample for sample in HTTP_REQUESTS.samples() if sample["labels"]["app"] == "metrics_client_app"]
+    assert [(sample["labels"]["status"], sample["value"]) for sample in values] == [("201", 1)]
+
+
+class ProxiedApp(APIApplication):
+    def list_tools(self):
+        return []
+
+
+@pytest.mark.asyncio
+async def test_app_clients_honour_proxy_environment(monkeypatch):
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example.com:3128")
+    app = ProxiedApp(name="proxied")
+    app.base_url = "https://api.example.com"
+
+    with app.get_sync_client() as client:
+        assert isinstance(client, InstrumentedClient)
+        assert len(client._mounts) == 1
+    async with app.get_async_client() as async_client:
+        assert isinstance(async_client, AsyncInstrumentedClient)
+        assert len(async_client._mounts) == 1
+
+
+def test_metrics_endpoint():
+    server = LocalServer(ServerConfig(apps=[AppConfig(name="sample")]), registry=LocalRegistry())
+    with TestClient(server.sse_app()) as client:
+        assert client.get("/metrics").status_code == 404
+
+    server = LocalServer(
+        ServerConfig(apps=[AppConfig(name="sample")], metrics_path="/metrics"), registry=LocalRegistry()
+    )
+    with TestClient(server.sse_app()) as client:
+        response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "# TYPE universal_mcp_tool_calls_total counter" in response.text
@@ -0,0 +1,112 @@
+import asyncio
+import socket
+
+import httpx
+import pytest
+
+from universal_mcp.client import oauth
+from universal_mcp.client.oauth import CallbackServer
+
+
+@pytest.fixture
+def callback_server():
+    server = CallbackServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+def _redirect(server: CallbackServer, **params) -> httpx.Response:
+    return httpx.get(server.redirect_uri, params=params)
+
+
+def test_callback_server_uses_free_port(callback_server: CallbackServer):
+    assert callback_server.port != 0
+    assert callback_server.redirect_uri == f"http://localhost:{callback_server.port}/callback"
+
+
+def test_callback_server_falls_back_when_port_is_taken():
+    with socket.socket() as sock:
+        sock.bind(("localhost", 0))
+        sock.listen()
+        taken_port = sock.getsockname()[1]
+        server = CallbackServer(port=taken_port)
+        server.start()
+        try:
+            assert server.port not in (0, taken_port)
+        finally:
+            server.stop()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_flows_are_routed_by_state(callback_server: CallbackServer):
+    first = asyncio.create_task(callback_server.wait_for_callback_async(timeout=5, state="first"))
+    second = asyncio.create_task(callback_server.wait_for_callback_async(timeout=5, state="second"))
+    await asyncio.sleep(0)
+
+    await asyncio.to_thread(_redirect, callback_server, code="code-2", state="second")
+    await asyncio.to_thread(_redirect, callback_server, code="code-1", state="first")
+
+    assert await first == ("code-1", "first")
+    assert await second == ("code-2", "second")
+
+
+@pytest.mark.asyncio
+async def test_oauth_error_fails_the_flow(callback_server: CallbackServer):
+    waiter = asyncio.create_task(callback_server.wait_for_callback_async(timeout=5, state="s"))
+    await asyncio.sleep(0)
+    response = await asyncio.to_thread(_redirect, callback_server, error="access_denied", state="s")
+
+    assert response.status_code == 400
+    with pytest.raises(Exception, match="access_denied"):
+        await waiter
+
+
+@pytest.mark.asyncio
+async def test_async_wait_times_out(callback_server: CallbackServer):
+    with pytest.raises(Exception, match="Timeout"):
+        await callback_server.wait_for_callback_async(timeout=0.05, state="never")
+
+
+def test_early_callback_is_kept_for_its_flow(callback_server: CallbackServer):
+    _redirect(callback_server, code="early", state="s")
+
+    assert callback_server.wait_for_callback(timeout=1, state="s") == "early"
+    assert callback_server.get_state() == "s"
+
+
+@pytest.mark.asyncio
+async def test_callback_with_unknown_state_is_not_given_to_stateless_flow(callback_server: CallbackServer):
+    waiter = asyncio.create_task(callback_server.wait_for_callback_async(timeout=5))
+    await asyncio.sleep(0)
+
+    await asyncio.to_thread(_redirect, callback_server, code="forged", state="unknown")
+    await asyncio.sleep(0.05)
+    assert not waiter.done()
+
+    await asyncio.to_thread(_redirect, callback_server, code="real")
+    assert await waiter == ("real", None)
+
+
+def test_unclaimed_callbacks_are_bounded_and_expire(callback_server: CallbackServer, monkeypatch):
+    monkeypatch.setattr(oauth, "MAX_UNCLAIMED_CALLBACKS", 2)
+    for state in ("a", "b", "c"):
+        callback_server._resolve_flow(state, code=f"code-{state}")
+    assert list(callback_server._unclaimed) == ["b", "c"]
+
+    monkeypatch.setattr(oauth, "UNCLAIMED_CALLBACK_TTL", 0)
+    callback_server._resolve_flow("d", code="code-d")
+    assert not callback_server.expect_callback("d").done()
+    assert callback_server.expect_callback("c").result(timeout=0) == ("code-c", "c")
+
+
+def test_stop_if_idle_keeps_serving_pending_flows(callback_server: CallbackServer):
+    pending = callback_server.expect_callback("pending")
+    callback_server.stop_if_idle()
+    assert callback_server.is_running
+    assert not pending.done()
+
+    _redirect(callback_server, code="code", state="pending")
+    assert pending.result(timeout=1) == ("code", "pending")
+    callback_server.stop_if_idle()
+    assert not callback_server.is_running
@@ -0,0 +1,116 @@
+import pstats
+
+import pytest
+from starlette.testclient import TestClient
+
+from universal_mcp.config import AppConfig, ServerConfig
+from universal_mcp.servers.server import LocalServer
+from universal_mcp.tools.local_registry import LocalRegistry
+from universal_mcp.tools.tools import Tool
+from universal_mcp.utils.profiling import profiler
+
+
+def allocate_rows(count: int) -> int:
+    """Builds a list of rows."""
+    rows = [{"index": index, "name": f"row {index}"} for index in range(count)]
+    return len(rows)
+
+
+async def allocate_rows_async(count: int) -> int:
+    """Builds a list of rows."""
+    return allocate_rows(count)
+
+
+@pytest.fixture(autouse=True)
+def reset_profiler():
+    yield
+    profiler.disable()
+
+
+def _profiles(directory) -> list:
+    return sorted(directory.glob("*.prof"))
+
+
+@pytest.mark.asyncio
+async def test_profiling_is_off_by_default(tmp_path):
+    tool = Tool.from_function(allocate_rows)
+    assert await tool.run({"count": 10}) == 10
+    assert not profiler.active
+    assert profiler.session_for(tool.name) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fn", [allocate_rows, allocate_rows_async])
+@pytest.mark.parametrize("timeout", [None, 5.0])
+async def test_selected_tool_writes_profile_and_allocations(tmp_path, fn, timeout):
+    tool = Tool.from_function(fn)
+    other = Tool.from_function(lambda: None, name="other")
+    profiler.enable(tool_names=[tool.name], output_dir=tmp_path)
+
+    assert await tool.run({"count": 1000}, timeout=timeout) == 1000
+    await other.run({})
+
+    profiles = _profiles(tmp_path)
+    assert len(profiles) == 1
+    assert profiles[0].name.startswith(tool.name)
+    functions = {name for _, _, name in pstats.Stats(str(profiles[0])).stats}
+    assert "allocate_rows" in functions
+    report = profiles[0].with_suffix(".txt").read_text()
+    assert f"Tool: {tool.name}" in report
+    assert "Peak traced memory" in report
+    assert "test_profiling.py" in report
+
+
+@pytest.mark.asyncio
+async def test_sample_rate_and_disable(tmp_path):
+    tool = Tool.from_function(allocate_rows)
+    profiler.enable(sample_rate=1.0, output_dir=tmp_path, trace_allocations=False)
+    await tool.run({"count": 1})
+    assert len(_profiles(tmp_path)) == 1
+    assert "Peak traced memory" not in _profiles(tmp_path)[0].with_suffix(".txt").read_text()
+
+    profiler.disable()
+    await tool.run({"count": 1})
+    assert len(_profiles(tmp_path)) == 1
+
+    with pytest.raises(ValueError):
+        profiler.enable(sample_rate=1.5)
+    with pytest.raises(TypeError):
+        profiler.enable(tool_names="allocate_rows")
+
+
+def test_overlapping_calls_are_not_profiled(tmp_path):
+    profiler.enable(tool_names=["a"], output_dir=tmp_path)
+    session = profiler.session_for("a")
+    assert session is not None
+    assert profiler.session_for("a") is None
+    with session:
+        pass
+    assert profiler.session_for("a") is not None
+
+
+def test_profiling_route_toggles_profiler(tmp_path):
+    server = LocalServer(
+        ServerConfig(
+            apps=[AppConfig(name="sample")],
+            use_tool_catalog=False,
+            profiling_path="/debug/profiling",
+            profile_dir=tmp_path,
+        ),
+        registry=LocalRegistry(),
+    )
+    with TestClient(server.sse_app()) as client:
+        assert client.get("/debug/profiling").json()["active"] is False
+        response = client.post("/debug/profiling", json={"tool_names": ["sample__calculate"], "output_dir": "run1"})
+        assert response.json()["tool_names"] == ["sample__calculate"]
+        assert response.json()["output_dir"] == str(tmp_path.resolve() / "run1")
+        assert profiler.active
+        for outside in ("../elsewhere", "/tmp"):
+            response = client.post("/debug/profiling", json={"sample_rate": 1, "output_dir": outside})
+            assert response.status_code == 400
+        assert client.get("/debug/profiling").json()["output_dir"] == str(tmp_path.resolve() / "run1")
+        assert client.post("/debug/profiling", json={"sample_rate": 2}).status_code == 400
+        for tool_names in ("sample__calculate", ["sample__calculate", 1], {"sample__calculate": True}):
+            assert client.post("/debug/profiling", json={"tool_names": tool_names}).status_code == 400
+        assert client.get("/debug/profiling").json()["tool_names"] == ["sample__calculate"]
+        assert client.delete("/debug/profiling").json()["active"] is False
@@ -0,0 +1,81 @@
+import pytest
+
+from universal_mcp.client.replicas import EJECTION_THRESHOLD, ReplicaPool
+
+
+def test_least_outstanding_prefers_idle_replica():
+    pool = ReplicaPool()
+    pool.add("a")
+    pool.add("b")
+
+    with pool.acquire() as (first, _), pool.acquire() as (second, _):
+        assert {first, second} == {"a", "b"}
+    with pool.acquire() as (replica, _):
+        assert replica == "a"
+
+    assert pool.stats("a").requests == 2
+    assert pool.stats("b").requests == 1
+    assert pool.stats("a").outstanding == 0
+    assert pool.stats("a").ewma_latency is not None
+
+
+def test_round_robin_cycles_through_replicas():
+    pool = ReplicaPool("round_robin")
+    for replica in ("a", "b", "c"):
+        pool.add(replica)
+
+    assert [pool.select() for _ in range(6)] == ["a", "b", "c", "a", "b", "c"]
+
+
+def test_assign_spreads_requests_sent_together():
+    pool = ReplicaPool()
+    pool.add("a")
+    pool.add("b")
+
+    assert pool.assign(4) == ["a", "b", "a", "b"]
+    assert pool.stats("a").outstanding == 0
+    with pool.acquire("b") as (replica, _):
+        assert replica == "b"
+        assert pool.assign(1) == ["a"]
+    with pool.acquire("gone") as (replica, _):
+        assert replica == "a"
+
+
+def test_failing_replica_is_ejected():
+    pool = ReplicaPool()
+    pool.add("a")
+    pool.add("b")
+
+    for _ in range(EJECTION_THRESHOLD):
+        with pytest.raises(RuntimeError), pool.acquire() as (replica, _):
+            assert replica == "a"
+            raise RuntimeError("connection lost")
+
+    assert pool.stats("a").is_ejected
+    assert pool.stats("a").errors == EJECTION_THRESHOLD
+    assert pool.select() == "b"
+
+
+def test_reported_failure_and_unavailable_replicas():
+    connected = {"a": False, "b": True}
+    pool = ReplicaPool(is_available=lambda replica: connected[replica])
+    pool.add("a")
+    pool.add("b")
+
+    with pool.acquire() as (replica, report):
+        assert replica == "b"
+        report(False)
+    assert pool.stats("b").consecutive_failures == 1
+
+    connected["b"] = False
+    assert pool.select() == "a"
+
+    pool.remove("a")
+    pool.remove("b")
+    with pytest.raises(LookupError):
+        pool.select()
+
+
+def test_invalid_strategy():
+    with pytest.raises(ValueError):
+        ReplicaPool("random")
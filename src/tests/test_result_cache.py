@@ -0,0 +1,76 @@
+import pytest
+from mcp.types import CallToolResult, TextContent
+
+from universal_mcp.client import result_cache as result_cache_module
+from universal_mcp.client.result_cache import ToolResultCache, canonical_arguments
+
+
+def _result(text: str, is_error: bool = False) -> CallToolResult:
+    return CallToolResult(content=[TextContent(type="text", text=text)], isError=is_error)
+
+
+def test_canonical_arguments_ignores_key_order():
+    assert canonical_arguments({"a": 1, "b": {"y": 2, "x": 1}}) == canonical_arguments({"b": {"x": 1, "y": 2}, "a": 1})
+
+
+def test_result_cache_hits_and_misses():
+    cache = ToolResultCache(ttl=60)
+    assert cache.get("search", {"q": "mcp"}) is None
+
+    cache.set("search", {"q": "mcp"}, _result("found"))
+    cached = cache.get("search", {"q": "mcp"})
+    assert cached.content[0].text == "found"
+    assert cache.get("search", {"q": "other"}) is None
+    assert cache.stats() == {"hits": 1, "misses": 2, "evictions": 0, "size": 1}
+
+
+def test_result_cache_returns_copies():
+    cache = ToolResultCache(ttl=60)
+    result = _result("found")
+    cache.set("search", {}, result)
+    result.content[0].text = "changed by the caller"
+
+    cached = cache.get("search", {})
+    cached.content[0].text = "changed"
+    cached.content.append(TextContent(type="text", text="extra"))
+
+    again = cache.get("search", {})
+    assert [item.text for item in again.content] == ["found"]
+
+
+def test_result_cache_skips_errors():
+    cache = ToolResultCache(ttl=60)
+    cache.set("search", {}, _result("boom", is_error=True))
+    assert len(cache) == 0
+
+
+def test_result_cache_expires_entries(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(result_cache_module.time, "monotonic", lambda: now[0])
+    cache = ToolResultCache(ttl=10)
+    cache.set("search", {}, _result("found"))
+
+    now[0] += 11
+    assert cache.get("search", {}) is None
+    assert len(cache) == 0
+
+
+def test_result_cache_evicts_least_recently_used():
+    cache = ToolResultCache(ttl=60, maxsize=2)
+    cache.set("a", {}, _result("a"))
+    cache.set("b", {}, _result("b"))
+    cache.get("a", {})
+    cache.set("c", {}, _result("c"))
+
+    assert cache.get("b", {}) is None
+    assert cache.get("a", {}) is not None
+    assert cache.evictions == 1
+
+    cache.invalidate("a")
+    assert cache.get("a", {}) is None
+    assert cache.get("c", {}) is not None
+
+
+def test_result_cache_rejects_invalid_settings():
+    with pytest.raises(ValueError):
+        ToolResultCache(ttl=0)
@@ -0,0 +1,81 @@
+import copy
+
+from universal_mcp.tools.adapters import convert_tools
+from universal_mcp.tools.schema_interning import compact_schema
+from universal_mcp.tools.tools import Tool
+from universal_mcp.types import ToolFormat
+
+FILTER = {
+    "type": "object",
+    "title": "Filter",
+    "properties": {
+        "field": {"type": "string", "description": "Property to filter on."},
+        "operator": {"type": "string", "enum": ["EQ", "NEQ", "GT", "LT"]},
+        "value": {"anyOf": [{"type": "string"}, {"type": "integer"}]},
+    },
+    "required": ["field", "operator", "value"],
+}
+
+
+def _resolve(schema, root=None):
+    """Inline every `#/$defs/...` reference."""
+    root = root or schema
+    if isinstance(schema, dict):
+        if "$ref" in schema:
+            return _resolve(root["$defs"][schema["$ref"].removeprefix("#/$defs/")], root)
+        return {key: _resolve(value, root) for key, value in schema.items() if key != "$defs"}
+    if isinstance(schema, list):
+        return [_resolve(item, root) for item in schema]
+    return schema
+
+
+def test_repeated_subschemas_move_to_defs():
+    schema = {
+        "type": "object",
+        "properties": {
+            "include": {"type": "array", "items": FILTER},
+            "exclude": {"anyOf": [FILTER, {"type": "null"}]},
+        },
+    }
+    original = copy.deepcopy(schema)
+
+    compacted = compact_schema(schema)
+
+    assert schema == original
+    assert compacted["properties"]["include"]["items"] == compacted["properties"]["exclude"]["anyOf"][0]
+    assert list(compacted["$defs"]) == [compacted["properties"]["include"]["items"]["$ref"].split("/")[-1]]
+    assert next(iter(compacted["$defs"])).startswith("Filter_")
+    assert _resolve(compacted) == schema
+    assert compact_schema(schema) == compacted
+    assert compact_schema(compacted) is compacted
+
+
+def test_small_or_single_subschemas_stay_inline():
+    schema = {"type": "object", "properties": {"a": {"type": "string"}, "b": {"type": "string"}, "c": FILTER}}
+    assert compact_schema(schema) is schema
+
+    # FILTER's fields repeat only inside the two copies of FILTER, so they are not moved on their own.
+    nested = {"type": "object", "properties": {"a": FILTER, "b": FILTER}}
+    compacted = compact_schema(nested)
+    assert len(compacted["$defs"]) == 1
+    assert _resolve(compacted) == nested
+
+
+def test_convert_tools_compacts_mcp_and_openai_schemas():
+    def search(include: list[dict] | None = None, exclude: list[dict] | None = None) -> str:
+        """Searches records."""
+        return ""
+
+    tool = Tool.from_function(search)
+    for name in ("include", "exclude"):
+        tool.parameters["properties"][name] = {"anyOf": [{"type": "array", "items": FILTER}, {"type": "null"}]}
+    mcp_tool = convert_tools([tool], ToolFormat.MCP, compact_schemas=True)[0]
+    openai_tool = convert_tools([tool], ToolFormat.OPENAI, compact_schemas=True)[0]
+
+    assert "$defs" in mcp_tool.inputSchema
+    properties = mcp_tool.inputSchema["properties"]
+    assert properties["include"] == properties["exclude"] == {"$ref": properties["include"]["$ref"]}
+    assert _resolve(mcp_tool.inputSchema) == _resolve(tool.parameters)
+    assert openai_tool["function"]["parameters"] == mcp_tool.inputSchema
+    assert "$defs" not in tool.parameters
+    assert convert_tools([tool], ToolFormat.MCP)[0].inputSchema == tool.parameters
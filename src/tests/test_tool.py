@@ -1,11 +1,19 @@
+import asyncio
 import inspect
-from typing import Annotated
+import threading
+import time
+from collections import OrderedDict
+from typing import Annotated, Any
 
+import pytest
 from pydantic import Field
 
+from universal_mcp.exceptions import ToolError, ToolTimeoutError
+from universal_mcp.tools import func_metadata
 from universal_mcp.tools.docstring_parser import parse_docstring  # Assuming this is the updated one
 from universal_mcp.tools.func_metadata import FuncMetadata
 from universal_mcp.tools.tools import Tool
+from universal_mcp.utils.cancellation import current_call_scope, raise_if_cancelled
 
 
 def test_func_metadata_annotated():
@@ -380,6 +388,30 @@ def test_parse_docstring_type_str_with_spaces_in_type():
     assert parse_docstring(docstring) == expected
 
 
+def test_parse_docstring_inline_section_headers():
+    docstring = """Searches records.
+
+    Args:
+        query: Search text.
+    Raises ValueError: If the query is empty.
+    Tags: search, important
+    """
+    parsed = parse_docstring(docstring)
+    assert parsed["args"] == {"query": {"description": "Search text.", "type_str": None}}
+    assert parsed["tags"] == ["search", "important"]
+
+
+def test_parse_docstring_cached_result_is_not_shared():
+    docstring = "Caches results.\n\nArgs:\n    a (int): First.\n\nTags:\n    one, two"
+    first = parse_docstring(docstring)
+    first["tags"].append("mutated")
+    first["args"]["a"]["description"] = "mutated"
+
+    second = parse_docstring(docstring)
+    assert second["tags"] == ["one", "two"]
+    assert second["args"]["a"] == {"description": "First.", "type_str": "int"}
+
+
 def test_func_metadata_untyped_with_docstring_type():
     def func(name, age, data=None):
         """Test function with untyped args but types in docstring
@@ -474,3 +506,161 @@ def test_tool_from_function_with_docstring_types():
     assert meta_schema["properties"]["age"]["default"] == 30
     assert "name" in meta_schema["required"]
     assert "age" not in meta_schema.get("required", [])
+
+
+def test_func_metadata_reuses_model_for_identical_shapes():
+    def list_contacts(limit: int = 10, after: str | None = None):
+        """List contacts.
+
+        Args:
+            limit: Page size.
+        """
+
+    def list_deals(limit: int = 10, after: str | None = None):
+        """List deals.
+
+        Args:
+            limit: Page size.
+        """
+
+    def list_notes(limit: int = 20, after: str | None = None):
+        """List notes.
+
+        Args:
+            limit: Page size.
+        """
+
+    contacts = Tool.from_function(list_contacts)
+    deals = Tool.from_function(list_deals)
+    notes = Tool.from_function(list_notes)
+
+    assert contacts.fn_metadata.arg_model is deals.fn_metadata.arg_model
+    assert notes.fn_metadata.arg_model is not contacts.fn_metadata.arg_model
+    assert contacts.parameters["title"] == "list_contactsArguments"
+    assert deals.parameters["title"] == "list_dealsArguments"
+    assert notes.parameters["properties"]["limit"]["default"] == 20
+
+    contacts.parameters["properties"]["limit"]["description"] = "changed"
+    assert deals.parameters["properties"]["limit"]["description"] == "Page size."
+
+
+@pytest.mark.asyncio
+async def test_shared_argument_model_errors_do_not_name_other_tools():
+    def list_contacts(limit: int = 10, cursor: str | None = None):
+        """List contacts."""
+
+    def list_deals(limit: int = 10, cursor: str | None = None):
+        """List deals."""
+
+    Tool.from_function(list_contacts)
+    deals = Tool.from_function(list_deals)
+
+    with pytest.raises(ToolError) as exc_info:
+        await deals.run({"limit": "many"})
+    assert "list_deals" in str(exc_info.value)
+    assert "list_contacts" not in str(exc_info.value)
+
+
+def test_argument_model_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(func_metadata, "ARG_MODEL_CACHE_SIZE", 2)
+    monkeypatch.setattr(func_metadata, "_ARG_MODEL_CACHE", OrderedDict())
+
+    def first(a: int):
+        """First."""
+
+    def second(b: int):
+        """Second."""
+
+    def third(c: int):
+        """Third."""
+
+    first_model = FuncMetadata.func_metadata(first).arg_model
+    second_model = FuncMetadata.func_metadata(second).arg_model
+    FuncMetadata.func_metadata(first)
+    FuncMetadata.func_metadata(third)
+
+    assert len(func_metadata._ARG_MODEL_CACHE) == 2
+    assert FuncMetadata.func_metadata(first).arg_model is first_model
+    assert FuncMetadata.func_metadata(second).arg_model is not second_model
+
+
+def test_tool_from_function_return_schema_is_cached_per_annotation():
+    def first() -> dict[str, Any]:
+        """First."""
+
+    def second() -> dict[str, Any]:
+        """Second."""
+
+    first_tool = Tool.from_function(first)
+    second_tool = Tool.from_function(second)
+
+    assert first_tool.output_schema == {"additionalProperties": True, "title": "Return Value", "type": "object"}
+    assert first_tool.output_schema == second_tool.output_schema
+    assert first_tool.output_schema is not second_tool.output_schema
+
+
+def test_tool_timeout_from_docstring_tag():
+    def slow_search(query: str) -> str:
+        """Search slowly.
+
+        Tags:
+            search, timeout:2.5
+        """
+        return query
+
+    def search(query: str) -> str:
+        """Search without a timeout tag."""
+        return query
+
+    assert Tool.from_function(slow_search).timeout == 2.5
+    assert Tool.from_function(search).timeout is None
+
+
+@pytest.mark.asyncio
+async def test_async_tool_is_cancelled_on_timeout():
+    cancelled = asyncio.Event()
+
+    async def hang() -> str:
+        """Never returns."""
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return "done"
+
+    tool = Tool.from_function(hang)
+    with pytest.raises(ToolTimeoutError):
+        await tool.run({}, timeout=0.05)
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_sync_tool_runs_in_thread_and_sees_cancellation():
+    finished = threading.Event()
+    steps: list[int] = []
+
+    def crawl() -> str:
+        """Does several steps, checking for cancellation between them."""
+        assert current_call_scope() is not None
+        try:
+            for step in range(20):
+                raise_if_cancelled()
+                steps.append(step)
+                time.sleep(0.02)
+        finally:
+            finished.set()
+        return "done"
+
+    tool = Tool.from_function(crawl)
+    tool.timeout = 0.05
+    with pytest.raises(ToolTimeoutError):
+        await tool.run({})
+    await asyncio.to_thread(finished.wait, 2)
+    assert len(steps) < 20
+
+    # A per-call deadline overrides the tool's default.
+    steps.clear()
+    finished.clear()
+    assert await tool.run({}, timeout=5) == "done"
+    assert len(steps) == 20
@@ -0,0 +1,46 @@
+from mcp.types import Tool as MCPTool
+from mcp.types import ToolAnnotations
+
+from universal_mcp.client.tool_cache import ToolListCache
+
+CONFIG = {"transport": "stdio", "command": "my-server", "args": ["--port", "1"]}
+
+
+def _tools() -> list[MCPTool]:
+    return [
+        MCPTool(name="search", description="Search things", inputSchema={"type": "object", "properties": {}}),
+        MCPTool(
+            name="read",
+            inputSchema={"type": "object", "properties": {"id": {"type": "string"}}},
+            annotations=ToolAnnotations(readOnlyHint=True),
+        ),
+    ]
+
+
+def test_tool_list_cache_round_trip(tmp_path):
+    cache = ToolListCache(tmp_path)
+    assert cache.get("server", CONFIG) is None
+
+    cache.set("server", CONFIG, _tools())
+    assert cache.get("server", CONFIG) == _tools()
+
+    cache.delete("server", CONFIG)
+    assert cache.get("server", CONFIG) is None
+
+
+def test_tool_list_cache_is_keyed_by_name_and_config(tmp_path):
+    cache = ToolListCache(tmp_path)
+    cache.set("server", CONFIG, _tools())
+
+    assert cache.get("other", CONFIG) is None
+    assert cache.get("server", {**CONFIG, "args": ["--port", "2"]}) is None
+    # Only a hash of the configuration is stored.
+    assert all("my-server" not in path.name for path in tmp_path.iterdir())
+
+
+def test_tool_list_cache_ignores_corrupt_entries(tmp_path):
+    cache = ToolListCache(tmp_path)
+    cache.set("server", CONFIG, _tools())
+    next(tmp_path.iterdir()).write_text("{not json")
+
+    assert cache.get("server", CONFIG) is None
@@ -1,4 +1,5 @@
 import pytest
+from loguru import logger
 
 from universal_mcp.applications.application import BaseApplication
 from universal_mcp.tools.manager import Tool, ToolManager
@@ -121,6 +122,21 @@ def test_filter_tools_by_tags(tool_manager: ToolManager, dummy_tools):
     assert len(math_tools) == 2
 
 
+def test_filter_debug_logs_are_lazy(tool_manager: ToolManager, dummy_tools):
+    for tool in dummy_tools:
+        tool_manager.add_tool(tool)
+
+    messages = []
+    handler_id = logger.add(messages.append, level="DEBUG", format="{message}")
+    try:
+        tool_manager.get_tools(tags=["math"], tool_names=["dummy_add"])
+    finally:
+        logger.remove(handler_id)
+
+    assert any("Filtered 3 tools by tags ['math']: ['dummy_add', 'dummy_multiply']" in m for m in messages)
+    assert any("Filtered 2 tools by names ['dummy_add']: ['dummy_add']" in m for m in messages)
+
+
 @pytest.mark.asyncio
 async def test_call_tool_from_app_with_tags(tool_manager: ToolManager):
     app = ExampleApp()
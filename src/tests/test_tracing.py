@@ -0,0 +1,135 @@
+import json
+
+import httpx
+import pytest
+
+from universal_mcp.config import AppConfig, ServerConfig
+from universal_mcp.servers.server import LocalServer
+from universal_mcp.tools.local_registry import LocalRegistry
+from universal_mcp.utils.metrics import InstrumentedClient
+from universal_mcp.utils.tracing import (
+    NOOP_SPAN,
+    FileSpanExporter,
+    SpanContext,
+    SpanExporter,
+    configure_tracing,
+    format_traceparent,
+    inject_trace_context,
+    parse_traceparent,
+    shutdown_tracing,
+    start_span,
+)
+
+
+class MemoryExporter(SpanExporter):
+    def __init__(self):
+        self.spans = []
+
+    def export(self, spans, service_name):
+        self.spans.extend(spans)
+
+
+@pytest.fixture
+def exporter():
+    exporter = MemoryExporter()
+    configure_tracing(exporter)
+    yield exporter
+    shutdown_tracing()
+
+
+def _finished(exporter: MemoryExporter) -> dict:
+    shutdown_tracing()
+    return {span.name: span for span in exporter.spans}
+
+
+def test_tracing_disabled_is_noop():
+    shutdown_tracing()
+    with start_span("anything") as span:
+        assert span is NOOP_SPAN
+        assert inject_trace_context({}) == {}
+
+
+def test_span_exporter_requires_export():
+    class IncompleteExporter(SpanExporter):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteExporter()
+
+
+def test_traceparent_round_trip():
+    context = SpanContext("4bf92f3577b34da6a3ce929d0e0e4736", "00f067aa0ba902b7")
+    assert parse_traceparent(format_traceparent(context)) == context
+    assert parse_traceparent("00-00000000000000000000000000000000-00f067aa0ba902b7-01") is None
+    assert parse_traceparent("garbage") is None
+
+
+@pytest.mark.asyncio
+async def test_spans_cover_the_tool_call_pipeline(exporter: MemoryExporter):
+    server = LocalServer(
+        ServerConfig(apps=[AppConfig(name="sample")], use_tool_catalog=False), registry=LocalRegistry()
+    )
+    await server.call_tool("sample__calculate", {"expression": "1 + 2"})
+
+    spans = _finished(exporter)
+    chain = [
+        "BaseServer.call_tool",
+        "ToolRegistry.call_tool",
+        "Tool.run",
+        "FuncMetadata.validate_arguments",
+    ]
+    for parent, child in zip(chain, chain[1:], strict=False):
+        assert spans[child].parent_id == spans[parent].context.span_id
+    assert spans["FuncMetadata.call_fn"].parent_id == spans["Tool.run"].context.span_id
+    assert spans["format_to_mcp_result"].parent_id == spans["BaseServer.call_tool"].context.span_id
+    assert len({span.context.trace_id for span in spans.values()}) == 1
+    assert spans["BaseServer.call_tool"].kind == "server"
+    assert spans["Tool.run"].attributes["mcp.tool.name"] == "sample__calculate"
+
+
+def test_failed_span_records_exception(exporter: MemoryExporter):
+    with pytest.raises(ValueError), start_span("failing"):
+        raise ValueError("boom")
+
+    span = _finished(exporter)["failing"]
+    assert span.error == "ValueError: boom"
+    assert span.to_otlp()["status"]["code"] == 2
+
+
+def test_http_requests_carry_trace_context(exporter: MemoryExporter):
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen["traceparent"] = request.headers.get("traceparent")
+        return httpx.Response(200)
+
+    remote_parent = SpanContext("4bf92f3577b34da6a3ce929d0e0e4736", "00f067aa0ba902b7")
+    transport = httpx.MockTransport(handler)
+    with start_span("tool", parent=remote_parent), InstrumentedClient("trace_app", transport=transport) as client:
+        client.get("https://api.example.com/items")
+
+    spans = _finished(exporter)
+    http_span = spans["HTTP GET"]
+    assert http_span.kind == "client"
+    assert http_span.parent_id == spans["tool"].context.span_id
+    assert http_span.context.trace_id == remote_parent.trace_id
+    assert http_span.attributes["http.response.status_code"] == 200
+    assert parse_traceparent(seen["traceparent"]) == http_span.context
+
+
+def test_file_exporter_writes_otlp_json(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    configure_tracing(FileSpanExporter(path), service_name="test-service")
+    with start_span("outer", attributes={"count": 2}):
+        pass
+    shutdown_tracing()
+
+    request = json.loads(path.read_text().splitlines()[0])
+    resource_spans = request["resourceSpans"][0]
+    assert resource_spans["resource"]["attributes"] == [
+        {"key": "service.name", "value": {"stringValue": "test-service"}}
+    ]
+    span = resource_spans["scopeSpans"][0]["spans"][0]
+    assert span["name"] == "outer"
+    assert span["attributes"] == [{"key": "count", "value": {"intValue": "2"}}]
+    assert int(span["endTimeUnixNano"]) >= int(span["startTimeUnixNano"])
@@ -1,17 +1,19 @@
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from contextlib import asynccontextmanager, contextmanager
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import httpx
-from gql import Client as GraphQLClient
-from gql import gql
-from gql.transport.aiohttp import AIOHTTPTransport
-from gql.transport.requests import RequestsHTTPTransport
-from graphql import DocumentNode
 from loguru import logger
 
 from universal_mcp.integrations.integration import Integration
+from universal_mcp.utils.cancellation import raise_if_cancelled, remaining_time
+from universal_mcp.utils.metrics import AsyncInstrumentedClient, InstrumentedClient
+
+if TYPE_CHECKING:
+    # gql/graphql (and aiohttp behind them) are only needed by GraphQL apps; they are imported on use.
+    from gql import Client as GraphQLClient
+    from graphql import DocumentNode
 
 DEFAULT_API_TIMEOUT = 30  # seconds
 
@@ -39,7 +41,7 @@ class BaseApplication(ABC):
                              logged but not directly used by BaseApplication.
         """
         self.name = name
-        logger.debug(f"Initializing Application '{name}' with kwargs: {kwargs}")
+        logger.debug("Initializing Application '{}' with kwargs: {}", name, kwargs)
 
     @abstractmethod
     def list_tools(self) -> list[Callable]:
@@ -92,7 +94,7 @@ class APIApplication(BaseApplication):
         super().__init__(name, **kwargs)
         self.default_timeout: int = DEFAULT_API_TIMEOUT
         self.integration = integration
-        logger.debug(f"Initializing APIApplication '{name}' with integration: {integration}")
+        logger.debug("Initializing APIApplication '{}' with integration: {}", name, integration)
         self.base_url: str = ""
 
     def _get_headers(self) -> dict[str, str]:
@@ -180,16 +182,20 @@ class APIApplication(BaseApplication):
         """Provides an initialized `httpx.Client` instance for use as a context manager.
 
         The client is configured with the `base_url` and headers derived
-        from the `_get_headers` method.
+        from the `_get_headers` method, and records the latency and status of
+        its requests in the built-in metrics.
 
         Returns:
             httpx.Client: A new `httpx.Client` instance.
         """
+        # Don't start requests for a tool call that timed out or was cancelled.
+        raise_if_cancelled()
         headers = self._get_headers()
-        with httpx.Client(
+        with InstrumentedClient(
+            self.name,
             base_url=self.base_url,
             headers=headers,
-            timeout=self.default_timeout,
+            timeout=remaining_time(self.default_timeout),
         ) as client:
             yield client
 
@@ -198,16 +204,18 @@ class APIApplication(BaseApplication):
         """Provides an initialized `httpx.AsyncClient` instance for use as a context manager.
 
         The client is configured with the `base_url` and headers derived
-        from the `_get_headers` method.
+        from the `_get_headers` method, and records the latency and status of
+        its requests in the built-in metrics.
 
         Returns:
             httpx.AsyncClient: A new `httpx.AsyncClient` instance.
         """
         headers = await self._aget_headers()
-        async with httpx.AsyncClient(
+        async with AsyncInstrumentedClient(
+            self.name,
             base_url=self.base_url,
             headers=headers,
-            timeout=self.default_timeout,
+            timeout=remaining_time(self.default_timeout),
         ) as client:
             yield client
 
@@ -253,10 +261,10 @@ class APIApplication(BaseApplication):
         Raises:
             httpx.HTTPStatusError: Propagated if the underlying client request fails.
         """
-        logger.debug(f"Making GET request to {url} with params: {params}")
+        logger.debug("Making GET request to {} with params: {}", url, params)
         with self.get_sync_client() as client:
             response = client.get(url, params=params)
-        logger.debug(f"GET request successful with status code: {response.status_code}")
+        logger.debug("GET request successful with status code: {}", response.status_code)
         return response
 
     async def _aget(self, url: str, params: dict[str, Any] | None = None) -> httpx.Response:
@@ -274,10 +282,10 @@ class APIApplication(BaseApplication):
         Raises:
             httpx.HTTPStatusError: Propagated if the underlying client request fails.
         """
-        logger.debug(f"Making async GET request to {url} with params: {params}")
+        logger.debug("Making async GET request to {} with params: {}", url, params)
         async with self.get_async_client() as client:
             response = await client.get(url, params=params)
-        logger.debug(f"Async GET request successful with status code: {response.status_code}")
+        logger.debug("Async GET request successful with status code: {}", response.status_code)
         return response
 
     def _post(
@@ -318,7 +326,12 @@ class APIApplication(BaseApplication):
             httpx.HTTPStatusError: Propagated if the underlying client request fails.
         """
         logger.debug(
-            f"Making POST request to {url} with params: {params}, data type: {type(data)}, content_type={content_type}, files: {'yes' if files else 'no'}"
+            "Making POST request to {} with params: {}, data type: {}, content_type={}, files: {}",
+            url,
+            params,
+            type(data),
+            content_type,
+            "yes" if files else "no",
         )
         with self.get_sync_client() as client:
             if content_type == "multipart/form-data":
@@ -350,7 +363,7 @@ class APIApplication(BaseApplication):
                     content=data,  # Expect data to be bytes or str
                     params=params,
                 )
-        logger.debug(f"POST request successful with status code: {response.status_code}")
+        logger.debug("POST request successful with status code: {}", response.status_code)
         return response
 
     async def _apost(
@@ -381,7 +394,12 @@ class APIApplication(BaseApplication):
             httpx.HTTPStatusError: Propagated if the underlying client request fails.
         """
         logger.debug(
-            f"Making async POST request to {url} with params: {params}, data type: {type(data)}, content_type={content_type}, files: {'yes' if files else 'no'}"
+            "Making async POST request to {} with params: {}, data type: {}, content_type={}, files: {}",
+            url,
+            params,
+            type(data),
+            content_type,
+            "yes" if files else "no",
         )
         async with self.get_async_client() as client:
             if content_type == "multipart/form-data":
@@ -413,7 +431,7 @@ class APIApplication(BaseApplication):
                     content=data,
                     params=params,
                 )
-        logger.debug(f"Async POST request successful with status code: {response.status_code}")
+        logger.debug("Async POST request successful with status code: {}", response.status_code)
         return response
 
     def _put(
@@ -454,7 +472,12 @@ class APIApplication(BaseApplication):
             httpx.HTTPStatusError: Propagated if the underlying client request fails.
         """
         logger.debug(
-            f"Making PUT request to {url} with params: {params}, data type: {type(data)}, content_type={content_type}, files: {'yes' if files else 'no'}"
+            "Making PUT request to {} with params: {}, data type: {}, content_type={}, files: {}",
+            url,
+            params,
+            type(data),
+            content_type,
+            "yes" if files else "no",
         )
         with self.get_sync_client() as client:
             if content_type == "multipart/form-data":
@@ -486,7 +509,7 @@ class APIApplication(BaseApplication):
                     content=data,  # Expect data to be bytes or str
                     params=params,
                 )
-        logger.debug(f"PUT request successful with status code: {response.status_code}")
+        logger.debug("PUT request successful with status code: {}", response.status_code)
         return response
 
     async def _aput(
@@ -513,7 +536,12 @@ class APIApplication(BaseApplication):
             httpx.HTTPStatusError: Propagated if the underlying client request fails.
         """
         logger.debug(
-            f"Making async PUT request to {url} with params: {params}, data type: {type(data)}, content_type={content_type}, files: {'yes' if files else 'no'}"
+            "Making async PUT request to {} with params: {}, data type: {}, content_type={}, files: {}",
+            url,
+            params,
+            type(data),
+            content_type,
+            "yes" if files else "no",
         )
         async with self.get_async_client() as client:
             if content_type == "multipart/form-data":
@@ -545,7 +573,7 @@ class APIApplication(BaseApplication):
                     content=data,
                     params=params,
                 )
-        logger.debug(f"Async PUT request successful with status code: {response.status_code}")
+        logger.debug("Async PUT request successful with status code: {}", response.status_code)
         return response
 
     def _delete(self, url: str, params: dict[str, Any] | None = None) -> httpx.Response:
@@ -563,12 +591,12 @@ class APIApplication(BaseApplication):
         Raises:
             httpx.HTTPStatusError: Propagated if the underlying client request fails.
         """
-        logger.debug(f"Making DELETE request to {url} with params: {params}")
+        logger.debug("Making DELETE request to {} with params: {}", url, params)
         with self.get_sync_client() as client:
             response = client.delete(
                 url, params=params
             )  # Removed redundant timeout; client is already configured with default_timeout.
-        logger.debug(f"DELETE request successful with status code: {response.status_code}")
+        logger.debug("DELETE request successful with status code: {}", response.status_code)
         return response
 
     async def _adelete(self, url: str, params: dict[str, Any] | None = None) -> httpx.Response:
@@ -584,10 +612,10 @@ class APIApplication(BaseApplication):
         Raises:
             httpx.HTTPStatusError: Propagated if the underlying client request fails.
         """
-        logger.debug(f"Making async DELETE request to {url} with params: {params}")
+        logger.debug("Making async DELETE request to {} with params: {}", url, params)
         async with self.get_async_client() as client:
             response = await client.delete(url, params=params)
-        logger.debug(f"Async DELETE request successful with status code: {response.status_code}")
+        logger.debug("Async DELETE request successful with status code: {}", response.status_code)
         return response
 
     def _patch(
@@ -611,7 +639,12 @@ class APIApplication(BaseApplication):
             httpx.Response: The raw HTTP response object.
         """
         logger.debug(
-            f"Making PATCH request to {url} with params: {params}, data type: {type(data)}, content_type={content_type}, files: {'yes' if files else 'no'}"
+            "Making PATCH request to {} with params: {}, data type: {}, content_type={}, files: {}",
+            url,
+            params,
+            type(data),
+            content_type,
+            "yes" if files else "no",
         )
         with self.get_sync_client() as client:
             if content_type == "multipart/form-data":
@@ -624,7 +657,7 @@ class APIApplication(BaseApplication):
             else:
                 headers = {"Content-Type": content_type}
                 response = client.patch(url, headers=headers, content=data, params=params)
-        logger.debug(f"PATCH request successful with status code: {response.status_code}")
+        logger.debug("PATCH request successful with status code: {}", response.status_code)
         return response
 
     async def _apatch(
@@ -648,7 +681,12 @@ class APIApplication(BaseApplication):
             httpx.Response: The raw HTTP response object.
         """
         logger.debug(
-            f"Making async PATCH request to {url} with params: {params}, data type: {type(data)}, content_type={content_type}, files: {'yes' if files else 'no'}"
+            "Making async PATCH request to {} with params: {}, data type: {}, content_type={}, files: {}",
+            url,
+            params,
+            type(data),
+            content_type,
+            "yes" if files else "no",
         )
         async with self.get_async_client() as client:
             if content_type == "multipart/form-data":
@@ -661,7 +699,7 @@ class APIApplication(BaseApplication):
             else:
                 headers = {"Content-Type": content_type}
                 response = await client.patch(url, headers=headers, content=data, params=params)
-        logger.debug(f"Async PATCH request successful with status code: {response.status_code}")
+        logger.debug("Async PATCH request successful with status code: {}", response.status_code)
         return response
 
 
@@ -709,7 +747,7 @@ class GraphQLApplication(BaseApplication):
         self.base_url = base_url
         self.integration = integration
         self.default_timeout: float = DEFAULT_API_TIMEOUT
-        logger.debug(f"Initializing Application '{name}' with kwargs: {kwargs}")
+        logger.debug("Initializing Application '{}' with kwargs: {}", name, kwargs)
 
     def _get_headers(self) -> dict[str, str]:
         """Constructs HTTP headers for GraphQL requests based on the integration.
@@ -727,7 +765,7 @@ class GraphQLApplication(BaseApplication):
             logger.debug("No integration configured, returning empty headers")
             return {}
         credentials = self.integration.get_credentials()
-        logger.debug(f"Got credentials for integration: {credentials.keys()}")
+        logger.debug("Got credentials for integration: {}", credentials.keys())
 
         # Check if direct headers are provided
         headers = credentials.get("headers")
@@ -763,7 +801,7 @@ class GraphQLApplication(BaseApplication):
             logger.debug("No integration configured, returning empty headers")
             return {}
         credentials = await self.integration.get_credentials_async()
-        logger.debug(f"Got credentials for integration: {credentials.keys()}")
+        logger.debug("Got credentials for integration: {}", credentials.keys())
 
         # Check if direct headers are provided
         headers = credentials.get("headers")
@@ -790,7 +828,7 @@ class GraphQLApplication(BaseApplication):
         return {}
 
     @contextmanager
-    def client(self) -> GraphQLClient:
+    def client(self) -> "GraphQLClient":
         """Provides an initialized `gql.Client` instance.
 
         If a client was not provided during initialization or has not been
@@ -802,13 +840,16 @@ class GraphQLApplication(BaseApplication):
         Returns:
             GraphQLClient: The active `gql.Client` instance.
         """
+        from gql import Client as GraphQLClient
+        from gql.transport.requests import RequestsHTTPTransport
+
         headers = self._get_headers()
         transport = RequestsHTTPTransport(url=self.base_url, headers=headers)
         with GraphQLClient(transport=transport, fetch_schema_from_transport=True) as client:
             yield client
 
     @asynccontextmanager
-    async def async_client(self) -> GraphQLClient:
+    async def async_client(self) -> "GraphQLClient":
         """Provides an initialized async `gql.Client` instance.
 
         If a client was not provided during initialization or has not been
@@ -820,6 +861,9 @@ class GraphQLApplication(BaseApplication):
         Returns:
             GraphQLClient: The active async `gql.Client` instance.
         """
+        from gql import Client as GraphQLClient
+        from gql.transport.aiohttp import AIOHTTPTransport
+
         headers = await self._aget_headers()
         transport = AIOHTTPTransport(url=self.base_url, headers=headers)
         async with GraphQLClient(transport=transport, fetch_schema_from_transport=True) as client:
@@ -827,7 +871,7 @@ class GraphQLApplication(BaseApplication):
 
     def mutate(
         self,
-        mutation: str | DocumentNode,
+        mutation: "str | DocumentNode",
         variables: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Executes a GraphQL mutation.
@@ -847,13 +891,15 @@ class GraphQLApplication(BaseApplication):
                        (e.g., network issue, GraphQL server error).
         """
         if isinstance(mutation, str):
+            from gql import gql
+
             mutation = gql(mutation)
         with self.client() as client:
             return client.execute(mutation, variable_values=variables)
 
     async def mutate_async(
         self,
-        mutation: str | DocumentNode,
+        mutation: "str | DocumentNode",
         variables: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Executes a GraphQL mutation asynchronously.
@@ -873,13 +919,15 @@ class GraphQLApplication(BaseApplication):
                        (e.g., network issue, GraphQL server error).
         """
         if isinstance(mutation, str):
+            from gql import gql
+
             mutation = gql(mutation)
         async with self.async_client() as client:
             return await client.execute(mutation, variable_values=variables)
 
     def query(
         self,
-        query: str | DocumentNode,
+        query: "str | DocumentNode",
         variables: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Executes a GraphQL query.
@@ -899,13 +947,15 @@ class GraphQLApplication(BaseApplication):
                                (e.g., network issue, GraphQL server error).
         """
         if isinstance(query, str):
+            from gql import gql
+
             query = gql(query)
         with self.client() as client:
             return client.execute(query, variable_values=variables)
 
     async def query_async(
         self,
-        query: str | DocumentNode,
+        query: "str | DocumentNode",
         variables: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Executes a GraphQL query asynchronously.
@@ -925,6 +975,8 @@ class GraphQLApplication(BaseApplication):
                                (e.g., network issue, GraphQL server error).
         """
         if isinstance(query, str):
+            from gql import gql
+
             query = gql(query)
         async with self.async_client() as client:
             return await client.execute(query, variable_values=variables)
@@ -1,10 +1,20 @@
+import asyncio
 import threading
 import time
-from http.server import BaseHTTPRequestHandler, HTTPServer
-from typing import Any
+from collections import OrderedDict
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, ClassVar
 from urllib.parse import parse_qs, urlparse
 
-from universal_mcp.utils.singleton import Singleton
+from loguru import logger
+
+DEFAULT_CALLBACK_PORT = 3000
+CALLBACK_PATH = "/callback"
+# Callbacks arriving before their flow registers are kept this long, and at most this many at once.
+UNCLAIMED_CALLBACK_TTL = 60  # seconds
+MAX_UNCLAIMED_CALLBACKS = 16
 
 
 class CallbackHandler(BaseHTTPRequestHandler):
@@ -16,7 +26,8 @@ class CallbackHandler(BaseHTTPRequestHandler):
     `callback_data` dictionary.
 
     It sends a simple HTML response to the user's browser indicating
-    success or failure of the authorization attempt.
+    success or failure of the authorization attempt. Callbacks are then
+    routed to the pending flow matching their `state`, if any.
     """
 
     def __init__(self, request, client_address, server, callback_data: dict):
@@ -43,9 +54,11 @@ class CallbackHandler(BaseHTTPRequestHandler):
         parsed = urlparse(self.path)
         query_params = parse_qs(parsed.query)
 
+        state = query_params.get("state", [None])[0]
         if "code" in query_params:
             self.callback_data["authorization_code"] = query_params["code"][0]
-            self.callback_data["state"] = query_params.get("state", [None])[0]
+            self.callback_data["state"] = state
+            self.server.resolve_flow(state, code=query_params["code"][0])
             self.send_response(200)
             self.send_header("Content-type", "text/html")
             self.end_headers()
@@ -60,6 +73,7 @@ class CallbackHandler(BaseHTTPRequestHandler):
             """)
         elif "error" in query_params:
             self.callback_data["error"] = query_params["error"][0]
+            self.server.resolve_flow(state, error=query_params["error"][0])
             self.send_response(400)
             self.send_header("Content-type", "text/html")
             self.end_headers()
@@ -87,47 +101,90 @@ class CallbackHandler(BaseHTTPRequestHandler):
         pass
 
 
-class CallbackServer(metaclass=Singleton):
-    """A singleton HTTP server to manage OAuth 2.0 redirect callbacks.
+class _CallbackHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], handler_class: type, callback_server: "CallbackServer"):
+        self.callback_server = callback_server
+        super().__init__(address, handler_class)
+
+    def resolve_flow(self, state: str | None, code: str | None = None, error: str | None = None) -> None:
+        self.callback_server._resolve_flow(state, code=code, error=error)
+
 
-    This server runs in a background thread, listening on a specified
-    localhost port. It uses the `CallbackHandler` to capture the
-    authorization code or error returned by an OAuth 2.0 provider
-    after user authentication.
+class CallbackServer:
+    """An HTTP server receiving OAuth 2.0 redirect callbacks on localhost.
 
-    Being a Singleton, only one instance of this server will run per
-    application, even if instantiated multiple times.
+    The server runs in a background thread and can serve several
+    authorization flows at once: each flow registers the `state` it sent
+    in its authorization URL with `expect_callback`, and the callback
+    carrying that state resolves the flow's future. A flow registered
+    without a state only receives callbacks without a state. Callbacks
+    arriving before their flow is registered are kept for it, up to
+    `MAX_UNCLAIMED_CALLBACKS` for `UNCLAIMED_CALLBACK_TTL` seconds.
+
+    Waiting for a callback never polls: synchronous callers block on the
+    flow's future and async callers await it.
 
     Attributes:
-        port (int): The port number on localhost where the server listens.
+        port (int): The port on localhost the server listens on. 0 picks a
+            free port when the server starts; `redirect_uri` then reflects the
+            actual port.
         server (HTTPServer | None): The underlying `HTTPServer` instance.
             None if the server is not running.
         thread (threading.Thread | None): The background thread in which
             the server runs. None if the server is not running.
-        callback_data (dict): A dictionary to store data received from the
-            OAuth callback (e.g., `authorization_code`, `state`, `error`).
-            This is shared with the `CallbackHandler`.
-        _running (bool): A flag indicating whether the server is currently
-            started and listening.
+        callback_data (dict): The last data received from an OAuth callback
+            (e.g., `authorization_code`, `state`, `error`).
     """
 
-    def __init__(self, port: int = 3000):
+    _shared: ClassVar["CallbackServer | None"] = None
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, port: int = 0, host: str = "localhost", fallback_to_free_port: bool = True):
         """Initializes the CallbackServer.
 
         Args:
             port (int, optional): The port number on localhost for the server
-                to listen on. Defaults to 3000.
+                to listen on. Defaults to 0, a free port chosen by the OS.
+            host (str, optional): The interface to listen on. Defaults to localhost.
+            fallback_to_free_port (bool, optional): Listen on a free port if
+                `port` is already in use. Defaults to True.
         """
         self.port = port
-        self.server = None
-        self.thread = None
+        self.host = host
+        self.fallback_to_free_port = fallback_to_free_port
+        self.server: _CallbackHTTPServer | None = None
+        self.thread: threading.Thread | None = None
         self.callback_data = {"authorization_code": None, "state": None, "error": None}
+        self._flows: dict[str | None, Future[tuple[str, str | None]]] = {}
+        # Early callbacks by state: (expiry time, code, error), oldest first.
+        self._unclaimed: OrderedDict[str | None, tuple[float, str | None, str | None]] = OrderedDict()
+        self._lock = threading.Lock()
         self._running = False
 
+    @classmethod
+    def shared(cls) -> "CallbackServer":
+        """Get the callback server shared by all clients of this process.
+
+        It prefers `DEFAULT_CALLBACK_PORT`, so redirect URIs registered with
+        authorization servers stay stable across runs, and falls back to a
+        free port if it is taken.
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls(port=DEFAULT_CALLBACK_PORT)
+            return cls._shared
+
     @property
     def is_running(self) -> bool:
         return self._running
 
+    @property
+    def redirect_uri(self) -> str:
+        """The redirect URI to register with the authorization server."""
+        return f"http://{self.host}:{self.port}{CALLBACK_PATH}"
+
     def _create_handler_with_data(self):
         """Creates a `CallbackHandler` subclass with shared `callback_data`.
 
@@ -156,37 +213,122 @@ class CallbackServer(metaclass=Singleton):
         daemon thread. This allows the main application flow to continue
         while waiting for the OAuth callback.
         """
-        if self._running:
-            return
-        handler_class = self._create_handler_with_data()
-        self.server = HTTPServer(("localhost", self.port), handler_class)
-        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
-        self.thread.start()
-        print(f"🖥️  Started callback server on http://localhost:{self.port}")
-        self._running = True
+        with self._lock:
+            if self._running:
+                return
+            handler_class = self._create_handler_with_data()
+            try:
+                self.server = _CallbackHTTPServer((self.host, self.port), handler_class, self)
+            except OSError as e:
+                if not self.port or not self.fallback_to_free_port:
+                    raise
+                logger.warning(f"Callback port {self.port} is unavailable ({e}), using a free port instead")
+                self.server = _CallbackHTTPServer((self.host, 0), handler_class, self)
+            self.port = self.server.server_address[1]
+            self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+            self.thread.start()
+            logger.info(f"Started callback server on http://{self.host}:{self.port}")
+            self._running = True
 
     def stop(self):
         """Stops the HTTP callback server and cleans up resources.
 
         Shuts down the `HTTPServer` and waits for its background thread
-        to complete.
+        to complete. Flows still waiting for a callback fail.
         """
+        with self._lock:
+            flows = self._stop_locked()
+        for future in flows:
+            if not future.done():
+                future.set_exception(Exception("OAuth callback server stopped"))
+
+    def stop_if_idle(self) -> None:
+        """Stops the server unless another flow is still waiting for its callback."""
+        with self._lock:
+            # Checked and stopped under one lock hold, so a flow registering meanwhile is never failed.
+            if not self._flows:
+                self._stop_locked()
+
+    def _stop_locked(self) -> list[Future[tuple[str, str | None]]]:
+        """Stops the server with the lock held and returns the flows that were waiting."""
         if self.server:
             self.server.shutdown()
             self.server.server_close()
+            self.server = None
         if self.thread:
             self.thread.join(timeout=1)
+            self.thread = None
+        self._running = False
+        flows, self._flows = self._flows, {}
+        self._unclaimed.clear()
+        return list(flows.values())
+
+    def expect_callback(self, state: str | None = None) -> Future[tuple[str, str | None]]:
+        """Registers an authorization flow waiting for its callback.
 
-    def wait_for_callback(self, timeout: int = 300) -> str:
+        Args:
+            state: The `state` parameter of the flow's authorization URL, or
+                None to receive callbacks without a state.
+
+        Returns:
+            A future resolved with the authorization code and state, or
+            failed with the OAuth error.
+        """
+        with self._lock:
+            future = self._flows.get(state)
+            if future is not None and not future.done():
+                return future
+            future = Future()
+            self._prune_unclaimed()
+            expires_at, code, error = self._unclaimed.pop(state, (0.0, None, None))
+            if expires_at > time.monotonic():
+                self._complete(future, state, code, error)
+            else:
+                self._flows[state] = future
+            return future
+
+    @staticmethod
+    def _complete(future: Future, state: str | None, code: str | None, error: str | None) -> None:
+        if error is not None:
+            future.set_exception(Exception(f"OAuth error: {error}"))
+        else:
+            future.set_result((code, state))
+
+    def _prune_unclaimed(self) -> None:
+        now = time.monotonic()
+        while self._unclaimed and next(iter(self._unclaimed.values()))[0] <= now:
+            self._unclaimed.popitem(last=False)
+
+    def _resolve_flow(self, state: str | None, code: str | None = None, error: str | None = None) -> None:
+        with self._lock:
+            future = self._flows.pop(state, None)
+            if future is None or future.done():
+                # Never handed to another flow: it may be an early callback, or a forged one.
+                logger.debug("Keeping OAuth callback for a flow that is not registered yet")
+                self._prune_unclaimed()
+                self._unclaimed.pop(state, None)
+                self._unclaimed[state] = (time.monotonic() + UNCLAIMED_CALLBACK_TTL, code, error)
+                while len(self._unclaimed) > MAX_UNCLAIMED_CALLBACKS:
+                    self._unclaimed.popitem(last=False)
+                return
+        self._complete(future, state, code, error)
+
+    def _discard_flow(self, state: str | None, future: Future) -> None:
+        with self._lock:
+            if self._flows.get(state) is future:
+                del self._flows[state]
+
+    def wait_for_callback(self, timeout: int = 300, state: str | None = None) -> str:
         """Waits for the OAuth callback to provide an authorization code.
 
-        This method polls the `self.callback_data` dictionary until an
-        authorization code is received or an error is reported by the
-        `CallbackHandler`, or until the timeout is reached.
+        Blocks the calling thread; async code should use
+        `wait_for_callback_async` instead.
 
         Args:
             timeout (int, optional): The maximum time in seconds to wait
                 for the callback. Defaults to 300 seconds (5 minutes).
+            state (str | None, optional): The state of the flow to wait for.
+                Defaults to the flow without a state.
 
         Returns:
             str: The received authorization code.
@@ -197,14 +339,37 @@ class CallbackServer(metaclass=Singleton):
             Exception: If the timeout is reached before a code or error
                        is received (e.g., "Timeout waiting for OAuth callback").
         """
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            if self.callback_data["authorization_code"]:
-                return self.callback_data["authorization_code"]
-            elif self.callback_data["error"]:
-                raise Exception(f"OAuth error: {self.callback_data['error']}")
-            time.sleep(0.1)
-        raise Exception("Timeout waiting for OAuth callback")
+        future = self.expect_callback(state)
+        try:
+            code, _ = future.result(timeout=timeout)
+        except FutureTimeoutError:
+            self._discard_flow(state, future)
+            raise Exception("Timeout waiting for OAuth callback") from None
+        return code
+
+    async def wait_for_callback_async(self, timeout: float = 300, state: str | None = None) -> tuple[str, str | None]:
+        """Waits for the OAuth callback without blocking the event loop.
+
+        Args:
+            timeout (float, optional): The maximum time in seconds to wait
+                for the callback. Defaults to 300 seconds (5 minutes).
+            state (str | None, optional): The state of the flow to wait for.
+                Defaults to the flow without a state.
+
+        Returns:
+            tuple[str, str | None]: The received authorization code and state.
+
+        Raises:
+            Exception: If an error is reported in the callback.
+            Exception: If the timeout is reached before a code or error is received.
+        """
+        future = self.expect_callback(state)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except TimeoutError:
+            raise Exception("Timeout waiting for OAuth callback") from None
+        finally:
+            self._discard_flow(state, future)
 
     def get_state(self) -> str | None:
         """Retrieves the 'state' parameter received during the OAuth callback.
@@ -0,0 +1,169 @@
+import itertools
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from loguru import logger
+
+BalancingStrategy = Literal["least_outstanding", "round_robin"]
+
+EJECTION_THRESHOLD = 3  # consecutive failures before a replica is ejected
+EJECTION_COOLDOWN = 30  # seconds an ejected replica is skipped
+LATENCY_EWMA_ALPHA = 0.2
+
+
+@dataclass
+class ReplicaStats:
+    """Routing statistics of a single replica."""
+
+    outstanding: int = 0
+    requests: int = 0
+    errors: int = 0
+    consecutive_failures: int = 0
+    last_latency: float | None = None
+    ewma_latency: float | None = None
+    ejected_until: float = 0.0
+
+    @property
+    def is_ejected(self) -> bool:
+        return self.ejected_until > time.monotonic()
+
+    def record(self, latency: float, success: bool) -> None:
+        """Records the outcome of a request."""
+        self.requests += 1
+        self.last_latency = latency
+        if self.ewma_latency is None:
+            self.ewma_latency = latency
+        else:
+            self.ewma_latency += LATENCY_EWMA_ALPHA * (latency - self.ewma_latency)
+        if success:
+            self.consecutive_failures = 0
+            self.ejected_until = 0.0
+            return
+        self.errors += 1
+        self.consecutive_failures += 1
+        if self.consecutive_failures >= EJECTION_THRESHOLD:
+            self.ejected_until = time.monotonic() + EJECTION_COOLDOWN
+
+
+class ReplicaPool:
+    """
+    Routes requests across interchangeable replicas.
+
+    Replicas that fail `EJECTION_THRESHOLD` times in a row are skipped for
+    `EJECTION_COOLDOWN` seconds, as are replicas reported unavailable by
+    `is_available`. If no replica is eligible, the one whose ejection ends
+    first is used rather than failing outright.
+    """
+
+    def __init__(
+        self,
+        strategy: BalancingStrategy = "least_outstanding",
+        is_available: Callable[[Any], bool] | None = None,
+    ):
+        """
+        Args:
+            strategy: How to pick among eligible replicas.
+            is_available: Optional health check, e.g. whether the replica is connected.
+        """
+        if strategy not in ("least_outstanding", "round_robin"):
+            raise ValueError(f"Invalid balancing strategy: {strategy}")
+        self.strategy = strategy
+        self.is_available = is_available
+        self.replicas: list[Any] = []
+        self._stats: dict[int, ReplicaStats] = {}
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self.replicas)
+
+    def add(self, replica: Any) -> None:
+        if replica not in self.replicas:
+            self.replicas.append(replica)
+            self._stats[id(replica)] = ReplicaStats()
+
+    def remove(self, replica: Any) -> None:
+        if replica in self.replicas:
+            self.replicas.remove(replica)
+            del self._stats[id(replica)]
+
+    def stats(self, replica: Any) -> ReplicaStats:
+        return self._stats[id(replica)]
+
+    def _is_eligible(self, replica: Any) -> bool:
+        if self._stats[id(replica)].is_ejected:
+            return False
+        return self.is_available is None or self.is_available(replica)
+
+    def select(self) -> Any:
+        """
+        Picks the replica to send the next request to.
+
+        Raises:
+            LookupError: If the pool is empty.
+        """
+        if not self.replicas:
+            raise LookupError("Replica pool is empty")
+        eligible = [replica for replica in self.replicas if self._is_eligible(replica)]
+        if not eligible:
+            replica = min(self.replicas, key=lambda r: self._stats[id(r)].ejected_until)
+            logger.warning("No healthy replica available, falling back to the least recently ejected one")
+            return replica
+        if self.strategy == "round_robin":
+            return eligible[next(self._counter) % len(eligible)]
+        # Ties go to the replica seen first, which keeps single-request traffic on the primary.
+        return min(eligible, key=lambda r: self._stats[id(r)].outstanding)
+
+    def assign(self, count: int) -> list[Any]:
+        """
+        Picks the replicas for `count` requests about to be sent together.
+
+        Each pick counts as outstanding for the next ones, so the requests are
+        spread as if they had been selected one after the other while in flight.
+
+        Raises:
+            LookupError: If the pool is empty.
+        """
+        replicas = []
+        try:
+            for _ in range(count):
+                replica = self.select()
+                self._stats[id(replica)].outstanding += 1
+                replicas.append(replica)
+        finally:
+            for replica in replicas:
+                self._stats[id(replica)].outstanding -= 1
+        return replicas
+
+    @contextmanager
+    def acquire(self, replica: Any = None) -> Iterator[tuple[Any, Callable[[bool], None]]]:
+        """
+        Selects a replica and tracks the request sent to it.
+
+        Yields the replica and a callback to report whether the request
+        succeeded; a request leaving the block with an exception counts as failed.
+
+        Args:
+            replica: Replica picked beforehand, e.g. by `assign`. Selected now if
+                None or no longer in the pool.
+        """
+        if replica is None or replica not in self.replicas:
+            replica = self.select()
+        stats = self._stats[id(replica)]
+        outcome = {"success": True}
+
+        def report(success: bool) -> None:
+            outcome["success"] = success
+
+        stats.outstanding += 1
+        start = time.perf_counter()
+        try:
+            yield replica, report
+        except BaseException:
+            outcome["success"] = False
+            raise
+        finally:
+            stats.outstanding -= 1
+            stats.record(time.perf_counter() - start, outcome["success"])
@@ -0,0 +1,76 @@
+import json
+import time
+from collections import OrderedDict
+from typing import Any
+
+from mcp.types import CallToolResult as MCPCallToolResult
+
+DEFAULT_RESULT_CACHE_SIZE = 1024
+
+
+def canonical_arguments(arguments: dict[str, Any]) -> str:
+    """Serialize tool arguments so that equal arguments always give the same string."""
+    return json.dumps(arguments, sort_keys=True, separators=(",", ":"), default=str)
+
+
+class ToolResultCache:
+    """Bounded LRU cache of tool call results with a time to live.
+
+    Keyed by the tool name and the canonical JSON form of the arguments.
+    Error results are never stored.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = DEFAULT_RESULT_CACHE_SIZE):
+        """
+        Args:
+            ttl: Seconds a result stays valid.
+            maxsize: Maximum number of stored results; the least recently used is evicted first.
+        """
+        if ttl <= 0 or maxsize <= 0:
+            raise ValueError("Result cache ttl and maxsize must be positive")
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[str, str], tuple[float, MCPCallToolResult]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, tool_name: str, arguments: dict[str, Any]) -> MCPCallToolResult | None:
+        """Get a copy of a stored result, or None if missing or expired."""
+        key = (tool_name, canonical_arguments(arguments))
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        # Deep copies: callers may modify the result's content items.
+        return entry[1].model_copy(deep=True)
+
+    def set(self, tool_name: str, arguments: dict[str, Any], result: MCPCallToolResult) -> None:
+        """Store a copy of the result of a successful call."""
+        if result.isError:
+            return
+        key = (tool_name, canonical_arguments(arguments))
+        self._entries[key] = (time.monotonic() + self.ttl, result.model_copy(deep=True))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, tool_name: str | None = None) -> None:
+        """Drop the stored results of one tool, or of all tools."""
+        if tool_name is None:
+            self._entries.clear()
+            return
+        for key in [key for key in self._entries if key[0] == tool_name]:
+            del self._entries[key]
+
+    def stats(self) -> dict[str, int]:
+        """Get the hit, miss and eviction counters and the current size."""
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "size": len(self._entries)}
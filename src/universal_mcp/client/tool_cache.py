@@ -0,0 +1,106 @@
+import hashlib
+import json
+import os
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+from mcp.types import Tool as MCPTool
+
+TOOL_LIST_CACHE_VERSION = 1
+
+
+def get_default_tool_list_cache_dir() -> Path:
+    """Get the directory where the tool lists of remote MCP servers are cached."""
+    return Path.home() / ".universal-mcp" / "cache" / "tool_lists"
+
+
+def _mcp_version() -> str:
+    try:
+        return metadata.version("mcp")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _config_dict(config: Any) -> Any:
+    if hasattr(config, "model_dump"):
+        return config.model_dump(mode="json")
+    return config
+
+
+class ToolListCache:
+    """On-disk cache of the tool list of each remote MCP server.
+
+    Entries are keyed by a hash of the server name and its transport
+    configuration, so changing the command, URL or headers of a server
+    never serves a stale list. Only the hash is stored, not the
+    configuration itself.
+    """
+
+    def __init__(self, directory: Path | None = None):
+        """
+        Args:
+            directory: Directory holding cached tool lists. Defaults to `get_default_tool_list_cache_dir()`.
+        """
+        self.directory = directory or get_default_tool_list_cache_dir()
+
+    @staticmethod
+    def cache_key(name: str, config: Any) -> str:
+        """Hash a server name and transport configuration into a cache key."""
+        key = json.dumps(
+            {
+                "version": TOOL_LIST_CACHE_VERSION,
+                "mcp": _mcp_version(),
+                "name": name,
+                "config": _config_dict(config),
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(key.encode()).hexdigest()[:32]
+
+    def _path(self, name: str, config: Any) -> Path:
+        return self.directory / f"{self.cache_key(name, config)}.json"
+
+    def get(self, name: str, config: Any) -> list[MCPTool] | None:
+        """Get the cached tools of a server, or None if there is no usable entry.
+
+        Args:
+            name: The server name.
+            config: The transport configuration of the server.
+        """
+        path = self._path(name, config)
+        if not path.exists():
+            return None
+        try:
+            data = json.loads(path.read_text())
+            return [MCPTool.model_validate(tool) for tool in data["tools"]]
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable tool list cache {path}: {e}")
+            return None
+
+    def set(self, name: str, config: Any, tools: list[MCPTool]) -> None:
+        """Store the tools of a server.
+
+        Args:
+            name: The server name.
+            config: The transport configuration of the server.
+            tools: The tools listed by the server.
+        """
+        path = self._path(name, config)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(
+                json.dumps(
+                    {"tools": [tool.model_dump(mode="json", by_alias=True, exclude_none=True) for tool in tools]}
+                )
+            )
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to save tool list cache {path}: {e}")
+
+    def delete(self, name: str, config: Any) -> None:
+        """Remove the cached tools of a server, if any."""
+        self._path(name, config).unlink(missing_ok=True)
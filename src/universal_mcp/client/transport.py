@@ -1,7 +1,13 @@
+import asyncio
+import json
 import os
 import webbrowser
-from contextlib import AsyncExitStack
-from typing import Any, Literal, Self
+from collections.abc import Awaitable, Callable, Sequence
+from contextlib import AsyncExitStack, suppress
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal, Self
+from urllib.parse import parse_qs, urlparse
 
 from loguru import logger
 from mcp import ClientSession, StdioServerParameters
@@ -10,19 +16,52 @@ from mcp.client.sse import sse_client
 from mcp.client.stdio import stdio_client
 from mcp.client.streamable_http import streamablehttp_client
 from mcp.shared.auth import OAuthClientMetadata
+from mcp.shared.exceptions import McpError
+from mcp.shared.session import RequestResponder
+from mcp.types import (
+    CONNECTION_CLOSED,
+    ClientResult,
+    ServerNotification,
+    ServerRequest,
+    ToolListChangedNotification,
+)
 from mcp.types import (
     CallToolResult as MCPCallToolResult,
 )
 from mcp.types import (
     Tool as MCPTool,
 )
-from openai.types.chat import ChatCompletionToolParam
 
 from universal_mcp.client.oauth import CallbackServer
+from universal_mcp.client.replicas import BalancingStrategy, ReplicaPool, ReplicaStats
+from universal_mcp.client.result_cache import DEFAULT_RESULT_CACHE_SIZE, ToolResultCache
 from universal_mcp.client.token_store import TokenStore
+from universal_mcp.client.tool_cache import ToolListCache
 from universal_mcp.config import ClientConfig, ClientTransportConfig
 from universal_mcp.stores.store import KeyringStore
 from universal_mcp.tools.adapters import transform_mcp_tool_to_openai_tool
+from universal_mcp.tools.batch import (
+    DEFAULT_BATCH_CONCURRENCY,
+    DEFAULT_BATCH_GROUP_CONCURRENCY,
+    ToolCall,
+    ToolCallResult,
+    run_grouped_calls,
+)
+from universal_mcp.utils.tracing import inject_trace_context, start_span
+
+if TYPE_CHECKING:
+    from openai.types.chat import ChatCompletionToolParam
+
+DEFAULT_CONNECT_TIMEOUT = 60  # seconds
+DEFAULT_LIST_TOOLS_TIMEOUT = 30  # seconds
+OAUTH_CALLBACK_TIMEOUT = 300  # seconds
+DEFAULT_HEALTH_CHECK_INTERVAL = 30  # seconds
+HEALTH_CHECK_TIMEOUT = 10  # seconds
+RECONNECT_INITIAL_BACKOFF = 1  # seconds
+RECONNECT_MAX_BACKOFF = 60  # seconds
+RECONNECT_WAIT_TIMEOUT = 30  # seconds a call waits for a dropped session to come back
+# Transports whose tool lists are cached on disk: listing a remote server costs a round trip.
+CACHED_TOOL_LIST_TRANSPORTS = ("sse", "streamable_http")
 
 
 class ClientTransport:
@@ -35,16 +74,38 @@ class ClientTransport:
     available on the server and calling them.
     """
 
-    def __init__(self, name: str, config: ClientTransportConfig) -> None:
+    def __init__(
+        self,
+        name: str,
+        config: ClientTransportConfig,
+        health_check_interval: float | None = DEFAULT_HEALTH_CHECK_INTERVAL,
+    ) -> None:
+        """
+        Args:
+            name: The server name.
+            config: The transport configuration of the server.
+            health_check_interval: Seconds between pings of a session opened with `connect`, or None to disable.
+        """
         self.name: str = name
         self.config: ClientTransportConfig = config
         self.session: ClientSession | None = None
         self.server_url: str = config.url
+        self.health_check_interval = health_check_interval
+        self._session_task: asyncio.Task | None = None
+        self._session_stop: asyncio.Event | None = None
+        self._session_wakeup = asyncio.Event()
+        self._session_ready = asyncio.Event()
+        # Tools that can safely be retried after a reconnect, from the last listing.
+        self._idempotent_tools: set[str] = set()
+        # Called when the server notifies that its tool list changed.
+        self.on_tools_changed: Callable[[ClientTransport], Awaitable[None]] | None = None
+        self._notification_tasks: set[asyncio.Task] = set()
 
         # Create OAuth authentication handler if needed
         if self.server_url and not getattr(self.config, "headers", None):
-            # Set up callback server
-            self._callback_server = CallbackServer(port=3000)
+            # Callbacks of concurrent flows share one server and are routed by state
+            self._callback_server = CallbackServer.shared()
+            self._oauth_state: str | None = None
             self.store: KeyringStore | None = KeyringStore(self.name)
             self.auth: OAuthClientProvider | None = OAuthClientProvider(
                 server_url="/".join(self.server_url.split("/")[:-1]),
@@ -65,20 +126,28 @@ class ClientTransport:
         return self._callback_server
 
     async def _callback_handler(self) -> tuple[str, str | None]:
-        """Handles the OAuth callback by waiting for and returning auth details."""
+        """
+        Handles the OAuth callback by waiting for and returning auth details.
+
+        Awaits the callback without blocking the event loop, so other clients
+        keep connecting and serving calls while the user authorizes.
+        """
         logger.info("⏳ Waiting for authorization callback...")
         try:
-            auth_code = self.callback_server.wait_for_callback(timeout=300)
-            return auth_code, self.callback_server.get_state()
+            return await self.callback_server.wait_for_callback_async(
+                timeout=OAUTH_CALLBACK_TIMEOUT, state=self._oauth_state
+            )
         finally:
-            self.callback_server.stop()
+            self._oauth_state = None
+            # Shutting the HTTP server down waits for its serve loop to notice.
+            await asyncio.to_thread(self.callback_server.stop_if_idle)
 
     @property
     def client_metadata_dict(self) -> dict[str, Any]:
         """Provides OAuth 2.0 client metadata for registration or authentication."""
         return {
             "client_name": self.name,
-            "redirect_uris": [self.callback_server.redirect_uri],  # type: ignore
+            "redirect_uris": [self.callback_server.redirect_uri],
             "grant_types": ["authorization_code", "refresh_token"],
             "response_types": ["code"],
             "token_endpoint_auth_method": "client_secret_post",
@@ -86,6 +155,9 @@ class ClientTransport:
 
     async def _default_redirect_handler(self, authorization_url: str) -> None:
         """Default handler for OAuth redirects; opens URL in a web browser."""
+        # Register the flow before the browser can hit the callback server.
+        self._oauth_state = parse_qs(urlparse(authorization_url).query).get("state", [None])[0]
+        self.callback_server.expect_callback(self._oauth_state)
         logger.info(f"Opening browser for authorization: {authorization_url}")
         webbrowser.open(authorization_url)
 
@@ -112,7 +184,9 @@ class ClientTransport:
                 )
                 stdio_transport = await exit_stack.enter_async_context(stdio_client(server_params))
                 read, write = stdio_transport
-                session = await exit_stack.enter_async_context(ClientSession(read, write))
+                session = await exit_stack.enter_async_context(
+                    ClientSession(read, write, message_handler=self._message_handler)
+                )
                 await session.initialize()
             elif transport == "streamable_http":
                 url = self.config.get("url")
@@ -123,7 +197,9 @@ class ClientTransport:
                     streamablehttp_client(url=url, headers=headers, auth=self.auth)
                 )
                 read, write, _ = streamable_http_transport
-                session = await exit_stack.enter_async_context(ClientSession(read, write))
+                session = await exit_stack.enter_async_context(
+                    ClientSession(read, write, message_handler=self._message_handler)
+                )
                 await session.initialize()
             elif transport == "sse":
                 url = self.config.get("url")
@@ -134,7 +210,9 @@ class ClientTransport:
                     sse_client(url=url, headers=headers, auth=self.auth)
                 )
                 read, write = sse_transport
-                session = await exit_stack.enter_async_context(ClientSession(read, write))
+                session = await exit_stack.enter_async_context(
+                    ClientSession(read, write, message_handler=self._message_handler)
+                )
                 await session.initialize()
             else:
                 raise ValueError(f"Unknown transport: {transport}")
@@ -145,23 +223,198 @@ class ClientTransport:
             logger.error(f"Error initializing server {self.name}: {e}")
             raise
 
+    async def _message_handler(
+        self,
+        message: RequestResponder[ServerRequest, ClientResult] | ServerNotification | Exception,
+    ) -> None:
+        """Dispatches `notifications/tools/list_changed` to `on_tools_changed`."""
+        if not isinstance(message, ServerNotification) or not isinstance(message.root, ToolListChangedNotification):
+            return
+        logger.info(f"Tool list changed on client {self.name}")
+        self._notify_tools_changed()
+
+    async def connect(self, timeout: float | None = DEFAULT_CONNECT_TIMEOUT) -> None:
+        """
+        Connects to the MCP server in a background task that owns the session.
+
+        The transport and session contexts are entered and exited by the same
+        task, so several clients can connect concurrently. Clients using OAuth
+        get at least `OAUTH_CALLBACK_TIMEOUT` to let the user authorize.
+
+        Args:
+            timeout: Maximum time in seconds to wait for the session to be ready, or None to wait forever.
+
+        Raises:
+            TimeoutError: If the server did not become ready in time.
+            Exception: Any error raised while initializing the connection.
+        """
+        if self._session_task is not None:
+            return
+        if timeout is not None and self.auth is not None:
+            timeout = max(timeout, OAUTH_CALLBACK_TIMEOUT)
+
+        ready: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._session_stop = asyncio.Event()
+        self._session_task = asyncio.create_task(self._run_session(ready, self._session_stop))
+        try:
+            await asyncio.wait_for(asyncio.shield(ready), timeout)
+        except BaseException:
+            await self.close()
+            raise
+
+    async def _run_session(self, ready: asyncio.Future[None], stop: asyncio.Event) -> None:
+        """Holds the connection open until `stop` is set, reconnecting with backoff when it drops."""
+        backoff = RECONNECT_INITIAL_BACKOFF
+        while not stop.is_set():
+            try:
+                async with AsyncExitStack() as exit_stack:
+                    await self.initialize(exit_stack)
+                    self._session_ready.set()
+                    if ready.done():
+                        logger.info(f"Reconnected to client {self.name}")
+                        # The server may have been upgraded or replaced while we were away.
+                        self._notify_tools_changed()
+                    else:
+                        ready.set_result(None)
+                    backoff = RECONNECT_INITIAL_BACKOFF
+                    await self._monitor_session(stop)
+            except BaseException as e:
+                if not isinstance(e, Exception):
+                    ready.cancel()
+                    raise
+                if not ready.done():
+                    ready.set_exception(e)
+                    return
+                logger.warning(f"Connection to client {self.name} failed: {e}")
+            finally:
+                self.session = None
+                self._session_ready.clear()
+
+            if stop.is_set():
+                return
+            logger.info(f"Reconnecting to client {self.name} in {backoff}s")
+            with suppress(TimeoutError):
+                await asyncio.wait_for(stop.wait(), backoff)
+            backoff = min(backoff * 2, RECONNECT_MAX_BACKOFF)
+
+    async def _monitor_session(self, stop: asyncio.Event) -> None:
+        """Returns when the session should be closed: on `stop`, a failed ping or a reconnect request."""
+        while not stop.is_set():
+            self._session_wakeup.clear()
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._session_wakeup.wait(), self.health_check_interval)
+                # Woken up by `close` or `_request_reconnect`.
+                return
+            try:
+                await asyncio.wait_for(self.session.send_ping(), HEALTH_CHECK_TIMEOUT)
+            except Exception as e:
+                logger.warning(f"Health check failed for client {self.name}: {e!r}")
+                return
+
+    def _request_reconnect(self) -> None:
+        """Asks the session task to drop the current connection and reconnect."""
+        if self._session_task is not None and self._session_ready.is_set():
+            self._session_ready.clear()
+            self._session_wakeup.set()
+
+    def _notify_tools_changed(self) -> None:
+        if self.on_tools_changed is None:
+            return
+        # Runs outside the session's receive loop, which must keep reading to answer the refresh.
+        task = asyncio.create_task(self.on_tools_changed(self))
+        self._notification_tasks.add(task)
+        task.add_done_callback(self._notification_tasks.discard)
+
+    @property
+    def is_connected(self) -> bool:
+        return self.session is not None
+
+    async def close(self) -> None:
+        """Closes the connection opened by `connect`."""
+        task, self._session_task = self._session_task, None
+        if task is None:
+            return
+        self._session_stop.set()
+        self._session_wakeup.set()
+        if self.session is None:
+            # Still connecting (e.g. a hung server) or waiting to reconnect: abandon the attempt.
+            task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+        self.session = None
+
+    async def _get_session(self) -> ClientSession | None:
+        """Returns the live session, waiting for a reconnect in progress if needed."""
+        if self._session_task is not None and not self._session_ready.is_set():
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._session_ready.wait(), RECONNECT_WAIT_TIMEOUT)
+        return self.session
+
+    def _update_tool_hints(self, tools: list[MCPTool]) -> None:
+        """Records which tools can be retried, from their annotations."""
+        self._idempotent_tools = {
+            tool.name
+            for tool in tools
+            if tool.annotations and (tool.annotations.idempotentHint or tool.annotations.readOnlyHint)
+        }
+
+    async def fetch_tools(self) -> list[MCPTool]:
+        """
+        Lists all tools available on the connected MCP server.
+
+        Raises:
+            ConnectionError: If the client is not connected.
+            Exception: Any error raised while listing the tools.
+        """
+        session = await self._get_session()
+        if not session:
+            raise ConnectionError(f"Client {self.name} is not connected")
+        tools = list((await session.list_tools()).tools)
+        self._update_tool_hints(tools)
+        return tools
+
     async def list_tools(self) -> list[MCPTool]:
         """Lists all tools available on the connected MCP server."""
-        if self.session:
+        if self.session or self._session_task is not None:
             try:
-                tools = await self.session.list_tools()
-                return list(tools.tools)
+                return await self.fetch_tools()
             except Exception as e:
                 logger.warning(f"Failed to list tools for client {self.name}: {e}")
         return []
 
     async def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> MCPCallToolResult:
-        """Calls a specified tool on the connected MCP server with given arguments."""
-        if self.session:
-            try:
-                return await self.session.call_tool(tool_name, arguments)
-            except Exception as e:
-                logger.error(f"Error calling tool '{tool_name}' on client {self.name}: {e}")
+        """
+        Calls a specified tool on the connected MCP server with given arguments.
+
+        If the connection fails during the call, a reconnect is triggered, and
+        tools annotated as idempotent or read-only are retried once on the new
+        session.
+        """
+        attempts = 2 if tool_name in self._idempotent_tools else 1
+        with start_span(
+            "ClientTransport.call_tool",
+            kind="client",
+            attributes={"mcp.tool.name": tool_name, "mcp.server.name": self.name},
+        ) as span:
+            # Propagate the trace to the server in the request `_meta`; only sent while tracing is on.
+            meta = inject_trace_context({}) or None
+            for attempt in range(attempts):
+                session = await self._get_session()
+                if not session:
+                    break
+                try:
+                    if meta:
+                        return await session.call_tool(tool_name, arguments, meta=meta)
+                    return await session.call_tool(tool_name, arguments)
+                except Exception as e:
+                    logger.error(f"Error calling tool '{tool_name}' on client {self.name}: {e!r}")
+                    span.record_exception(e)
+                    if isinstance(e, McpError) and e.error.code != CONNECTION_CLOSED:
+                        # The server answered, so the connection itself is fine.
+                        break
+                    self._request_reconnect()
+                    if attempt + 1 < attempts:
+                        logger.info(f"Retrying idempotent tool '{tool_name}' on client {self.name} after reconnect")
         return MCPCallToolResult(
             content=[],
             isError=True,
@@ -176,13 +429,55 @@ class MultiClientTransport:
     instances, each potentially connected to a different MCP server.
     Maintains a mapping of tool names to the specific ClientTransport that
     provides that tool.
+
+    Servers exposing an identical tool definition are treated as replicas:
+    calls to that tool are balanced across them, skipping disconnected or
+    repeatedly failing replicas. A tool with the same name but a different
+    definition is ignored in favour of the first client that provides it.
     """
 
-    def __init__(self, clients: dict[str, ClientTransportConfig]):
-        self.clients: list[ClientTransport] = [ClientTransport(name, config) for name, config in clients.items()]
+    def __init__(
+        self,
+        clients: dict[str, ClientTransportConfig],
+        connect_timeout: float | None = DEFAULT_CONNECT_TIMEOUT,
+        list_tools_timeout: float | None = DEFAULT_LIST_TOOLS_TIMEOUT,
+        balancing: BalancingStrategy = "least_outstanding",
+        use_tool_cache: bool = False,
+        tool_cache_dir: Path | None = None,
+        result_cache_ttl: float | None = None,
+        result_cache_size: int = DEFAULT_RESULT_CACHE_SIZE,
+    ):
+        """
+        Args:
+            clients: Transport configurations keyed by server name.
+            connect_timeout: Per-server time limit in seconds for connecting, or None for no limit.
+            list_tools_timeout: Per-server time limit in seconds for listing tools, or None for no limit.
+            balancing: How calls are routed across replicas of a tool.
+            use_tool_cache: Start from each remote (sse or streamable_http) server's tool list cached on disk and
+                revalidate it in the background.
+            tool_cache_dir: Directory of the tool list cache. Defaults to `get_default_tool_list_cache_dir()`.
+            result_cache_ttl: Seconds to reuse results of tools annotated read-only, or None to disable.
+            result_cache_size: Maximum number of results kept by the result cache.
+        """
+        self.clients: list[ClientTransport] = []
+        # First client providing each tool; calls are routed through `tool_to_pool`.
         self.tool_to_client: dict[str, ClientTransport] = {}
+        self.tool_to_pool: dict[str, ReplicaPool] = {}
+        self.balancing = balancing
         self._mcp_tools: list[MCPTool] = []
-        self._exit_stack: AsyncExitStack = AsyncExitStack()
+        self._tool_definitions: dict[str, MCPTool] = {}
+        # Converted and serialized tool lists, rebuilt when the tool mapping changes.
+        self._openai_tools: list[ChatCompletionToolParam] | None = None
+        self._tools_json: dict[str, str] = {}
+        self.tool_cache = ToolListCache(tool_cache_dir) if use_tool_cache else None
+        self._background_tasks: set[asyncio.Task] = set()
+        self.result_cache = ToolResultCache(result_cache_ttl, result_cache_size) if result_cache_ttl else None
+        # Last tool listing of each client, keyed by client name.
+        self._client_tools: dict[str, list[MCPTool]] = {}
+        for name, config in clients.items():
+            self._create_client(name, config)
+        self.connect_timeout = connect_timeout
+        self.list_tools_timeout = list_tools_timeout
 
     @classmethod
     def from_file(cls, path: str) -> Self:
@@ -190,60 +485,217 @@ class MultiClientTransport:
         return cls(mcp_config.mcpServers)
 
     def save_to_file(self, path: str) -> None:
-        mcp_config = ClientConfig(mcpServers={name: config.model_dump() for name, config in self.clients.items()})
+        mcp_config = ClientConfig(mcpServers={client.name: client.config for client in self.clients})
         mcp_config.save_json_config(path)
 
+    def _create_client(self, name: str, config: ClientTransportConfig) -> ClientTransport:
+        client = ClientTransport(name, config)
+        client.on_tools_changed = self._refresh_client_tools
+        self.clients.append(client)
+        return client
+
+    def _get_client(self, name: str) -> ClientTransport | None:
+        return next((client for client in self.clients if client.name == name), None)
+
     async def add_client(self, name: str, config: ClientTransportConfig) -> None:
-        if name in self.tool_to_client:
+        """
+        Connects to a new server and adds its tools, without re-listing the other servers.
+
+        Args:
+            name: The server name.
+            config: The transport configuration of the server.
+        """
+        if self._get_client(name):
             logger.warning(f"Client {name} already exists. Skipping.")
             return
-        self.clients.append(ClientTransport(name, config))
-        self.tool_to_client[name] = self.clients[-1]
+        client = self._create_client(name, config)
+        try:
+            await client.connect(self.connect_timeout)
+        except Exception as e:
+            logger.error(f"Failed to connect to client {name}: {e}")
         logger.info(f"Added client: {name}")
-        await self._populate_tool_mapping()
+        tools, from_cache = await self._load_client_tools(client)
+        self._client_tools[name] = tools
+        # The new client is last, so it can only add names no other client provides.
+        self._merge_client_tools(client, tools)
+        if from_cache:
+            self._revalidate_client_tools(client)
 
     async def remove_client(self, name: str) -> None:
-        if name not in self.tool_to_client:
+        """
+        Disconnects a server and drops its tools, without re-listing the other servers.
+
+        Args:
+            name: The server name.
+        """
+        client = self._get_client(name)
+        if not client:
             logger.warning(f"Client {name} not found. Skipping.")
             return
-        self.clients.remove(self.tool_to_client[name])
-        del self.tool_to_client[name]
+        self.clients.remove(client)
+        await client.close()
+        self._client_tools.pop(name, None)
         logger.info(f"Removed client: {name}")
-        await self._populate_tool_mapping()
+        # Tools of other clients shadowed by the removed one may surface now.
+        self._rebuild_tool_mapping()
+
+    async def _refresh_client_tools(self, client: ClientTransport) -> None:
+        """Re-lists the tools of a single client and updates the mapping."""
+        if client not in self.clients:
+            return
+        tools = await self._list_client_tools(client)
+        if tools is None or client not in self.clients or tools == self._client_tools.get(client.name):
+            return
+        logger.info(f"Updated tool list of client {client.name}")
+        self._client_tools[client.name] = tools
+        self._rebuild_tool_mapping()
 
     async def __aenter__(self):
-        for client in self.clients:
-            await client.initialize(self._exit_stack)
+        # Connect to all servers concurrently; startup is bounded by the slowest server, not the sum.
+        results = await asyncio.gather(
+            *(client.connect(self.connect_timeout) for client in self.clients), return_exceptions=True
+        )
+        for client, result in zip(self.clients, results, strict=True):
+            if isinstance(result, TimeoutError):
+                logger.error(f"Timed out connecting to client {client.name} after {self.connect_timeout}s. Skipping.")
+            elif isinstance(result, BaseException):
+                logger.error(f"Failed to connect to client {client.name}: {result}. Skipping.")
         await self._populate_tool_mapping()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        for task in self._background_tasks:
+            task.cancel()
+        await asyncio.gather(*(client.close() for client in self.clients), return_exceptions=True)
         self.clients.clear()
         self.tool_to_client.clear()
+        self.tool_to_pool.clear()
         self._mcp_tools.clear()
-        await self._exit_stack.aclose()
+        self._tool_definitions.clear()
+        self._client_tools.clear()
+        self._invalidate_tool_caches()
+        if self.result_cache:
+            self.result_cache.invalidate()
+
+    async def _list_client_tools(self, client: ClientTransport) -> list[MCPTool] | None:
+        """
+        Lists the tools of one client, giving up after `list_tools_timeout`.
+
+        Returns:
+            The listed tools, which are also written to the tool cache, or None on failure.
+        """
+        try:
+            tools = await asyncio.wait_for(client.fetch_tools(), self.list_tools_timeout)
+        except TimeoutError:
+            logger.warning(f"Timed out listing tools for client {client.name} after {self.list_tools_timeout}s")
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to list tools for client {client.name}: {e}")
+            return None
+        if self._uses_tool_cache(client):
+            self.tool_cache.set(client.name, client.config, tools)
+        return tools
+
+    def _uses_tool_cache(self, client: ClientTransport) -> bool:
+        return self.tool_cache is not None and client.config.transport in CACHED_TOOL_LIST_TRANSPORTS
+
+    async def _load_client_tools(self, client: ClientTransport) -> tuple[list[MCPTool], bool]:
+        """
+        Gets the tools of a newly connected client, from the tool cache if possible.
+
+        Returns:
+            The tools, and whether they came from the cache. Cached lists must be
+            revalidated with `_revalidate_client_tools` once they are in the mapping.
+        """
+        if not client.is_connected:
+            return [], False
+        cached = self.tool_cache.get(client.name, client.config) if self._uses_tool_cache(client) else None
+        if cached is None:
+            return await self._list_client_tools(client) or [], False
+        logger.debug(f"Using cached tool list for client {client.name}")
+        client._update_tool_hints(cached)
+        return cached, True
+
+    def _revalidate_client_tools(self, client: ClientTransport) -> None:
+        """Re-lists the tools of a client in the background, replacing its cached list if it changed."""
+        task = asyncio.create_task(self._refresh_client_tools(client))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
 
     async def _populate_tool_mapping(self):
+        clients = list(self.clients)
+        loaded = await asyncio.gather(*(self._load_client_tools(client) for client in clients))
+        self._client_tools = {client.name: tools for client, (tools, _) in zip(clients, loaded, strict=True)}
+        self._rebuild_tool_mapping()
+        # Revalidate only now, so a refresh finishing during the gather is not overwritten by the cached list.
+        for client, (_, from_cache) in zip(clients, loaded, strict=True):
+            if from_cache:
+                self._revalidate_client_tools(client)
+
+    def _rebuild_tool_mapping(self) -> None:
+        """Rebuilds the tool mapping from the last listing of each client, without contacting servers."""
         self.tool_to_client.clear()
         self._mcp_tools.clear()
+        self._tool_definitions.clear()
+        self._invalidate_tool_caches()
+        if self.result_cache:
+            # Tools may behave differently after a server changed its tool list.
+            self.result_cache.invalidate()
+        replicas: dict[str, set[int]] = {}
+        # Merge in client order so the first client exposing a tool name keeps winning.
         for client in self.clients:
-            try:
-                tools = await client.list_tools()
-                for tool in tools:
-                    tool_name = getattr(tool, "name", None)
-                    if tool_name:
-                        if tool_name not in self.tool_to_client:
-                            self._mcp_tools.append(tool)
-                            self.tool_to_client[tool_name] = client
-                            logger.info(f"Found tool: {tool_name} from client: {client.name}")
-                        else:
-                            logger.warning(
-                                f"Duplicate tool name '{tool_name}' found in client '{client.name}'. Skipping."
-                            )
-            except Exception as e:
-                logger.warning(f"Failed to list tools for client {client.name}: {e}")
+            for tool_name in self._merge_client_tools(client, self._client_tools.get(client.name, [])):
+                replicas.setdefault(tool_name, set()).add(id(client))
+        # Keep existing pools, and their stats, for replicas that still serve the tool.
+        for tool_name, pool in list(self.tool_to_pool.items()):
+            if tool_name not in replicas:
+                del self.tool_to_pool[tool_name]
+                continue
+            for client in list(pool.replicas):
+                if id(client) not in replicas[tool_name]:
+                    pool.remove(client)
+
+    def _merge_client_tools(self, client: ClientTransport, tools: list[MCPTool]) -> list[str]:
+        """Adds a client's tools to the mapping and returns the names it serves."""
+        served = []
+        for tool in tools:
+            tool_name = getattr(tool, "name", None)
+            if not tool_name:
+                continue
+            if tool_name not in self.tool_to_client:
+                self._mcp_tools.append(tool)
+                self._invalidate_tool_caches()
+                self._tool_definitions[tool_name] = tool
+                self.tool_to_client[tool_name] = client
+                logger.debug(f"Found tool: {tool_name} from client: {client.name}")
+            elif tool == self._tool_definitions[tool_name]:
+                logger.debug(f"Found replica of tool: {tool_name} on client: {client.name}")
+            else:
+                logger.warning(f"Duplicate tool name '{tool_name}' found in client '{client.name}'. Skipping.")
+                continue
+            pool = self.tool_to_pool.get(tool_name)
+            if pool is None:
+                pool = self.tool_to_pool[tool_name] = ReplicaPool(
+                    self.balancing, is_available=lambda replica: replica.is_connected
+                )
+            pool.add(client)
+            served.append(tool_name)
+        return served
+
+    def _invalidate_tool_caches(self) -> None:
+        self._openai_tools = None
+        self._tools_json.clear()
+
+    def replica_stats(self) -> dict[str, dict[str, ReplicaStats]]:
+        """
+        Returns routing statistics for every tool, keyed by tool name and then client name.
+        """
+        return {
+            tool_name: {client.name: pool.stats(client) for client in pool.replicas}
+            for tool_name, pool in self.tool_to_pool.items()
+        }
 
-    async def list_tools(self, format: Literal["mcp", "openai"] = "mcp") -> list[MCPTool | ChatCompletionToolParam]:
+    async def list_tools(self, format: Literal["mcp", "openai"] = "mcp") -> list["MCPTool | ChatCompletionToolParam"]:
         """
         Lists all unique tools available from all managed clients.
 
@@ -259,19 +711,117 @@ class MultiClientTransport:
         if format == "mcp":
             return self._mcp_tools
         elif format == "openai":
-            return [transform_mcp_tool_to_openai_tool(tool) for tool in self._mcp_tools]
+            if self._openai_tools is None:
+                self._openai_tools = [transform_mcp_tool_to_openai_tool(tool) for tool in self._mcp_tools]
+            # The list is copied, the tool definitions are shared and must not be modified.
+            return list(self._openai_tools)
         else:
             raise ValueError(f"Invalid format: {format}")
 
+    async def list_tools_json(self, format: Literal["mcp", "openai"] = "mcp") -> str:
+        """
+        Lists all unique tools as a JSON array, serialized once per tool mapping change.
+
+        Useful to send the tool list to an LLM API on every turn without
+        re-serializing it.
+
+        Args:
+            format: The desired format for the returned tools.
+
+        Returns:
+            The tools in the specified format, serialized as JSON.
+
+        Raises:
+            ValueError: If an unsupported format is requested.
+        """
+        if format not in self._tools_json:
+            tools = await self.list_tools(format=format)
+            if format == "mcp":
+                payload = [tool.model_dump(mode="json", by_alias=True, exclude_none=True) for tool in tools]
+            else:
+                payload = [
+                    {**tool, "function": tool["function"].model_dump(mode="json", exclude_none=True)} for tool in tools
+                ]
+            self._tools_json[format] = json.dumps(payload)
+        return self._tools_json[format]
+
+    def _is_cacheable(self, tool_name: str) -> bool:
+        tool = self._tool_definitions.get(tool_name)
+        return bool(tool and tool.annotations and tool.annotations.readOnlyHint)
+
     async def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> MCPCallToolResult:
         """
         Calls a tool by routing the request to the appropriate ClientTransport.
 
+        When the result cache is enabled, successful results of tools annotated
+        with `readOnlyHint` are reused for identical arguments until they expire.
+
         Raises:
             KeyError: If the tool_name is not found.
         """
-        client = self.tool_to_client.get(tool_name)
-        if not client:
+        return await self._call_tool(tool_name, arguments)
+
+    async def _call_tool(
+        self, tool_name: str, arguments: dict[str, Any], replica: ClientTransport | None = None
+    ) -> MCPCallToolResult:
+        """Calls a tool on the given replica, or on the one its pool selects."""
+        pool = self.tool_to_pool.get(tool_name)
+        if not pool:
             logger.error(f"Tool '{tool_name}' not found in any client.")
             return MCPCallToolResult(content=[], isError=True)
-        return await client.call_tool(tool_name, arguments)
+        cacheable = self.result_cache is not None and self._is_cacheable(tool_name)
+        if cacheable:
+            cached = self.result_cache.get(tool_name, arguments)
+            if cached is not None:
+                return cached
+        with pool.acquire(replica) as (client, report):
+            result = await client.call_tool(tool_name, arguments)
+            # ClientTransport reports connection failures as an empty error result.
+            report(not (result.isError and not result.content))
+        if cacheable:
+            self.result_cache.set(tool_name, arguments, result)
+        return result
+
+    def _route_batch(self, batch: Sequence[ToolCall]) -> list[ClientTransport | None]:
+        """Picks the replica of every call in a batch, spreading the calls to a tool across its replicas."""
+        positions: dict[str, list[int]] = {}
+        for position, (tool_name, _) in enumerate(batch):
+            positions.setdefault(tool_name, []).append(position)
+        routes: list[ClientTransport | None] = [None] * len(batch)
+        for tool_name, tool_positions in positions.items():
+            pool = self.tool_to_pool.get(tool_name)
+            if not pool:
+                continue
+            for position, replica in zip(tool_positions, pool.assign(len(tool_positions)), strict=True):
+                routes[position] = replica
+        return routes
+
+    async def call_tools(
+        self,
+        batch: Sequence[ToolCall],
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        max_concurrency_per_server: int = DEFAULT_BATCH_GROUP_CONCURRENCY,
+    ) -> list[ToolCallResult]:
+        """
+        Calls several tools concurrently, routing each call like `call_tool`.
+
+        The replica of each call is picked up front, so calls are limited per
+        server they are actually sent to.
+
+        Args:
+            batch: The (tool name, arguments) pairs to call.
+            max_concurrency: Maximum number of calls running at once.
+            max_concurrency_per_server: Maximum number of calls to the same server running at once.
+
+        Returns:
+            One result per call, in the order of the batch.
+        """
+        calls = [
+            (tool_name, replica.name if replica else "", partial(self._call_tool, tool_name, arguments, replica))
+            for (tool_name, arguments), replica in zip(batch, self._route_batch(batch), strict=True)
+        ]
+        return await run_grouped_calls(calls, max_concurrency, max_concurrency_per_server)
+
+    def result_cache_stats(self) -> dict[str, int] | None:
+        """Returns the hit, miss and eviction counters of the result cache, or None if it is disabled."""
+        return self.result_cache.stats() if self.result_cache else None
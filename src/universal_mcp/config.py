@@ -1,6 +1,7 @@
 import json
 from pathlib import Path
 from typing import Any, Literal, Self
+from urllib.parse import urlparse
 
 from pydantic import BaseModel, Field, SecretStr, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -145,6 +146,57 @@ class ServerConfig(BaseSettings):
         default=None,
         description="Default credential store configuration for applications that do not define their own specific store.",
     )
+    use_tool_catalog: bool = Field(
+        default=False,
+        description="Cache the built tool catalog on disk so later startups can list tools without importing apps. Entries are invalidated when app sources, universal_mcp sources or package versions change.",
+    )
+    tool_catalog_dir: Path | None = Field(
+        default=None,
+        description="Directory for tool catalog files. Defaults to ~/.universal-mcp/cache/tool_catalog.",
+    )
+    tool_timeout: float | None = Field(
+        default=None,
+        gt=0,
+        description="Default timeout in seconds for tool calls. Tools can set their own with a 'timeout:<seconds>' docstring tag. If None, calls have no deadline unless the tool sets one.",
+    )
+    trace_file: Path | None = Field(
+        default=None,
+        description="Write tracing spans of tool calls to this file as OTLP/JSON, one export request per line.",
+    )
+    otlp_endpoint: str | None = Field(
+        default=None,
+        description="Send tracing spans of tool calls to this OTLP/HTTP collector (e.g. http://localhost:4318). Takes precedence over trace_file.",
+    )
+    metrics_path: str | None = Field(
+        default=None,
+        description="HTTP path serving the built-in metrics in the Prometheus text format on the 'sse' and 'streamable-http' transports (e.g. '/metrics'). Disabled by default since the route is not authenticated.",
+    )
+    compact_tools: bool = Field(
+        default=False,
+        description="Register tools as memory-compact CompactTools, which share schema fragments and tags and build their argument model on first call. Useful for servers holding thousands of tools.",
+    )
+    compact_schemas: bool = Field(
+        default=False,
+        description="De-duplicate repeated subschemas of each tool's input schema with $defs and $ref when listing tools, shrinking the tools/list payload.",
+    )
+    profile_tools: list[str] | None = Field(
+        default=None,
+        description="Full names of tools whose calls are profiled with cProfile and tracemalloc from startup.",
+    )
+    profile_sample_rate: float = Field(
+        default=0.0,
+        ge=0,
+        le=1,
+        description="Fraction of all tool calls to profile, from 0 to 1.",
+    )
+    profile_dir: Path | None = Field(
+        default=None,
+        description="Directory for tool call profiles. Defaults to ~/.universal-mcp/profiles.",
+    )
+    profiling_path: str | None = Field(
+        default=None,
+        description="HTTP path to inspect (GET), change (POST) or stop (DELETE) tool profiling at runtime on the 'sse' and 'streamable-http' transports. Disabled by default since the route is not authenticated.",
+    )
 
     @field_validator("log_level", mode="before")
     def validate_log_level(cls, v: str) -> str:
@@ -176,3 +228,81 @@ class ServerConfig(BaseSettings):
         with open(path) as f:
             data = json.load(f)
         return cls.model_validate(data)
+
+
+class ClientTransportConfig(BaseModel):
+    """Configuration for connecting to a single MCP server as a client.
+
+    Local servers are started from a `command`, with optional `args` and
+    `env`, and spoken to over stdio. Remote servers are reached at a `url`,
+    with optional `headers`; remote servers without headers authenticate
+    with OAuth. Unless set explicitly, the transport is inferred: stdio for
+    a command, SSE for URLs ending in `/sse` and streamable HTTP otherwise.
+    """
+
+    transport: Literal["stdio", "sse", "streamable_http"] | None = Field(
+        default=None,
+        description="The transport used to reach the server. Inferred from 'command' and 'url' if not set.",
+    )
+    command: str | None = Field(default=None, description="Command starting a local server (stdio transport).")
+    args: list[str] = Field(default_factory=list, description="Arguments passed to 'command'.")
+    env: dict[str, str] = Field(
+        default_factory=dict, description="Environment variables added to the environment of 'command'."
+    )
+    url: str | None = Field(default=None, description="URL of a remote server (sse or streamable_http transport).")
+    headers: dict[str, str] = Field(
+        default_factory=dict,
+        description="HTTP headers sent to a remote server, e.g. for API key authentication. OAuth is used if empty.",
+    )
+
+    @model_validator(mode="after")
+    def determine_transport(self) -> Self:
+        if self.transport is None:
+            if self.command:
+                self.transport = "stdio"
+            elif self.url:
+                self.transport = "sse" if urlparse(self.url).path.rstrip("/").endswith("/sse") else "streamable_http"
+            else:
+                raise ValueError("Either 'command' or 'url' must be provided")
+        return self
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Gets a setting by name, or `default` if it is not set."""
+        value = getattr(self, key, None)
+        return default if value is None else value
+
+
+class ClientConfig(BaseModel):
+    """Configuration of the MCP servers a client connects to.
+
+    Uses the `mcpServers` layout of common MCP client configuration files.
+    """
+
+    mcpServers: dict[str, ClientTransportConfig] = Field(
+        default_factory=dict, description="Transport configurations of the MCP servers, keyed by server name."
+    )
+
+    @classmethod
+    def load_json_config(cls, path: str = "servers.json") -> Self:
+        """Loads client configuration from a JSON file.
+
+        Args:
+            path (str, optional): The path to the JSON configuration file.
+                Defaults to "servers.json".
+
+        Returns:
+            ClientConfig: An instance of ClientConfig populated with data
+                          from the JSON file.
+        """
+        with open(path) as f:
+            data = json.load(f)
+        return cls.model_validate(data)
+
+    def save_json_config(self, path: str) -> None:
+        """Saves the client configuration to a JSON file.
+
+        Args:
+            path (str): The path of the JSON configuration file.
+        """
+        with open(path, "w") as f:
+            json.dump(self.model_dump(mode="json", exclude_none=True), f, indent=2)
@@ -30,6 +30,15 @@ class ToolNotFoundError(Exception):
     """Raised when a tool is not found"""
 
 
+class ToolTimeoutError(ToolError):
+    """Raised when a tool call exceeds its deadline or is cancelled.
+
+    Sync tools running in a worker thread cannot be interrupted; they see
+    this error the next time they check their call scope, e.g. before an
+    outgoing HTTP request.
+    """
+
+
 class InvalidSignature(Exception):
     """Raised when a cryptographic signature verification fails.
 
@@ -1,9 +1,23 @@
+import json
+import queue
 import sys
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
+from typing import Any, Literal, TextIO
 
 from loguru import logger
 
+LogProfile = Literal["development", "production"]
+
+DEFAULT_LOG_QUEUE_SIZE = 10_000
+DEFAULT_SAMPLE_LIMIT = 20  # records let through per call site and level in each window
+DEFAULT_SAMPLE_WINDOW = 60.0  # seconds
+
+_production_sink: "BackgroundSink | None" = None
+_production_filter: "RateLimitFilter | None" = None
+
 
 def get_log_file_path(app_name: str = "universal-mcp") -> Path:
     """Get a standardized log file path for an application.
@@ -20,6 +34,201 @@ def get_log_file_path(app_name: str = "universal-mcp") -> Path:
     return log_dir / f"{app_name}_{date_str}.log"
 
 
+def serialize_record(record: dict[str, Any], exception_text: str = "") -> str:
+    """Render a loguru record as a single JSON line.
+
+    Args:
+        record: The loguru record.
+        exception_text: The already rendered traceback of the record, if any.
+
+    Returns:
+        The JSON document, without a trailing newline.
+    """
+    data: dict[str, Any] = {
+        "time": record["time"].isoformat(),
+        "level": record["level"].name,
+        "name": record["name"],
+        "function": record["function"],
+        "line": record["line"],
+        "message": record["message"],
+    }
+    exception = record["exception"]
+    if exception is not None:
+        data["exception"] = {
+            "type": exception.type.__name__ if exception.type else None,
+            "value": str(exception.value),
+            "traceback": exception_text.strip() or None,
+        }
+    if record["extra"]:
+        data["extra"] = record["extra"]
+    return json.dumps(data, default=str)
+
+
+class RateLimitFilter:
+    """Loguru filter that samples repeated messages.
+
+    At most `limit` records per call site and level are let through every
+    `window` seconds. The number of records dropped in a window is attached to
+    the next record let through from the same call site as `extra["suppressed"]`.
+    """
+
+    def __init__(self, limit: int = DEFAULT_SAMPLE_LIMIT, window: float = DEFAULT_SAMPLE_WINDOW):
+        """
+        Args:
+            limit: Records let through per call site and level in each window.
+            window: Length of a sampling window in seconds.
+        """
+        if limit < 1 or window <= 0:
+            raise ValueError("Sample limit must be at least 1 and the window positive")
+        self.limit = limit
+        self.window = window
+        self.suppressed = 0
+        # (module, function, line, level) -> [window start, records let through, records suppressed]
+        self._windows: dict[tuple[str, str, int, int], list[Any]] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, record: dict[str, Any]) -> bool:
+        key = (record["name"], record["function"], record["line"], record["level"].no)
+        now = time.monotonic()
+        with self._lock:
+            state = self._windows.get(key)
+            if state is None or now - state[0] >= self.window:
+                if state is not None and state[2]:
+                    record["extra"]["suppressed"] = state[2]
+                self._windows[key] = [now, 1, 0]
+                return True
+            if state[1] < self.limit:
+                state[1] += 1
+                return True
+            state[2] += 1
+            self.suppressed += 1
+            return False
+
+
+class BackgroundSink:
+    """Loguru sink that writes JSON lines from a worker thread.
+
+    Records are handed to the worker through a bounded queue and serialized
+    there, so logging never blocks the caller: when the queue is full the
+    record is dropped and counted, and the worker reports the number of
+    dropped records once it catches up.
+    """
+
+    def __init__(self, streams: list[TextIO], maxsize: int = DEFAULT_LOG_QUEUE_SIZE, log_file: Path | None = None):
+        """
+        Args:
+            streams: Text streams each JSON line is written to.
+            maxsize: Maximum number of records waiting to be written.
+            log_file: Optional file the JSON lines are also appended to. It is closed when the sink stops.
+        """
+        if maxsize < 1:
+            raise ValueError("Log queue size must be at least 1")
+        self.streams = list(streams)
+        self._file: TextIO | None = None
+        if log_file:
+            log_file.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(log_file, "a", encoding="utf-8")  # noqa: SIM115 - closed in stop()
+            self.streams.append(self._file)
+        self.dropped = 0
+        self._unreported_drops = 0
+        self._lock = threading.Lock()
+        self._queue: queue.Queue[tuple[dict[str, Any], str] | None] = queue.Queue(maxsize)
+        self._worker = threading.Thread(target=self._run, name="universal-mcp-log-writer", daemon=True)
+        self._worker.start()
+
+    @property
+    def queued(self) -> int:
+        return self._queue.qsize()
+
+    def write(self, message: Any) -> None:
+        # The handler format is empty, so the message text is only the traceback loguru appends.
+        try:
+            self._queue.put_nowait((message.record, str(message)))
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+                self._unreported_drops += 1
+
+    def _emit(self, line: str) -> None:
+        for stream in self.streams:
+            try:
+                stream.write(line + "\n")
+                stream.flush()
+            except Exception as e:
+                print(f"Failed to write log record: {e}", file=sys.stderr)
+
+    def _report_drops(self) -> None:
+        with self._lock:
+            dropped, self._unreported_drops = self._unreported_drops, 0
+        if dropped:
+            self._emit(
+                json.dumps(
+                    {
+                        "time": datetime.now().astimezone().isoformat(),
+                        "level": "WARNING",
+                        "name": __name__,
+                        "message": f"Dropped {dropped} log records because the log queue was full",
+                        "extra": {"dropped": dropped},
+                    }
+                )
+            )
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._report_drops()
+                return
+            record, exception_text = item
+            self._emit(serialize_record(record, exception_text))
+            self._report_drops()
+
+    def stop(self) -> None:
+        """Write the queued records and stop the worker. Called by loguru when the handler is removed."""
+        self._queue.put(None)
+        self._worker.join()
+        if self._file is not None:
+            self._file.close()
+
+
+def get_log_stats() -> dict[str, int]:
+    """Get the drop and sampling counters of the production logging profile.
+
+    Returns:
+        The number of records dropped because the queue was full, suppressed
+        by sampling, and currently waiting to be written. All zero when the
+        production profile is not active.
+    """
+    return {
+        "dropped": _production_sink.dropped if _production_sink else 0,
+        "suppressed": _production_filter.suppressed if _production_filter else 0,
+        "queued": _production_sink.queued if _production_sink else 0,
+    }
+
+
+def _setup_production_logger(
+    log_file: Path | None,
+    level: str,
+    queue_size: int,
+    sample_limit: int,
+    sample_window: float,
+) -> None:
+    global _production_sink, _production_filter
+
+    _production_filter = RateLimitFilter(limit=sample_limit, window=sample_window)
+    _production_sink = BackgroundSink([sys.stderr], maxsize=queue_size, log_file=log_file)
+    logger.add(
+        sink=_production_sink,
+        level=level,
+        format="",
+        filter=_production_filter,
+        backtrace=False,
+        diagnose=False,
+    )
+    if log_file:
+        logger.info(f"Logging to {log_file}")
+
+
 def setup_logger(
     log_file: Path | None = None,
     rotation: str = "10 MB",
@@ -27,9 +236,21 @@ def setup_logger(
     compression: str = "zip",
     level: str = "INFO",
     format: str = "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
+    profile: LogProfile = "development",
+    queue_size: int = DEFAULT_LOG_QUEUE_SIZE,
+    sample_limit: int = DEFAULT_SAMPLE_LIMIT,
+    sample_window: float = DEFAULT_SAMPLE_WINDOW,
 ) -> None:
     """Setup the logger with both stderr and optional file logging with rotation.
 
+    The "development" profile writes human readable records to stderr and a
+    rotated log file, with variable values rendered in tracebacks. The
+    "production" profile writes one JSON document per record to stderr and,
+    if given, `log_file`. Records are sampled per call site, tracebacks are
+    rendered without variable values, and writing happens on a worker thread
+    behind a bounded queue that drops records rather than blocking. Rotation,
+    retention and compression only apply to the development profile.
+
     Args:
         log_file: Optional path to log file. If None, only stderr logging is enabled.
         rotation: When to rotate the log file. Can be size (e.g., "10 MB") or time (e.g., "1 day").
@@ -37,9 +258,24 @@ def setup_logger(
         compression: Compression format for rotated logs ("zip", "gz", or None).
         level: Minimum logging level.
         format: Log message format string.
+        profile: "development" or "production".
+        queue_size: Production only. Maximum number of records waiting to be written.
+        sample_limit: Production only. Records let through per call site and level in each sampling window.
+        sample_window: Production only. Length of a sampling window in seconds.
     """
+    global _production_sink, _production_filter
+
+    if profile not in ("development", "production"):
+        raise ValueError(f"Invalid logging profile: {profile}")
+
     # Remove default handler
     logger.remove()
+    _production_sink = None
+    _production_filter = None
+
+    if profile == "production":
+        _setup_production_logger(log_file, level, queue_size, sample_limit, sample_window)
+        return
 
     # Add stderr handler
     logger.add(
@@ -1,4 +1,5 @@
 from collections.abc import Callable
+from pathlib import Path
 from typing import Any
 
 from loguru import logger
@@ -13,7 +14,17 @@ from universal_mcp.integrations.integration import ApiKeyIntegration, OAuthInteg
 from universal_mcp.stores import store_from_config
 from universal_mcp.tools import ToolManager
 from universal_mcp.tools.adapters import convert_tool_to_mcp_tool, format_to_mcp_result
+from universal_mcp.tools.catalog import ToolCatalog
 from universal_mcp.tools.local_registry import LocalRegistry
+from universal_mcp.utils.metrics import PROMETHEUS_CONTENT_TYPE, TOOL_CALL_DURATION, render_prometheus
+from universal_mcp.utils.profiling import get_default_profile_dir, profiler
+from universal_mcp.utils.tracing import (
+    SpanContext,
+    configure_tracing,
+    extract_trace_context,
+    get_tracer,
+    start_span,
+)
 
 # --- Loader Implementations ---
 
@@ -72,6 +83,14 @@ class BaseServer(FastMCP):
             self._tool_manager = tool_manager
             self.registry: Any = None
             ServerConfig.model_validate(config)
+            if config.metrics_path:
+                self._add_metrics_route(config.metrics_path)
+            if config.otlp_endpoint or config.trace_file:
+                configure_tracing(file=config.trace_file, otlp_endpoint=config.otlp_endpoint, service_name=config.name)
+            if config.profile_tools or config.profile_sample_rate:
+                profiler.enable(config.profile_tools, config.profile_sample_rate, config.profile_dir)
+            if config.profiling_path:
+                self._add_profiling_route(config.profiling_path)
         except Exception as e:
             logger.error(f"Failed to initialize server: {e}", exc_info=True)
             raise ConfigurationError(f"Server initialization failed: {str(e)}") from e
@@ -82,12 +101,78 @@ class BaseServer(FastMCP):
             self._tool_manager = ToolManager(warn_on_duplicate_tools=True)
         return self._tool_manager
 
+    def _add_metrics_route(self, path: str) -> None:
+        """Expose the built-in metrics in the Prometheus text format on the HTTP transports."""
+        from starlette.requests import Request
+        from starlette.responses import PlainTextResponse
+
+        @self.custom_route(path, methods=["GET"], include_in_schema=False)
+        async def metrics(request: Request) -> PlainTextResponse:
+            return PlainTextResponse(render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+    def _add_profiling_route(self, path: str) -> None:
+        """Let operators inspect and toggle tool profiling at runtime on the HTTP transports.
+
+        POST takes a JSON body with optional `tool_names`, `sample_rate`,
+        `output_dir` and `trace_allocations`, as in `ToolProfiler.enable`.
+        Since the route is not authenticated, `output_dir` is only accepted as
+        a subdirectory of the configured `profile_dir`.
+        """
+        from starlette.requests import Request
+        from starlette.responses import JSONResponse
+
+        @self.custom_route(path, methods=["GET", "POST", "DELETE"], include_in_schema=False)
+        async def profiling(request: Request) -> JSONResponse:
+            if request.method == "POST":
+                try:
+                    body = await request.json() if await request.body() else {}
+                    profiler.enable(
+                        self._profile_tool_names(body.get("tool_names")),
+                        float(body.get("sample_rate", 0.0)),
+                        self._profile_output_dir(body.get("output_dir")),
+                        bool(body.get("trace_allocations", True)),
+                    )
+                except (ValueError, TypeError, AttributeError) as e:
+                    return JSONResponse({"error": f"Invalid profiling settings: {e}"}, status_code=400)
+            elif request.method == "DELETE":
+                profiler.disable()
+            return JSONResponse(profiler.status())
+
+    @staticmethod
+    def _profile_tool_names(tool_names: Any) -> list[str] | None:
+        """Check the tool names requested over HTTP, which must be a JSON list of strings."""
+        if tool_names is None:
+            return None
+        if not isinstance(tool_names, list) or not all(isinstance(name, str) for name in tool_names):
+            raise ValueError("tool_names must be a list of tool names")
+        return tool_names
+
+    def _profile_output_dir(self, subdirectory: str | None) -> Path:
+        """Resolve a profile directory requested over HTTP, which must stay inside the configured one."""
+        base_dir = Path(self.config.profile_dir or get_default_profile_dir()).resolve()
+        if not subdirectory:
+            return base_dir
+        output_dir = (base_dir / str(subdirectory)).resolve()
+        if not output_dir.is_relative_to(base_dir):
+            raise ValueError("output_dir must be a subdirectory of the profile directory")
+        return output_dir
+
+    def _incoming_trace_context(self) -> SpanContext | None:
+        """Get the trace context sent by the client in the `_meta` of the current request, if any."""
+        if get_tracer() is None:
+            return None
+        try:
+            meta = self._mcp_server.request_context.meta
+        except LookupError:
+            return None
+        return extract_trace_context(meta.model_dump() if meta else None)
+
     def add_tool(self, fn: Callable, name: str | None = None, description: str | None = None) -> None:
         self.tool_manager.add_tool(fn, name)
 
     async def list_tools(self) -> list:  # type: ignore
         tools = self.tool_manager.get_tools()
-        return [convert_tool_to_mcp_tool(tool) for tool in tools]
+        return [convert_tool_to_mcp_tool(tool, compact_schemas=self.config.compact_schemas) for tool in tools]
 
     async def call_tool(self, name: str, arguments: dict[str, Any]) -> list[TextContent]:
         if not name:
@@ -95,11 +180,18 @@ class BaseServer(FastMCP):
         if not isinstance(arguments, dict):
             raise ValueError("Arguments must be a dictionary")
         try:
-            # Delegate the call to the registry
-            result = await self.registry.call_tool(name, arguments)
-            return format_to_mcp_result(result)
+            with start_span(
+                "BaseServer.call_tool",
+                kind="server",
+                attributes={"mcp.tool.name": name},
+                parent=self._incoming_trace_context(),
+            ):
+                # Delegate the call to the registry
+                result = await self.registry.call_tool(name, arguments)
+                with TOOL_CALL_DURATION.time(tool=name, phase="formatting"), start_span("format_to_mcp_result"):
+                    return format_to_mcp_result(result)
         except Exception as e:
-            logger.error(f"Tool '{name}' failed: {e}", exc_info=True)
+            logger.error("Tool '{}' failed: {}", name, e, exc_info=True)
             raise ToolError(f"Tool execution failed: {str(e)}") from e
 
 
@@ -108,7 +200,10 @@ class LocalServer(BaseServer):
 
     def __init__(self, config: ServerConfig, registry: LocalRegistry | None = None, **kwargs):
         super().__init__(config, **kwargs)
-        self.registry = registry or LocalRegistry()
+        self.registry = registry or LocalRegistry(compact_tools=config.compact_tools)
+        self.registry.default_tool_timeout = config.tool_timeout
+        if config.compact_tools:
+            self.registry.tool_manager.compact_tools = True
         self._tools_loaded = False
         self._load_tools_from_config()
 
@@ -121,7 +216,10 @@ class LocalServer(BaseServer):
         logger.info(f"Loading tools from {len(self.config.apps)} app(s) specified in server config...")
         # Create a tool config dictionary from the server config
         tool_config = {app.name: app.actions for app in self.config.apps}
-        self.registry._load_tools_from_tool_config(tool_config)
+        catalog = None
+        if self.config.use_tool_catalog:
+            catalog = ToolCatalog.for_tool_config(tool_config, self.config.tool_catalog_dir)
+        self.registry._load_tools_from_tool_config(tool_config, catalog=catalog)
         self._tools_loaded = True
         logger.info("Finished loading tools from server config.")
 
@@ -1,3 +1,4 @@
+import copy
 import inspect
 from collections.abc import Callable
 from functools import wraps
@@ -6,24 +7,49 @@ from typing import Any
 from loguru import logger
 from mcp.types import TextContent
 
+from universal_mcp.tools.compact import CompactTool
+from universal_mcp.tools.schema_interning import compact_schema
 from universal_mcp.tools.tools import Tool
 from universal_mcp.types import ToolFormat
 
 
-def convert_tools(tools: list[Tool], format: ToolFormat) -> list[Any]:
-    """Convert a list of Tool objects to a specified format."""
-    logger.debug(f"Converting {len(tools)} tools to {format.value} format.")
+def convert_tools(tools: list[Tool], format: ToolFormat, compact_schemas: bool = False) -> list[Any]:
+    """Convert a list of Tool objects to a specified format.
+
+    Args:
+        tools: The tools to convert.
+        format: The target format.
+        compact_schemas: Whether to de-duplicate repeated subschemas of each tool's parameters
+            with `$defs` and `$ref`, for the formats that resolve them (MCP and OpenAI).
+    """
+    logger.debug("Converting {} tools to {} format.", len(tools), format.value)
     if format == ToolFormat.NATIVE:
         return [convert_to_native_tool(tool) for tool in tools]
     if format == ToolFormat.MCP:
-        return [convert_tool_to_mcp_tool(tool) for tool in tools]
+        return [convert_tool_to_mcp_tool(tool, compact_schemas=compact_schemas) for tool in tools]
     if format == ToolFormat.LANGCHAIN:
         return [convert_tool_to_langchain_tool(tool) for tool in tools]
     if format == ToolFormat.OPENAI:
-        return [convert_tool_to_openai_tool(tool) for tool in tools]
+        return [convert_tool_to_openai_tool(tool, compact_schemas=compact_schemas) for tool in tools]
     raise ValueError(f"Invalid format: {format}")
 
 
+def _export_parameters(tool: Tool | CompactTool, compact: bool) -> dict[str, Any]:
+    """Get the parameters schema to export, compacted if requested.
+
+    Compacted schemas and the interned schemas of `CompactTool`s share
+    fragments with other tools, so callers get a copy they are free to modify.
+    """
+    if compact:
+        return copy.deepcopy(compact_schema(tool.parameters))
+    return _export_schema(tool, tool.parameters)
+
+
+def _export_schema(tool: Tool | CompactTool, schema: dict[str, Any] | None) -> dict[str, Any] | None:
+    """Copy a schema of a `CompactTool`, which is interned and shared with other tools."""
+    return copy.deepcopy(schema) if isinstance(tool, CompactTool) else schema
+
+
 def convert_to_native_tool(tool: Tool) -> Callable[..., Any]:
     """Decorator to convert a Tool object to a native tool."""
 
@@ -48,12 +74,11 @@ def convert_to_native_tool(tool: Tool) -> Callable[..., Any]:
 
 def convert_tool_to_mcp_tool(
     tool: Tool,
+    compact_schemas: bool = False,
 ):
     from mcp.server.fastmcp.server import MCPTool
     from mcp.types import ToolAnnotations
 
-    logger.debug(f"Converting tool '{tool.name}' to MCP format")
-
     annotations = None
     annotations = None
     if tool.tags:
@@ -69,11 +94,11 @@ def convert_tool_to_mcp_tool(
     mcp_tool = MCPTool(
         name=tool.name[:63],
         description=tool.description or "",
-        inputSchema=tool.parameters,
-        outputSchema=tool.output_schema,
+        inputSchema=_export_parameters(tool, compact_schemas),
+        outputSchema=_export_schema(tool, tool.output_schema),
         annotations=annotations,
     )
-    logger.debug(f"Successfully converted tool '{tool.name}' to MCP format")
+    logger.debug("Converted tool '{}' to MCP format", tool.name)
     return mcp_tool
 
 
@@ -86,15 +111,12 @@ def format_to_mcp_result(result: Any) -> list[TextContent]:
     Returns:
         List of TextContent objects
     """
-    logger.debug(f"Formatting result to MCP format, type: {type(result)}")
     if isinstance(result, str):
-        logger.debug("Result is string, wrapping in TextContent")
         return [TextContent(type="text", text=result)]
     elif isinstance(result, list) and all(isinstance(item, TextContent) for item in result):
-        logger.debug("Result is already list of TextContent objects")
         return result
     else:
-        logger.warning(f"Tool returned unexpected type: {type(result)}. Wrapping in TextContent.")
+        logger.warning("Tool returned unexpected type: {}. Wrapping in TextContent.", type(result))
         return [TextContent(type="text", text=str(result))]
 
 
@@ -112,15 +134,14 @@ def convert_tool_to_langchain_tool(
         a LangChain tool
     """
 
-    logger.debug(f"Converting tool '{tool.name}' to LangChain format")
     full_docstring = inspect.getdoc(tool.fn)
 
     async def call_tool(
         **arguments: dict[str, Any],
     ):
-        logger.debug(f"Executing LangChain tool '{tool.name}' with arguments: {arguments}")
+        logger.debug("Executing LangChain tool '{}' with arguments: {}", tool.name, arguments)
         call_tool_result = await tool.run(arguments)
-        logger.debug(f"Tool '{tool.name}' execution completed")
+        logger.debug("Tool '{}' execution completed", tool.name)
         return call_tool_result
 
     langchain_tool = StructuredTool(
@@ -128,26 +149,26 @@ def convert_tool_to_langchain_tool(
         description=full_docstring or tool.description or "",
         coroutine=call_tool,
         response_format="content",
-        args_schema=tool.parameters,
+        args_schema=_export_schema(tool, tool.parameters),
     )
-    logger.debug(f"Successfully converted tool '{tool.name}' to LangChain format")
+    logger.debug("Converted tool '{}' to LangChain format", tool.name)
     return langchain_tool
 
 
 def convert_tool_to_openai_tool(
     tool: Tool,
+    compact_schemas: bool = False,
 ):
     """Convert a Tool object to an OpenAI function."""
-    logger.debug(f"Converting tool '{tool.name}' to OpenAI format")
     openai_tool = {
         "type": "function",
         "function": {
             "name": tool.name,
             "description": tool.description,
-            "parameters": tool.parameters,
+            "parameters": _export_parameters(tool, compact_schemas),
         },
     }
-    logger.debug(f"Successfully converted tool '{tool.name}' to OpenAI format")
+    logger.debug("Converted tool '{}' to OpenAI format", tool.name)
     return openai_tool
 
 
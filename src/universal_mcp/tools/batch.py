@@ -0,0 +1,88 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from functools import partial
+from typing import Any
+
+from loguru import logger
+
+DEFAULT_BATCH_CONCURRENCY = 16
+DEFAULT_BATCH_GROUP_CONCURRENCY = 4
+
+ToolCall = tuple[str, dict[str, Any]]
+
+
+@dataclass
+class ToolCallResult:
+    """Outcome of one call in a batch: either a result or the error it raised."""
+
+    tool_name: str
+    result: Any = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+async def run_tool_batch(
+    batch: Sequence[ToolCall],
+    call: Callable[[str, dict[str, Any]], Awaitable[Any]],
+    group_key: Callable[[str], str],
+    max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    max_concurrency_per_group: int = DEFAULT_BATCH_GROUP_CONCURRENCY,
+) -> list[ToolCallResult]:
+    """Run a batch of tool calls concurrently.
+
+    Calls are limited globally and per group (e.g. per app or per server), so
+    a batch hitting a single upstream does not open more connections than it
+    allows. A failing call does not affect the others.
+
+    Args:
+        batch: The (tool name, arguments) pairs to call.
+        call: Coroutine function performing a single call.
+        group_key: Maps a tool name to the group its calls are limited in.
+        max_concurrency: Maximum number of calls running at once.
+        max_concurrency_per_group: Maximum number of calls running at once within a group.
+
+    Returns:
+        One result per call, in the order of the batch.
+    """
+    calls = [(tool_name, group_key(tool_name), partial(call, tool_name, arguments)) for tool_name, arguments in batch]
+    return await run_grouped_calls(calls, max_concurrency, max_concurrency_per_group)
+
+
+async def run_grouped_calls(
+    calls: Sequence[tuple[str, str, Callable[[], Awaitable[Any]]]],
+    max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    max_concurrency_per_group: int = DEFAULT_BATCH_GROUP_CONCURRENCY,
+) -> list[ToolCallResult]:
+    """Run tool calls concurrently, each already assigned to its group.
+
+    Like `run_tool_batch`, for callers that route every call on its own, e.g.
+    to one of several replicas of the same tool.
+
+    Args:
+        calls: (tool name, group, coroutine function performing the call) triples.
+        max_concurrency: Maximum number of calls running at once.
+        max_concurrency_per_group: Maximum number of calls running at once within a group.
+
+    Returns:
+        One result per call, in the order of `calls`.
+    """
+    if max_concurrency < 1 or max_concurrency_per_group < 1:
+        raise ValueError("Batch concurrency limits must be at least 1")
+    limit = asyncio.Semaphore(max_concurrency)
+    group_limits: dict[str, asyncio.Semaphore] = {}
+
+    async def run_one(tool_name: str, group: str, call: Callable[[], Awaitable[Any]]) -> ToolCallResult:
+        group_limit = group_limits.setdefault(group, asyncio.Semaphore(max_concurrency_per_group))
+        # Take the group slot first so calls queued on a busy group do not hold global slots.
+        async with group_limit, limit:
+            try:
+                return ToolCallResult(tool_name, result=await call())
+            except Exception as e:
+                logger.warning("Tool '{}' failed in batch: {}", tool_name, e)
+                return ToolCallResult(tool_name, error=e)
+
+    return list(await asyncio.gather(*(run_one(tool_name, group, call) for tool_name, group, call in calls)))
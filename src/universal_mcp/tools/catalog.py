@@ -0,0 +1,374 @@
+import copy
+import hashlib
+import importlib.machinery
+import importlib.util
+import json
+import os
+from collections.abc import Callable, Iterable
+from functools import cache
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+from pydantic import PrivateAttr
+
+from universal_mcp.applications.application import BaseApplication
+from universal_mcp.applications.utils import get_default_package_name
+from universal_mcp.exceptions import ToolError
+from universal_mcp.tools.compact import CompactTool
+from universal_mcp.tools.tools import Tool
+from universal_mcp.types import ToolConfig
+
+CATALOG_VERSION = 2
+VERSIONED_PACKAGES = ("universal-mcp", "mcp", "pydantic")
+APP_MANIFEST_FILE = "tool_manifest.json"
+
+
+def get_default_catalog_dir() -> Path:
+    """Get the directory where tool catalogs are cached."""
+    return Path.home() / ".universal-mcp" / "cache" / "tool_catalog"
+
+
+def get_package_versions() -> dict[str, str]:
+    """Get the versions of the packages that influence how tools are built."""
+    versions = {}
+    for package in VERSIONED_PACKAGES:
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = "unknown"
+    return versions
+
+
+def _hash_source_files(files: Iterable[Path]) -> str:
+    digest = hashlib.sha256()
+    for path in files:
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _python_files(directory: Path) -> list[Path]:
+    return sorted(path for path in directory.rglob("*.py") if "__pycache__" not in path.parts)
+
+
+@cache
+def get_universal_mcp_source_hash() -> str:
+    """Hash the sources of universal_mcp itself.
+
+    Tool metadata depends on the docstring parser and argument model code, which
+    can change without a version bump in editable and development installs.
+    """
+    return _hash_source_files(_python_files(Path(__file__).resolve().parent.parent))
+
+
+def _find_app_spec(slug: str) -> importlib.machinery.ModuleSpec | None:
+    try:
+        return importlib.util.find_spec(get_default_package_name(slug))
+    except (ImportError, ValueError):
+        return None
+
+
+def get_app_source_hash(slug: str) -> str | None:
+    """Hash the source files of an app package without importing it.
+
+    Args:
+        slug: The app slug.
+
+    Returns:
+        A hex digest over the app's Python sources, or None if the app cannot be located.
+    """
+    spec = _find_app_spec(slug)
+    if spec is None:
+        return None
+
+    if spec.submodule_search_locations:
+        files = sorted(path for location in spec.submodule_search_locations for path in _python_files(Path(location)))
+    elif spec.origin and os.path.isfile(spec.origin):
+        files = [Path(spec.origin)]
+    else:
+        return None
+    return _hash_source_files(files)
+
+
+def serialize_tool(tool: Tool | CompactTool) -> dict[str, Any]:
+    """Serialize the metadata of a tool to a JSON-compatible dictionary."""
+    if isinstance(tool, CompactTool):
+        # Read from the compact fields: binding would keep a full Tool alive for every serialized tool.
+        return {
+            "app_name": tool.app_name,
+            "tool_name": tool.tool_name,
+            "description": tool.description,
+            "args_description": dict(tool.args_description),
+            "returns_description": tool.returns_description,
+            "raises_description": dict(tool.raises_description),
+            "tags": list(tool.tags),
+            "parameters": copy.deepcopy(tool.parameters),
+            "output_schema": copy.deepcopy(tool.output_schema),
+            "is_async": tool.is_async,
+            "timeout": tool.timeout,
+        }
+    return tool.model_dump(mode="json", exclude={"fn_metadata"})
+
+
+def load_app_manifest(slug: str) -> list[dict[str, Any]] | None:
+    """Load the tool manifest shipped with an app package, without importing the app.
+
+    A manifest is only used while it matches the app: it records the hash of
+    the app's sources it was built from, and is ignored once they change.
+
+    Args:
+        slug: The app slug.
+
+    Returns:
+        The manifest's tool entries, or None if the app has no readable, up-to-date manifest.
+    """
+    spec = _find_app_spec(slug)
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    for location in spec.submodule_search_locations:
+        manifest_path = Path(location) / APP_MANIFEST_FILE
+        if not manifest_path.is_file():
+            continue
+        try:
+            manifest = json.loads(manifest_path.read_text())
+            source_hash, tools = manifest["source_hash"], manifest["tools"]
+        except (OSError, json.JSONDecodeError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring invalid tool manifest {manifest_path}: {e}")
+            return None
+        if source_hash != get_app_source_hash(slug):
+            logger.warning(f"Ignoring tool manifest {manifest_path}: it does not match the app's sources")
+            return None
+        return tools
+    return None
+
+
+def build_app_manifest(app: BaseApplication) -> list[dict[str, Any]]:
+    """Build manifest entries for every tool function of an application.
+
+    Args:
+        app: The application instance.
+    """
+    return [serialize_tool(Tool.from_function(function)) for function in app.list_tools()]
+
+
+def write_app_manifest(app: BaseApplication, directory: Path) -> Path:
+    """Write the tool manifest of an application next to its sources.
+
+    Apps shipping a manifest can be registered without being imported. The
+    manifest records the hash of the Python sources in `directory`, and is
+    ignored once they no longer match, so it must be regenerated whenever the
+    app changes.
+
+    Args:
+        app: The application instance.
+        directory: The app package directory.
+
+    Returns:
+        The path of the written manifest.
+    """
+    manifest_path = directory / APP_MANIFEST_FILE
+    manifest = {"source_hash": _hash_source_files(_python_files(directory)), "tools": build_app_manifest(app)}
+    manifest_path.write_text(json.dumps(manifest, indent=2))
+    return manifest_path
+
+
+def _unbound_tool_fn(*args: Any, **kwargs: Any) -> Any:
+    raise ToolError("Tool restored from the catalog has not been bound to its function yet")
+
+
+def _docstring_from_entry(entry: dict[str, Any]) -> str:
+    """Rebuild a Google-style docstring from serialized tool metadata."""
+    sections = [entry.get("description") or ""]
+    if entry.get("args_description"):
+        sections.append(
+            "Args:\n" + "\n".join(f"    {name}: {text}" for name, text in entry["args_description"].items())
+        )
+    if entry.get("returns_description"):
+        sections.append(f"Returns:\n    {entry['returns_description']}")
+    if entry.get("raises_description"):
+        sections.append(
+            "Raises:\n" + "\n".join(f"    {name}: {text}" for name, text in entry["raises_description"].items())
+        )
+    if entry.get("tags"):
+        sections.append(f"Tags:\n    {', '.join(entry['tags'])}")
+    return "\n\n".join(sections)
+
+
+def _lazy_tool_fn(tool: "CachedTool", entry: dict[str, Any]) -> Callable[..., Any]:
+    """Build a stand-in for a cached tool's function that binds the tool when called.
+
+    It carries the tool's name and a docstring rebuilt from the cached
+    metadata, so native and LangChain exports work without importing the app.
+    """
+    if tool.is_async:
+
+        async def fn(*args: Any, **kwargs: Any) -> Any:
+            return await tool.bind().fn(*args, **kwargs)
+    else:
+
+        def fn(*args: Any, **kwargs: Any) -> Any:
+            return tool.bind().fn(*args, **kwargs)
+
+    fn.__name__ = fn.__qualname__ = tool.tool_name
+    fn.__doc__ = _docstring_from_entry(entry)
+    return fn
+
+
+class CachedTool(Tool):
+    """Tool restored from a catalog whose function is bound on first call.
+
+    Exposes the same metadata as the tool it was built from, so it can be
+    listed and exported without importing its application. Its `fn` is a
+    stand-in with the cached docstring; the first call to it or to `run`
+    resolves the real tool (importing and instantiating the app) and
+    delegates to it from then on.
+    """
+
+    _resolver: Callable[[], Tool] | None = PrivateAttr(default=None)
+    _bound_tool: Tool | None = PrivateAttr(default=None)
+
+    @classmethod
+    def from_catalog_entry(cls, entry: dict[str, Any], resolver: Callable[[], Tool]) -> "CachedTool":
+        """Create a CachedTool from a serialized catalog entry.
+
+        Args:
+            entry: The serialized tool metadata.
+            resolver: Callable building the real tool when it is first needed.
+        """
+        tool = cls(fn=_unbound_tool_fn, **entry)
+        tool.fn = _lazy_tool_fn(tool, entry)
+        tool._resolver = resolver
+        return tool
+
+    @property
+    def is_bound(self) -> bool:
+        return self._bound_tool is not None
+
+    def bind(self) -> Tool:
+        """Resolve the real tool, importing its application if needed."""
+        if self._bound_tool is None:
+            if self._resolver is None:
+                raise ToolError(f"Tool {self.name} has no resolver to bind it")
+            try:
+                self._bound_tool = self._resolver()
+            except Exception as e:
+                raise ToolError(f"Failed to load tool {self.name}: {e}") from e
+            logger.debug("Bound cached tool '{}'", self.name)
+        return self._bound_tool
+
+    async def run(
+        self,
+        arguments: dict[str, Any],
+        context: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> Any:
+        """Bind the tool if needed, then run it with arguments."""
+        return await self.bind().run(
+            arguments, context=context, timeout=timeout if timeout is not None else self.timeout
+        )
+
+
+class ToolCatalog:
+    """On-disk snapshot of the tools registered for each app.
+
+    Entries are keyed per app by the app's source hash and the requested
+    actions, and the whole catalog is tied to the catalog format, the
+    versions of the packages that shape tool metadata and the universal_mcp
+    sources. Any mismatch makes the affected app fall back to a regular import.
+    """
+
+    def __init__(self, path: Path):
+        """Initialize the catalog, reading it from disk if it exists.
+
+        Args:
+            path: Path of the catalog file.
+        """
+        self.path = path
+        self._environment = {
+            "catalog_version": CATALOG_VERSION,
+            **get_package_versions(),
+            "universal_mcp_sources": get_universal_mcp_source_hash(),
+        }
+        self._apps: dict[str, dict[str, Any]] = self._read()
+        self._dirty = False
+
+    @classmethod
+    def for_tool_config(cls, tool_config: ToolConfig, directory: Path | None = None) -> "ToolCatalog":
+        """Get the catalog for a set of apps and actions.
+
+        Args:
+            tool_config: Mapping of app names to the actions to load.
+            directory: Directory holding catalog files. Defaults to `get_default_catalog_dir()`.
+        """
+        config_key = json.dumps({app: sorted(actions or []) for app, actions in tool_config.items()}, sort_keys=True)
+        file_name = f"catalog_{hashlib.sha256(config_key.encode()).hexdigest()[:16]}.json"
+        return cls((directory or get_default_catalog_dir()) / file_name)
+
+    def _read(self) -> dict[str, dict[str, Any]]:
+        if not self.path.exists():
+            return {}
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable tool catalog {self.path}: {e}")
+            return {}
+        if data.get("environment") != self._environment:
+            logger.info(f"Tool catalog {self.path} was built for a different environment, rebuilding")
+            return {}
+        return data.get("apps", {})
+
+    @staticmethod
+    def _app_key(app_name: str, actions: list[str] | None) -> dict[str, Any] | None:
+        source_hash = get_app_source_hash(app_name)
+        if source_hash is None:
+            return None
+        return {"source_hash": source_hash, "actions": sorted(actions or [])}
+
+    def get_app_tools(self, app_name: str, actions: list[str] | None) -> list[dict[str, Any]] | None:
+        """Get the cached tool entries for an app, or None if missing or stale.
+
+        Args:
+            app_name: The app name.
+            actions: The actions requested for the app.
+        """
+        cached = self._apps.get(app_name)
+        if not cached:
+            return None
+        key = self._app_key(app_name, actions)
+        if key is None or cached.get("key") != key:
+            logger.debug(f"Tool catalog entry for app '{app_name}' is stale")
+            return None
+        return cached["tools"]
+
+    def set_app_tools(self, app_name: str, actions: list[str] | None, tools: list[Tool]) -> None:
+        """Record the tools registered for an app.
+
+        Args:
+            app_name: The app name.
+            actions: The actions requested for the app.
+            tools: The tools registered for the app.
+        """
+        key = self._app_key(app_name, actions)
+        if key is None:
+            return
+        self._apps[app_name] = {
+            "key": key,
+            "tools": [serialize_tool(tool) for tool in tools],
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the catalog to disk if it changed."""
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps({"environment": self._environment, "apps": self._apps}))
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+            logger.info(f"Saved tool catalog to {self.path}")
+        except OSError as e:
+            logger.warning(f"Failed to save tool catalog {self.path}: {e}")
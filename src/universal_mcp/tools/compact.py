@@ -0,0 +1,181 @@
+import inspect
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from loguru import logger
+
+from universal_mcp.tools.docstring_parser import parse_docstring
+from universal_mcp.tools.func_metadata import FuncMetadata
+from universal_mcp.tools.schema_interning import intern_schema, intern_tags
+from universal_mcp.tools.tools import Tool, _get_return_type_schema, _timeout_from_tags
+from universal_mcp.types import TOOL_NAME_SEPARATOR
+
+
+class CompactTool:
+    """Memory-compact representation of a tool for processes holding many of them.
+
+    Keeps only what listing, filtering and exporting a tool need, in slots:
+    tags are interned tuples shared between tools with the same tags, the
+    parameter and output schemas are interned so identical fragments are held
+    once (they must not be modified), and the argument, return and raises
+    descriptions are dropped unless `keep_docs` is set; dropped descriptions
+    are parsed again from the docstring when read. The pydantic argument model
+    is not kept either: the first call builds the full `Tool` and delegates to it.
+    """
+
+    __slots__ = (
+        "fn",
+        "app_name",
+        "tool_name",
+        "description",
+        "_tags",
+        "parameters",
+        "output_schema",
+        "is_async",
+        "timeout",
+        "_docs",
+        "_bound_tool",
+    )
+
+    def __init__(
+        self,
+        fn: Callable[..., Any],
+        tool_name: str,
+        parameters: dict[str, Any],
+        is_async: bool,
+        app_name: str | None = None,
+        description: str | None = None,
+        tags: Iterable[str] = (),
+        output_schema: dict[str, Any] | None = None,
+        timeout: float | None = None,
+        docs: tuple[dict[str, str], str, dict[str, str]] | None = None,
+    ):
+        self.fn = fn
+        self.app_name = app_name
+        self.tool_name = tool_name
+        self.description = description
+        self.tags = tags
+        self.parameters = intern_schema(parameters)
+        self.output_schema = intern_schema(output_schema)
+        self.is_async = is_async
+        self.timeout = timeout
+        self._docs = docs
+        self._bound_tool: Tool | None = None
+
+    @classmethod
+    def from_function(cls, fn: Callable[..., Any], name: str | None = None, keep_docs: bool = False) -> "CompactTool":
+        """Create a compact tool from a function, without keeping its argument model.
+
+        Args:
+            fn: The tool function.
+            name: Optional name overriding the function name.
+            keep_docs: Whether to keep the argument, return and raises descriptions.
+        """
+        func_name = name or fn.__name__
+        if func_name == "<lambda>":
+            raise ValueError("You must provide a name for lambda functions")
+
+        parsed_doc = parse_docstring(inspect.getdoc(fn))
+        fn_metadata = FuncMetadata.func_metadata(fn, arg_description=parsed_doc["args"], cache=False)
+        parameters = fn_metadata.arg_model.model_json_schema()
+        parameters["title"] = f"{fn.__name__}Arguments"
+
+        return cls(
+            fn=fn,
+            tool_name=func_name,
+            parameters=parameters,
+            is_async=inspect.iscoroutinefunction(fn),
+            description=parsed_doc["summary"],
+            tags=parsed_doc["tags"],
+            output_schema=_get_return_type_schema(inspect.signature(fn).return_annotation),
+            timeout=_timeout_from_tags(parsed_doc["tags"]),
+            docs=_docs_from_parsed(parsed_doc) if keep_docs else None,
+        )
+
+    @classmethod
+    def from_tool(cls, tool: Tool, keep_docs: bool = False) -> "CompactTool":
+        """Create a compact copy of a tool.
+
+        Args:
+            tool: The tool to copy.
+            keep_docs: Whether to keep the argument, return and raises descriptions.
+        """
+        return cls(
+            fn=tool.fn,
+            tool_name=tool.tool_name,
+            parameters=tool.parameters,
+            is_async=tool.is_async,
+            app_name=tool.app_name,
+            description=tool.description,
+            tags=tool.tags,
+            output_schema=tool.output_schema,
+            timeout=tool.timeout,
+            docs=(tool.args_description, tool.returns_description, tool.raises_description) if keep_docs else None,
+        )
+
+    @property
+    def name(self) -> str:
+        return f"{self.app_name}{TOOL_NAME_SEPARATOR}{self.tool_name}" if self.app_name else self.tool_name
+
+    @property
+    def tags(self) -> tuple[str, ...]:
+        return self._tags
+
+    @tags.setter
+    def tags(self, tags: Iterable[str]) -> None:
+        self._tags = intern_tags(tags)
+
+    def _get_docs(self) -> tuple[dict[str, str], str, dict[str, str]]:
+        if self._docs is not None:
+            return self._docs
+        return _docs_from_parsed(parse_docstring(inspect.getdoc(self.fn)))
+
+    @property
+    def args_description(self) -> dict[str, str]:
+        return self._get_docs()[0]
+
+    @property
+    def returns_description(self) -> str:
+        return self._get_docs()[1]
+
+    @property
+    def raises_description(self) -> dict[str, str]:
+        return self._get_docs()[2]
+
+    @property
+    def fn_metadata(self) -> FuncMetadata | None:
+        return self.bind().fn_metadata
+
+    def bind(self) -> Tool:
+        """Build the full tool, with its argument model, on first use."""
+        if self._bound_tool is None:
+            tool = Tool.from_function(self.fn, name=self.tool_name)
+            tool.app_name = self.app_name
+            tool.tags = list(self.tags)
+            tool.timeout = self.timeout
+            self._bound_tool = tool
+            logger.debug("Bound compact tool '{}'", self.name)
+        return self._bound_tool
+
+    async def run(
+        self,
+        arguments: dict[str, Any],
+        context: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> Any:
+        """Build the full tool if needed, then run it with arguments."""
+        return await self.bind().run(
+            arguments, context=context, timeout=timeout if timeout is not None else self.timeout
+        )
+
+    def __repr__(self) -> str:
+        return f"CompactTool(name={self.name!r})"
+
+
+def _docs_from_parsed(parsed_doc: dict[str, Any]) -> tuple[dict[str, str], str, dict[str, str]]:
+    args_description = {
+        arg_name: arg_details.get("description") or ""
+        for arg_name, arg_details in (parsed_doc.get("args") or {}).items()
+        if isinstance(arg_details, dict)
+    }
+    return args_description, parsed_doc["returns"], parsed_doc["raises"]
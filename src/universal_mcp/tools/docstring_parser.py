@@ -1,6 +1,53 @@
 import re
+from functools import lru_cache
 from typing import Any
 
+# Section headers that occupy a whole line, keyed by their lowercased text.
+_SECTION_HEADERS: dict[str, str] = {
+    "args:": "args",
+    "arguments:": "args",
+    "parameters:": "args",
+    "returns:": "returns",
+    "yields:": "returns",
+    "raises:": "raises",
+    "errors:": "raises",
+    "exceptions:": "raises",
+    "tags:": "tags",
+    "attributes:": "other",
+    "see also:": "other",
+    "example:": "other",
+    "examples:": "other",
+    "notes:": "other",
+    "todo:": "other",
+    "fixme:": "other",
+    "warning:": "other",
+    "warnings:": "other",
+}
+
+# Headers that may carry content on the same line, e.g. "Tags: important, search".
+_INLINE_HEADER_PATTERN = re.compile(r"(?:(?:raises|errors|exceptions) |tags)", re.IGNORECASE)
+_INLINE_HEADER_TYPES: dict[str, str] = {"r": "raises", "e": "raises", "t": "tags"}
+_HEADER_CONTENT_PATTERN = re.compile(r"[^:\s]*[:\s]+(.*)", re.DOTALL)
+_KEY_PATTERN = re.compile(r"^\s*([\w\.]+)\s*(?:\((.*?)\))?:\s*(.*)")
+
+DOCSTRING_CACHE_SIZE = 8192
+
+
+def _empty_result() -> dict[str, Any]:
+    return {"summary": "", "args": {}, "returns": "", "raises": {}, "tags": []}
+
+
+def _match_section_header(stripped_line: str) -> tuple[str | None, str]:
+    """Returns the section type and inline header content for a stripped line, if it is a header."""
+    section_type = _SECTION_HEADERS.get(stripped_line.lower())
+    if section_type is not None:
+        return section_type, ""
+    if not _INLINE_HEADER_PATTERN.match(stripped_line):
+        return None, ""
+    content_match = _HEADER_CONTENT_PATTERN.match(stripped_line)
+    header_content = content_match.group(1).strip() if content_match else ""
+    return _INLINE_HEADER_TYPES[stripped_line[0].lower()], header_content
+
 
 def parse_docstring(docstring: str | None) -> dict[str, Any]:
     """
@@ -12,6 +59,9 @@ def parse_docstring(docstring: str | None) -> dict[str, Any]:
     to parse key-value pairs within 'Args:' and 'Raises:' sections, including
     type information for arguments if present in the docstring.
 
+    Results are memoized per docstring, so registering many tools that share
+    docstrings (or re-registering the same app) only parses each one once.
+
     Args:
         docstring: The docstring string to parse, or None.
 
@@ -26,11 +76,24 @@ def parse_docstring(docstring: str | None) -> dict[str, Any]:
         - 'tags': A list of strings found in the 'Tags:' section.
     """
     if not docstring:
-        return {"summary": "", "args": {}, "returns": "", "raises": {}, "tags": []}
+        return _empty_result()
+
+    parsed = _parse_docstring_cached(docstring)
+    # Hand out copies so callers can never mutate the cached entry.
+    return {
+        "summary": parsed["summary"],
+        "args": {name: dict(details) for name, details in parsed["args"].items()},
+        "returns": parsed["returns"],
+        "raises": dict(parsed["raises"]),
+        "tags": list(parsed["tags"]),
+    }
 
+
+@lru_cache(maxsize=DOCSTRING_CACHE_SIZE)
+def _parse_docstring_cached(docstring: str) -> dict[str, Any]:
     lines = docstring.strip().splitlines()
     if not lines:
-        return {"summary": "", "args": {}, "returns": "", "raises": {}, "tags": []}
+        return _empty_result()
 
     summary: str = ""
     summary_lines: list[str] = []
@@ -44,10 +107,8 @@ def parse_docstring(docstring: str | None) -> dict[str, Any]:
     current_desc_lines: list[str] = []
     current_arg_type_str: str | None = None
 
-    key_pattern = re.compile(r"^\s*([\w\.]+)\s*(?:\((.*?)\))?:\s*(.*)")
-
     def finalize_current_item():
-        nonlocal returns, tags, args, raises, current_arg_type_str
+        nonlocal returns, tags
         desc = " ".join(current_desc_lines).strip()
 
         if current_section == "args" and current_key:
@@ -63,53 +124,14 @@ def parse_docstring(docstring: str | None) -> dict[str, Any]:
             if desc:
                 returns = desc
         elif current_section == "tags":
-            tags.clear()
-            tags.extend([tag.strip() for tag in desc.split(",") if tag.strip()])
-
-    def check_for_section_header(line: str) -> tuple[bool, str | None, str]:
-        stripped_lower = line.strip().lower()
-        section_type: str | None = None
-        header_content = ""
-
-        if stripped_lower in ("args:", "arguments:", "parameters:"):
-            section_type = "args"
-        elif stripped_lower in ("returns:", "yields:"):
-            section_type = "returns"
-        elif stripped_lower in ("raises:", "errors:", "exceptions:"):
-            section_type = "raises"
-        elif stripped_lower in ("tags:",):
-            section_type = "tags"
-        elif stripped_lower.startswith(("raises ", "errors ", "exceptions ")):
-            section_type = "raises"
-            parts = re.split(r"[:\s]+", line.strip(), maxsplit=1)
-            if len(parts) > 1:
-                header_content = parts[1].strip()
-        elif stripped_lower.startswith(("tags",)):  # Match "tags" without colon for header content
-            section_type = "tags"
-            parts = re.split(r"[:\s]+", line.strip(), maxsplit=1)
-            if len(parts) > 1:
-                header_content = parts[1].strip()
-        elif stripped_lower.endswith(":") and stripped_lower[:-1] in (
-            "attributes",
-            "see also",
-            "example",
-            "examples",
-            "notes",
-            "todo",
-            "fixme",
-            "warning",
-            "warnings",
-        ):
-            section_type = "other"
-        return section_type is not None, section_type, header_content
+            tags = [tag.strip() for tag in desc.split(",") if tag.strip()]
 
     in_summary = True
 
     for line in lines:
         stripped_line = line.strip()
-        original_indentation = len(line) - len(line.lstrip(" "))
-        is_new_section_header, new_section_type_this_line, header_content_this_line = check_for_section_header(line)
-        should_finalize_previous = False
+        new_section_type, header_content = _match_section_header(stripped_line) if stripped_line else (None, "")
+        is_new_section_header = new_section_type is not None
 
         if in_summary:
             if not stripped_line or is_new_section_header:
@@ -122,47 +144,37 @@ def parse_docstring(docstring: str | None) -> dict[str, Any]:
                 summary_lines.append(stripped_line)
                 continue
 
+        is_unindented = bool(stripped_line) and not line.startswith(" ")
+        key_match = _KEY_PATTERN.match(line) if current_section in ("args", "raises") else None
+
         if (
             is_new_section_header
             or (not stripped_line and (current_desc_lines or current_key is not None))
-            or (
-                current_section in ["args", "raises"]
-                and current_key is not None
-                and (key_pattern.match(line) or (original_indentation == 0 and stripped_line))
-            )
-            or (
-                current_section in ["returns", "tags", "other"]
-                and current_desc_lines
-                and original_indentation == 0
-                and stripped_line  # Ensure it's not an empty unindented line (handled by rule 2)
-            )
+            or (current_section in ("args", "raises") and current_key is not None and (key_match or is_unindented))
+            or (current_section in ("returns", "tags", "other") and current_desc_lines and is_unindented)
         ):
-            should_finalize_previous = True
-
-        if should_finalize_previous:
             finalize_current_item()
             current_key = None
             current_arg_type_str = None
             current_desc_lines = []
 
         if is_new_section_header:
-            current_section = new_section_type_this_line
-            if header_content_this_line:
-                current_desc_lines.append(header_content_this_line)
+            current_section = new_section_type
+            if header_content:
+                current_desc_lines.append(header_content)
             continue
 
         if not stripped_line:
             continue
 
-        if current_section == "args" or current_section == "raises":
-            match = key_pattern.match(line)
-            if match:
-                current_key = match.group(1)
-                current_arg_type_str = match.group(2).strip() if match.group(2) else None
-                current_desc_lines = [match.group(3).strip()]  # Start new description
+        if current_section in ("args", "raises"):
+            if key_match:
+                current_key = key_match.group(1)
+                current_arg_type_str = key_match.group(2).strip() if key_match.group(2) else None
+                current_desc_lines = [key_match.group(3).strip()]  # Start new description
             elif current_key is not None:  # Continuation line for an existing key
                 current_desc_lines.append(stripped_line)
-        elif current_section in ["returns", "tags", "other"]:
+        elif current_section in ("returns", "tags", "other"):
             current_desc_lines.append(stripped_line)
 
     finalize_current_item()  # Finalize any pending item at the end of the docstring
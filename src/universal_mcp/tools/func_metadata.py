@@ -1,6 +1,10 @@
+import asyncio
+import copy
 import inspect
 import json
-from collections.abc import Awaitable, Callable, Sequence
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Sequence
+from functools import lru_cache
 from typing import (
     Annotated,
     Any,
@@ -96,6 +100,60 @@ def _get_typed_signature(call: Callable[..., Any]) -> inspect.Signature:
     return typed_signature
 
 
+def _arg_model_cache_key(
+    signature: inspect.Signature,
+    skip_names: Sequence[str],
+    arg_description: dict[str, dict[str, str | None]],
+) -> Hashable | None:
+    """Builds a key identifying the shape of an argument model, or None if the shape is unhashable.
+
+    Two functions with the same parameters (names, kinds, defaults and resolved
+    annotations) and the same docstring argument descriptions produce identical
+    argument models, so they can share one.
+    """
+    params_key = tuple(
+        (param.name, param.kind, type(param.default), param.default, param.annotation)
+        for param in signature.parameters.values()
+    )
+    description_key = tuple(
+        (name, details.get("description"), details.get("type_str"))
+        for name, details in sorted(arg_description.items())
+        if name in signature.parameters
+    )
+    key = (params_key, tuple(skip_names), description_key)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+ARG_MODEL_CACHE_SIZE = 4096
+# Shared models are named after no function in particular, so validation errors never name another tool.
+SHARED_ARG_MODEL_NAME = "ToolArguments"
+
+# Least recently used argument models by shape, bounded by ARG_MODEL_CACHE_SIZE.
+_ARG_MODEL_CACHE: OrderedDict[Hashable, type["ArgModelBase"]] = OrderedDict()
+
+
+def _get_cached_arg_model(key: Hashable) -> type["ArgModelBase"] | None:
+    arg_model = _ARG_MODEL_CACHE.get(key)
+    if arg_model is not None:
+        _ARG_MODEL_CACHE.move_to_end(key)
+    return arg_model
+
+
+def _cache_arg_model(key: Hashable, arg_model: type["ArgModelBase"]) -> None:
+    _ARG_MODEL_CACHE[key] = arg_model
+    if len(_ARG_MODEL_CACHE) > ARG_MODEL_CACHE_SIZE:
+        _ARG_MODEL_CACHE.popitem(last=False)
+
+
+@lru_cache(maxsize=ARG_MODEL_CACHE_SIZE)
+def _arg_model_json_schema(arg_model: type["ArgModelBase"]) -> dict[str, Any]:
+    return arg_model.model_json_schema()
+
+
 class ArgModelBase(BaseModel):
     def model_dump_one_level(self) -> dict[str, Any]:
         kwargs: dict[str, Any] = {}
@@ -118,18 +176,46 @@ class FuncMetadata(BaseModel):
         arguments_to_validate: dict[str, Any],
         arguments_to_pass_directly: dict[str, Any] | None,
         context: dict[str, Any] | None = None,
+        run_sync_in_thread: bool = False,
     ) -> Any:
+        arguments_parsed_dict = self.validate_arguments(arguments_to_validate, arguments_to_pass_directly)
+        return await self.call_fn(fn, fn_is_async, arguments_parsed_dict, run_sync_in_thread=run_sync_in_thread)
+
+    def validate_arguments(
+        self,
+        arguments_to_validate: dict[str, Any],
+        arguments_to_pass_directly: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Validates arguments against the argument model.
+
+        Returns:
+            The keyword arguments to call the function with.
+
+        Raises:
+            pydantic.ValidationError: If the arguments are invalid.
+        """
         arguments_pre_parsed = self.pre_parse_json(arguments_to_validate)
         arguments_parsed_model = self.arg_model.model_validate(arguments_pre_parsed)
         arguments_parsed_dict = arguments_parsed_model.model_dump_one_level()
 
         arguments_parsed_dict |= arguments_to_pass_directly or {}
+        return arguments_parsed_dict
 
+    async def call_fn(
+        self,
+        fn: Callable[..., Any] | Awaitable[Any],
+        fn_is_async: bool,
+        arguments_parsed_dict: dict[str, Any],
+        run_sync_in_thread: bool = False,
+    ) -> Any:
+        """Calls the function with already validated arguments."""
         if fn_is_async:
             if isinstance(fn, Awaitable):
                 return await fn
             return await fn(**arguments_parsed_dict)
         if isinstance(fn, Callable):
+            if run_sync_in_thread:
+                return await asyncio.to_thread(fn, **arguments_parsed_dict)
             return fn(**arguments_parsed_dict)
         raise TypeError("fn must be either Callable or Awaitable")
 
@@ -153,19 +239,49 @@ class FuncMetadata(BaseModel):
         arbitrary_types_allowed=True,
     )
 
+    def arg_json_schema(self, title: str | None = None) -> dict[str, Any]:
+        """Returns the JSON schema of the argument model.
+
+        The schema is generated once per argument model and copied on every
+        call, so callers are free to modify the returned dictionary.
+
+        Args:
+            title: Optional title overriding the one derived from the model name.
+        """
+        schema = copy.deepcopy(_arg_model_json_schema(self.arg_model))
+        if title is not None:
+            schema["title"] = title
+        return schema
+
     @classmethod
     def func_metadata(
         cls,
         func: Callable[..., Any],
         skip_names: Sequence[str] = (),
         arg_description: dict[str, dict[str, str | None]] | None = None,
+        cache: bool = True,
     ) -> "FuncMetadata":
+        """Builds the argument model of a function.
+
+        Args:
+            func: The function.
+            skip_names: Parameters left out of the model.
+            arg_description: Argument details parsed from the docstring.
+            cache: Whether to share the model with functions of the same shape. Shared models
+                are named `ToolArguments` rather than after the function. Disable it for models
+                that should be freed once the caller drops them.
+        """
         sig = _get_typed_signature(func)
         params = sig.parameters
         dynamic_pydantic_model_params: dict[str, Any] = {}
         globalns = getattr(func, "__globals__", {})
         arg_description_map = arg_description or {}
 
+        # Generated apps expose many endpoints with identical argument shapes; reuse their models.
+        cache_key = _arg_model_cache_key(sig, skip_names, arg_description_map) if cache else None
+        if cache_key is not None and (cached_model := _get_cached_arg_model(cache_key)) is not None:
+            return FuncMetadata(arg_model=cached_model)
+
         for param in params.values():
             if param.name.startswith("_"):
                 raise InvalidSignature(f"Parameter {param.name} of {func.__name__} cannot start with '_'")
@@ -209,10 +325,12 @@ class FuncMetadata(BaseModel):
             dynamic_pydantic_model_params[param.name] = (core_type_for_model, field_info)
 
         arguments_model = create_model(
-            f"{func.__name__}Arguments",
+            SHARED_ARG_MODEL_NAME if cache_key is not None else f"{func.__name__}Arguments",
             **dynamic_pydantic_model_params,
             __base__=ArgModelBase,
         )
+        if cache_key is not None:
+            _cache_arg_model(cache_key, arguments_model)
         return FuncMetadata(arg_model=arguments_model)
 
 
@@ -11,14 +11,20 @@ from universal_mcp.integrations.integration import IntegrationFactory
 from universal_mcp.tools.adapters import convert_tools
 from universal_mcp.tools.registry import ToolRegistry
 from universal_mcp.types import ToolConfig, ToolFormat
+from universal_mcp.utils.tracing import start_span
 
 
 class LocalRegistry(ToolRegistry):
     """A local implementation of the tool registry."""
 
-    def __init__(self, output_dir: str = "output"):
-        """Initialize the LocalRegistry."""
-        super().__init__()
+    def __init__(self, output_dir: str = "output", compact_tools: bool = False):
+        """Initialize the LocalRegistry.
+
+        Args:
+            output_dir: Directory where file outputs of tools are written.
+            compact_tools: Whether to register tools as memory-compact `CompactTool`s.
+        """
+        super().__init__(compact_tools=compact_tools)
         self.output_dir = output_dir
         if not os.path.exists(self.output_dir):
             os.makedirs(self.output_dir)
@@ -95,14 +101,15 @@ class LocalRegistry(ToolRegistry):
             return f"File saved to: {file_path}"
         return data
 
-    async def call_tool(self, tool_name: str, tool_args: dict[str, Any]) -> Any:
+    async def call_tool(self, tool_name: str, tool_args: dict[str, Any], timeout: float | None = None) -> Any:
         """Call a tool and handle its output."""
-        tool = self.tool_manager.get_tool(tool_name)
-        if not tool:
-            raise ToolNotFoundError(f"Tool '{tool_name}' not found.")
+        with start_span("ToolRegistry.call_tool", attributes={"mcp.tool.name": tool_name}):
+            tool = self.tool_manager.get_tool(tool_name)
+            if not tool:
+                raise ToolNotFoundError(f"Tool '{tool_name}' not found.")
 
-        result = await tool.run(tool_args)
-        return self._handle_file_output(result)
+            result = await tool.run(tool_args, timeout=self._get_call_timeout(tool, timeout))
+            return self._handle_file_output(result)
 
     async def list_connected_apps(self) -> list[dict[str, Any]]:
         """Not implemented for LocalRegistry."""
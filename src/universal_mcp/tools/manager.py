@@ -1,14 +1,34 @@
 from collections.abc import Callable
+from functools import partial
 from typing import Any
 
 from loguru import logger
 
 from universal_mcp.applications.application import BaseApplication
+from universal_mcp.tools.catalog import CachedTool
+from universal_mcp.tools.compact import CompactTool
+from universal_mcp.tools.schema_interning import clear_interned_schemas
 from universal_mcp.tools.tools import Tool
 from universal_mcp.tools.utils import get_app_and_tool_name
 from universal_mcp.types import DEFAULT_IMPORTANT_TAG, ToolFormat
 
 
+class _Deferred:
+    """A log argument computed only if the message is emitted.
+
+    Cheaper than `logger.opt(lazy=True)`, which builds a new logger on every
+    call and makes every argument lazy, for the few arguments worth deferring.
+    """
+
+    __slots__ = ("compute",)
+
+    def __init__(self, compute: Callable[[], Any]):
+        self.compute = compute
+
+    def __format__(self, format_spec: str) -> str:
+        return format(self.compute(), format_spec)
+
+
 def _sanitize_tool_names(tool_names: list[str]) -> list[str]:
     """Sanitize tool names by removing empty strings and converting to lowercase."""
     return [get_app_and_tool_name(name)[1].lower() for name in tool_names if name]
@@ -26,16 +46,14 @@ def _filter_by_name(tools: list[Tool], tool_names: list[str] | None) -> list[Too
     """
     if not tool_names:
         return tools
-    logger.debug(f"All tools: {[tool.name for tool in tools]}")
-    logger.debug(f"Filtering tools by names: {tool_names}")
     tool_names_set = set(_sanitize_tool_names(tool_names))
-    logger.debug(f"Tool names set: {tool_names_set}")
-    filtered_tools = []
-    for tool in tools:
-        if tool.tool_name.lower() in tool_names_set:
-            filtered_tools.append(tool)
-            logger.debug(f"Tool '{tool.name}' matched name filter")
-    logger.debug(f"Filtered tools: {[tool.name for tool in filtered_tools]}")
+    filtered_tools = [tool for tool in tools if tool.tool_name.lower() in tool_names_set]
+    logger.debug(
+        "Filtered {} tools by names {}: {}",
+        len(tools),
+        _Deferred(lambda: sorted(tool_names_set)),
+        _Deferred(lambda: [tool.name for tool in filtered_tools]),
+    )
     return filtered_tools
 
 
@@ -52,8 +70,6 @@ def _filter_by_tags(tools: list[Tool], tags: list[str] | None) -> list[Tool]:
     if not tags:
         return tools
 
-    logger.debug(f"Filtering tools by tags: {tags}")
-
     # Handle special "all" tag
     if "all" in tags:
         return tools
@@ -67,11 +83,35 @@ def _filter_by_tags(tools: list[Tool], tags: list[str] | None) -> list[Tool]:
         tool_tags = {tag.lower() for tag in tool.tags}
         if tags_set & tool_tags:  # Check for any matching tags
             filtered_tools.append(tool)
-            logger.debug(f"Tool '{tool.name}' matched tags: {tags_set & tool_tags}")
 
+    logger.debug(
+        "Filtered {} tools by tags {}: {}", len(tools), tags, _Deferred(lambda: [tool.name for tool in filtered_tools])
+    )
     return filtered_tools
 
 
+def _filter_app_tools(tools: list[Tool], tool_names: list[str] | None, tags: list[str] | None) -> list[Tool]:
+    """Select the tools of an app to register.
+
+    Args:
+        tools: All tools of the app.
+        tool_names: Optional list of tool names to select.
+        tags: Optional list of tags to select.
+
+    Returns:
+        The selected tools; tools tagged as important when neither names nor tags are given.
+    """
+    if tags:
+        tools = _filter_by_tags(tools, tags)
+
+    if tool_names:
+        tools = _filter_by_name(tools, tool_names)
+
+    if not tool_names and not tags:
+        tools = _filter_by_tags(tools, [DEFAULT_IMPORTANT_TAG])
+    return tools
+
+
 class ToolManager:
     """
     Manages tools
@@ -81,15 +121,28 @@ class ToolManager:
     Tools are organized by their source application for better management.
     """
 
-    def __init__(self, warn_on_duplicate_tools: bool = True, default_format: ToolFormat = ToolFormat.MCP):
+    def __init__(
+        self,
+        warn_on_duplicate_tools: bool = True,
+        default_format: ToolFormat = ToolFormat.MCP,
+        compact_tools: bool = False,
+    ):
         """Initialize the ToolManager.
 
         Args:
             warn_on_duplicate_tools: Whether to warn when duplicate tool names are detected.
+            compact_tools: Whether to register functions as memory-compact `CompactTool`s,
+                for processes holding many tools.
         """
         self._all_tools: dict[str, Tool] = {}
         self.warn_on_duplicate_tools = warn_on_duplicate_tools
         self.default_format = default_format
+        self.compact_tools = compact_tools
+
+    def _tool_from_function(self, fn: Callable[..., Any], name: str | None = None) -> Tool:
+        if self.compact_tools:
+            return CompactTool.from_function(fn, name=name)
+        return Tool.from_function(fn, name=name)
 
     def get_tool(self, name: str) -> Tool | None:
         """Get tool by name.
@@ -121,7 +174,7 @@ class ToolManager:
         tools = _filter_by_name(tools, tool_names)
         return tools
 
-    def add_tool(self, fn: Callable[..., Any] | Tool, name: str | None = None) -> Tool:
+    def add_tool(self, fn: Callable[..., Any] | Tool | CompactTool, name: str | None = None) -> Tool:
         """Add a tool to the manager.
 
         Args:
@@ -134,7 +187,7 @@ class ToolManager:
         Raises:
             ValueError: If the tool name is invalid.
         """
-        tool = fn if isinstance(fn, Tool) else Tool.from_function(fn, name=name)
+        tool = fn if isinstance(fn, Tool | CompactTool) else self._tool_from_function(fn, name=name)
 
         existing = self._all_tools.get(tool.name)
         if existing:
@@ -144,10 +197,10 @@ class ToolManager:
                         f"Tool '{tool.name}' already exists with a different function. Skipping addition of new function."
                     )
                 else:
-                    logger.debug(f"Tool '{tool.name}' already exists with the same function.")
+                    logger.debug("Tool '{}' already exists with the same function.", tool.name)
             return existing
 
-        logger.debug(f"Adding tool: {tool.name}")
+        logger.debug("Adding tool: {}", tool.name)
         self._all_tools[tool.name] = tool
         return tool
 
@@ -178,6 +231,9 @@ class ToolManager:
     def clear_tools(self) -> None:
         """Remove all registered tools."""
         self._all_tools.clear()
+        if self.compact_tools:
+            # Free the schema fragments the removed compact tools were sharing.
+            clear_interned_schemas()
 
     def register_tools_from_app(
         self,
@@ -212,22 +268,44 @@ class ToolManager:
                 continue
 
             try:
-                tool_instance = Tool.from_function(function)
+                tool_instance = self._tool_from_function(function)
                 tool_instance.app_name = app.name
                 if app.name not in tool_instance.tags:
-                    tool_instance.tags.append(app.name)
+                    tool_instance.tags = [*tool_instance.tags, app.name]
                 tools.append(tool_instance)
             except Exception as e:
                 tool_name = getattr(function, "__name__", "unknown")
                 logger.error(f"Failed to create Tool from '{tool_name}' in {app.name}: {e}")
         # logger.debug([tool.name for tool in tools])
-        if tags:
-            tools = _filter_by_tags(tools, tags)
+        self.register_tools(_filter_app_tools(tools, tool_names, tags))
 
-        if tool_names:
-            tools = _filter_by_name(tools, tool_names)
+    def register_tools_from_manifest(
+        self,
+        app_name: str,
+        entries: list[dict[str, Any]],
+        resolver: Callable[[str], Tool],
+        tool_names: list[str] | None = None,
+        tags: list[str] | None = None,
+    ) -> None:
+        """Register tools of an application from manifest entries without loading it.
 
-        if not tool_names and not tags:
-            tools = _filter_by_tags(tools, [DEFAULT_IMPORTANT_TAG])
+        Args:
+            app_name: Name of the application the entries belong to.
+            entries: Serialized tool metadata, one entry per tool function.
+            resolver: Called with a tool's function name to build the real tool on its first call.
+            tool_names: Optional list of specific tool names to register.
+            tags: Optional list of tags to filter tools by.
+        """
+        tools = []
+        for entry in entries:
+            try:
+                tool_instance = CachedTool.from_catalog_entry(entry, partial(resolver, entry["tool_name"]))
+            except Exception as e:
+                logger.error(f"Invalid manifest entry for app '{app_name}': {e}")
+                continue
+            tool_instance.app_name = app_name
+            if app_name not in tool_instance.tags:
+                tool_instance.tags.append(app_name)
+            tools.append(tool_instance)
 
-        self.register_tools(tools)
+        self.register_tools(_filter_app_tools(tools, tool_names, tags))
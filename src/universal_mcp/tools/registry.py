@@ -1,13 +1,26 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from functools import partial
 from typing import Any
 
 from loguru import logger
 
 from universal_mcp.applications.application import BaseApplication
+from universal_mcp.exceptions import ToolNotFoundError
 from universal_mcp.tools.adapters import convert_tools
+from universal_mcp.tools.batch import (
+    DEFAULT_BATCH_CONCURRENCY,
+    DEFAULT_BATCH_GROUP_CONCURRENCY,
+    ToolCall,
+    ToolCallResult,
+    run_tool_batch,
+)
+from universal_mcp.tools.catalog import CachedTool, ToolCatalog, load_app_manifest
 from universal_mcp.tools.manager import ToolManager
-from universal_mcp.tools.utils import list_to_tool_config, tool_config_to_list
+from universal_mcp.tools.tools import Tool
+from universal_mcp.tools.utils import get_app_and_tool_name, list_to_tool_config, tool_config_to_list
 from universal_mcp.types import ToolConfig, ToolFormat
+from universal_mcp.utils.tracing import start_span
 
 
 class ToolRegistry(ABC):
@@ -16,19 +29,29 @@ class ToolRegistry(ABC):
     shared tool loading functionality.
     """
 
-    def __init__(self):
-        """Initializes the registry and its internal tool manager."""
+    def __init__(self, compact_tools: bool = False):
+        """Initializes the registry and its internal tool manager.
+
+        Args:
+            compact_tools: Whether to register tools as memory-compact `CompactTool`s.
+        """
         self._app_instances = {}
-        self.tool_manager = ToolManager()
+        self.tool_manager = ToolManager(compact_tools=compact_tools)
+        # Timeout in seconds for calls to tools that do not set their own.
+        self.default_tool_timeout: float | None = None
         logger.debug(f"{self.__class__.__name__} initialized.")
 
+    def _get_app_instance(self, app_name: str) -> BaseApplication:
+        """Get the app instance for an app name, creating it on first use."""
+        if app_name not in self._app_instances:
+            self._app_instances[app_name] = self._create_app_instance(app_name)
+        return self._app_instances[app_name]
+
     def _load_tools_from_app(self, app_name: str, tool_names: list[str] | None) -> None:
         """Helper method to load and register tools for an app."""
         logger.info(f"Loading tools for app '{app_name}' (tools: {tool_names or 'default'})")
         try:
-            if app_name not in self._app_instances:
-                self._app_instances[app_name] = self._create_app_instance(app_name)
-            app_instance = self._app_instances[app_name]
+            app_instance = self._get_app_instance(app_name)
             self.tool_manager.register_tools_from_app(app_instance, tool_names=tool_names)
             logger.info(f"Successfully registered tools for app: {app_name}")
         except Exception as e:
@@ -40,11 +63,57 @@ class ToolRegistry(ABC):
         for app_name, tool_names in tool_config.items():
             self._load_tools_from_app(app_name, tool_names or None)
 
-    def _load_tools_from_tool_config(self, tool_config: ToolConfig) -> None:
-        """Load tools from a ToolConfig dictionary."""
-        logger.debug(f"Loading tools from tool_config: {tool_config}")
+    def _load_tools_from_tool_config(self, tool_config: ToolConfig, catalog: ToolCatalog | None = None) -> None:
+        """Load tools from a ToolConfig dictionary.
+
+        When a catalog is given, apps are registered without being imported
+        if their tool metadata is available, either from an up-to-date entry in
+        the catalog or from an up-to-date manifest shipped with the app; their
+        functions are bound on first call. Other apps are loaded normally and
+        recorded in the catalog.
+        """
+        logger.debug("Loading tools from tool_config: {}", tool_config)
         for app_name, tool_names in tool_config.items():
+            if catalog is None:
+                self._load_tools_from_app(app_name, tool_names or None)
+                continue
+
+            entries = catalog.get_app_tools(app_name, tool_names)
+            if entries is not None:
+                self._load_tools_from_catalog_entries(app_name, entries)
+                continue
+
+            manifest = load_app_manifest(app_name)
+            if manifest is not None:
+                logger.info(f"Loading tools for app '{app_name}' from its tool manifest")
+                self.tool_manager.register_tools_from_manifest(
+                    app_name, manifest, partial(self._bind_tool, app_name), tool_names=tool_names or None
+                )
+                continue
+
             self._load_tools_from_app(app_name, tool_names or None)
+            app_tools = [tool for tool in self.tool_manager.get_tools() if tool.app_name == app_name]
+            if app_tools:
+                catalog.set_app_tools(app_name, tool_names, app_tools)
+        if catalog:
+            catalog.save()
+
+    def _load_tools_from_catalog_entries(self, app_name: str, entries: list[dict[str, Any]]) -> None:
+        """Register catalog entries for an app as lazily bound tools."""
+        logger.info(f"Loading {len(entries)} tools for app '{app_name}' from the tool catalog")
+        for entry in entries:
+            resolver = partial(self._bind_tool, app_name, entry["tool_name"])
+            self.tool_manager.add_tool(CachedTool.from_catalog_entry(entry, resolver))
+
+    def _bind_tool(self, app_name: str, tool_name: str) -> Tool:
+        """Build the real tool for a function of an app, creating the app instance if needed."""
+        app_instance = self._get_app_instance(app_name)
+        for function in app_instance.list_tools():
+            if getattr(function, "__name__", None) == tool_name:
+                tool = Tool.from_function(function)
+                tool.app_name = app_instance.name
+                return tool
+        raise ToolNotFoundError(f"Tool '{tool_name}' not found in app '{app_name}'.")
 
     # --- Abstract method for subclass implementation ---
 
@@ -104,10 +173,50 @@ class ToolRegistry(ABC):
         logger.info(f"Exported {len(exported_tools)} tools to {format.value} format")
         return exported_tools if isinstance(exported_tools, list) else [exported_tools]
 
-    async def call_tool(self, tool_name: str, tool_args: dict[str, Any]) -> Any:
-        """Call a tool with the given name and arguments."""
-        result = await self.tool_manager.get_tool(tool_name)
-        return await result.run(tool_args)
+    def _get_call_timeout(self, tool: Tool, timeout: float | None) -> float | None:
+        """Pick the deadline of a call: the per-call override, the tool's own timeout, then the registry default."""
+        if timeout is not None:
+            return timeout
+        return tool.timeout if tool.timeout is not None else self.default_tool_timeout
+
+    async def call_tool(self, tool_name: str, tool_args: dict[str, Any], timeout: float | None = None) -> Any:
+        """Call a tool with the given name and arguments.
+
+        Args:
+            tool_name: The full tool name.
+            tool_args: The tool arguments.
+            timeout: Deadline in seconds for this call, overriding the tool's and the registry's default.
+        """
+        with start_span("ToolRegistry.call_tool", attributes={"mcp.tool.name": tool_name}):
+            tool = self.tool_manager.get_tool(tool_name)
+            if not tool:
+                raise ToolNotFoundError(f"Tool '{tool_name}' not found.")
+            return await tool.run(tool_args, timeout=self._get_call_timeout(tool, timeout))
+
+    async def call_tools(
+        self,
+        batch: Sequence[ToolCall],
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        max_concurrency_per_app: int = DEFAULT_BATCH_GROUP_CONCURRENCY,
+    ) -> list[ToolCallResult]:
+        """Call several tools concurrently.
+
+        Args:
+            batch: The (tool name, arguments) pairs to call.
+            max_concurrency: Maximum number of calls running at once.
+            max_concurrency_per_app: Maximum number of calls to the same app running at once.
+
+        Returns:
+            One result per call, in the order of the batch. A failing call sets
+            the `error` of its result instead of failing the batch.
+        """
+        return await run_tool_batch(
+            batch,
+            self.call_tool,
+            group_key=lambda tool_name: get_app_and_tool_name(tool_name)[0],
+            max_concurrency=max_concurrency,
+            max_concurrency_per_group=max_concurrency_per_app,
+        )
 
     @abstractmethod
     async def list_connected_apps(self) -> list[dict[str, Any]]:
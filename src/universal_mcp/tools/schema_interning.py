@@ -0,0 +1,236 @@
+import copy
+import hashlib
+import json
+import re
+import sys
+from collections import Counter
+from collections.abc import Hashable, Iterable, Iterator
+from typing import Any
+
+# Markers keep dicts, lists and unhashable values apart in fragment keys.
+_DICT, _LIST, _OBJECT = object(), object(), object()
+
+
+class SchemaInterner:
+    """Shares identical JSON schema fragments between tools.
+
+    Generated applications repeat the same sub-schemas (pagination parameters,
+    common object shapes, argument descriptions) across hundreds of tools.
+    Interning a schema rebuilds it bottom-up, replacing every subtree by the
+    first identical subtree seen before, so each distinct fragment is held in
+    memory once. Interned schemas are shared and must not be modified; copy
+    them first.
+    """
+
+    def __init__(self):
+        self._fragments: dict[Hashable, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._fragments)
+
+    def intern(self, schema: Any) -> Any:
+        """Get the shared copy of a schema.
+
+        Args:
+            schema: A JSON-compatible value.
+
+        Returns:
+            An equal value whose dicts and lists are shared with previously interned schemas.
+        """
+        if isinstance(schema, dict):
+            items = [(sys.intern(name), self.intern(item)) for name, item in schema.items()]
+            key = (_DICT, *(part for name, item in items for part in (name, _fragment_key(item))))
+            shared = self._fragments.get(key)
+            if shared is None:
+                shared = self._fragments[key] = dict(items)
+            return shared
+        if isinstance(schema, list):
+            items = [self.intern(item) for item in schema]
+            key = (_LIST, *(_fragment_key(item) for item in items))
+            shared = self._fragments.get(key)
+            if shared is None:
+                shared = self._fragments[key] = items
+            return shared
+        if isinstance(schema, str):
+            return sys.intern(schema)
+        return schema
+
+    def clear(self) -> None:
+        """Forget every fragment. Schemas interned before keep working but are no longer shared with later ones."""
+        self._fragments.clear()
+
+
+def _fragment_key(value: Any) -> Hashable:
+    """Key of an interned value inside the key of its parent fragment.
+
+    Interned dicts and lists are held by the interner, so their id identifies
+    them for as long as the keys using it exist.
+    """
+    if isinstance(value, str):
+        return value
+    if isinstance(value, dict | list):
+        return id(value)
+    try:
+        hash(value)
+    except TypeError:
+        return (_OBJECT, id(value))
+    # The type keeps `True`, `1` and `1.0` apart.
+    return (type(value), value)
+
+
+_TAG_SETS: dict[tuple[str, ...], tuple[str, ...]] = {}
+
+schema_interner = SchemaInterner()
+
+
+def intern_schema(schema: Any) -> Any:
+    """Get the shared copy of a schema from the default interner. See `SchemaInterner.intern`."""
+    return schema_interner.intern(schema)
+
+
+def intern_tags(tags: Iterable[str]) -> tuple[str, ...]:
+    """Get a shared tuple of interned tag strings, the same object for tools with the same tags."""
+    key = tuple(sys.intern(tag) for tag in tags)
+    return _TAG_SETS.setdefault(key, key)
+
+
+def clear_interned_schemas() -> None:
+    """Empty the default interner and the shared tag tuples.
+
+    Frees the fragments of tools that were dropped. Tools still registered
+    keep their schemas, which are just no longer shared with tools created
+    afterwards.
+    """
+    schema_interner.clear()
+    _TAG_SETS.clear()
+
+
+# --- $ref de-duplication ---
+
+# Keywords whose value is a map of names to subschemas, a list of subschemas, or a single subschema.
+_SCHEMA_MAP_KEYWORDS = ("properties", "patternProperties", "$defs", "definitions", "dependentSchemas")
+_SCHEMA_LIST_KEYWORDS = ("anyOf", "oneOf", "allOf", "prefixItems")
+_SCHEMA_KEYWORDS = (
+    "items",
+    "additionalProperties",
+    "not",
+    "if",
+    "then",
+    "else",
+    "contains",
+    "propertyNames",
+    "unevaluatedItems",
+    "unevaluatedProperties",
+)
+
+
+def _subschema_slots(schema: dict[str, Any]) -> Iterator[tuple[dict[str, Any] | list[Any], str | int, bool]]:
+    """Yields the container, key and whether it is a definition for every direct subschema of a schema."""
+    for keyword in _SCHEMA_MAP_KEYWORDS:
+        value = schema.get(keyword)
+        if isinstance(value, dict):
+            for name, subschema in value.items():
+                if isinstance(subschema, dict):
+                    yield value, name, keyword in ("$defs", "definitions")
+    for keyword in _SCHEMA_LIST_KEYWORDS:
+        value = schema.get(keyword)
+        if isinstance(value, list):
+            for index, subschema in enumerate(value):
+                if isinstance(subschema, dict):
+                    yield value, index, False
+    for keyword in _SCHEMA_KEYWORDS:
+        if isinstance(schema.get(keyword), dict):
+            yield schema, keyword, False
+
+
+def _canonical(schema: Any) -> str:
+    return json.dumps(schema, sort_keys=True, separators=(",", ":"), default=repr)
+
+
+def _copy_schema(schema: dict[str, Any]) -> dict[str, Any]:
+    """Copies the dicts and lists of a schema that hold subschemas, so they can be rewritten."""
+    copied = dict(schema)
+    for keyword in (*_SCHEMA_MAP_KEYWORDS, *_SCHEMA_LIST_KEYWORDS):
+        value = copied.get(keyword)
+        if isinstance(value, dict | list):
+            copied[keyword] = copy.copy(value)
+    return copied
+
+
+def _definition_name(subschema: dict[str, Any], canonical: str) -> str:
+    title = re.sub(r"[^A-Za-z0-9_]", "", str(subschema.get("title", ""))) or "Schema"
+    return f"{title}_{hashlib.sha256(canonical.encode()).hexdigest()[:8]}"
+
+
+def _saves_space(subschema: dict[str, Any], canonical: str, count: int) -> bool:
+    """Whether one definition and `count` references are shorter than `count` copies of a subschema."""
+    name = _definition_name(subschema, canonical)
+    reference = len('{"$ref":"#/$defs/"}') + len(name)
+    definition = len(name) + len('"":,') + len(canonical)
+    return count * reference + definition < count * len(canonical)
+
+
+def compact_schema(schema: dict[str, Any]) -> dict[str, Any]:
+    """Moves subschemas repeated within a schema to `$defs`, referenced with `$ref`.
+
+    A subschema is moved when it occurs more than once and the definition plus
+    its references are shorter than the copies they replace. Definitions are
+    named after the subschema's title, if any, and a hash of its content, so
+    the same schema always compacts the same way. The input is not modified;
+    subschemas left unchanged are shared with it.
+
+    Args:
+        schema: A JSON schema, such as a tool's parameters.
+
+    Returns:
+        The compacted schema, or `schema` itself if nothing was worth moving.
+    """
+    counts: Counter[str] = Counter()
+    subschemas: dict[str, dict[str, Any]] = {}
+    pending = [schema]
+    while pending:
+        node = pending.pop()
+        for container, key, is_definition in _subschema_slots(node):
+            subschema = container[key]
+            if not is_definition:
+                canonical = _canonical(subschema)
+                counts[canonical] += 1
+                subschemas.setdefault(canonical, subschema)
+            pending.append(subschema)
+    repeated = {
+        canonical
+        for canonical, count in counts.items()
+        if count > 1 and _saves_space(subschemas[canonical], canonical, count)
+    }
+    if not repeated:
+        return schema
+
+    names: dict[str, str] = {}
+    defs: dict[str, dict[str, Any]] = {}
+    refs: dict[str, list[tuple[dict[str, Any] | list[Any], str | int]]] = {}
+
+    def rewrite(node: dict[str, Any]) -> dict[str, Any]:
+        node = _copy_schema(node)
+        for container, key, is_definition in list(_subschema_slots(node)):
+            subschema = container[key]
+            canonical = _canonical(subschema) if not is_definition else None
+            if canonical not in repeated:
+                container[key] = rewrite(subschema)
+                continue
+            name = names.get(canonical)
+            if name is None:
+                name = names[canonical] = _definition_name(subschema, canonical)
+                defs[name] = rewrite(subschema)
+            container[key] = {"$ref": f"#/$defs/{name}"}
+            refs.setdefault(name, []).append((container, key))
+        return node
+
+    compacted = rewrite(schema)
+    # Subschemas repeated only inside another moved subschema end up used once; put them back inline.
+    for name, slots in refs.items():
+        if len(slots) == 1:
+            container, key = slots[0]
+            container[key] = defs.pop(name)
+    if defs:
+        compacted["$defs"] = {**compacted.get("$defs", {}), **defs}
+    return compacted
@@ -1,22 +1,47 @@
+import asyncio
+import copy
 import inspect
 from collections.abc import Callable
+from contextlib import nullcontext
+from functools import lru_cache
 from typing import Any
 
 import httpx
 from pydantic import BaseModel, Field, create_model
 
-from universal_mcp.exceptions import NotAuthorizedError, ToolError
+from universal_mcp.exceptions import NotAuthorizedError, ToolError, ToolTimeoutError
 from universal_mcp.tools.docstring_parser import parse_docstring
 from universal_mcp.types import TOOL_NAME_SEPARATOR
+from universal_mcp.utils.cancellation import call_scope
+from universal_mcp.utils.metrics import TOOL_CALL_DURATION, TOOL_CALLS, TOOL_CALLS_IN_FLIGHT
+from universal_mcp.utils.profiling import profiler
+from universal_mcp.utils.tracing import start_span
 
 from .func_metadata import FuncMetadata
 
 
 def _get_return_type_schema(return_annotation: Any) -> dict[str, Any] | None:
-    """Convert return type annotation to JSON schema using Pydantic."""
+    """Convert return type annotation to JSON schema using Pydantic.
+
+    Schemas are cached per annotation, so the many generated tools sharing a
+    return type such as `dict[str, Any]` only pay for schema generation once.
+    """
     if return_annotation == inspect.Signature.empty or return_annotation == Any:
         return None
 
+    try:
+        schema = _cached_return_type_schema(return_annotation)
+    except TypeError:  # Unhashable annotation, cannot be cached
+        schema = _build_return_type_schema(return_annotation)
+    return copy.deepcopy(schema)
+
+
+@lru_cache(maxsize=1024)
+def _cached_return_type_schema(return_annotation: Any) -> dict[str, Any] | None:
+    return _build_return_type_schema(return_annotation)
+
+
+def _build_return_type_schema(return_annotation: Any) -> dict[str, Any] | None:
     try:
         temp_model = create_model("ReturnTypeModel", return_value=(return_annotation, ...))
 
@@ -28,6 +53,22 @@ def _get_return_type_schema(return_annotation: Any) -> dict[str, Any] | None:
         return None
 
 
+TIMEOUT_TAG_PREFIX = "timeout:"
+
+
+def _timeout_from_tags(tags: list[str]) -> float | None:
+    """Get a tool's default timeout from a `timeout:<seconds>` docstring tag."""
+    for tag in tags:
+        if tag.lower().startswith(TIMEOUT_TAG_PREFIX):
+            try:
+                timeout = float(tag[len(TIMEOUT_TAG_PREFIX) :])
+            except ValueError:
+                continue
+            if timeout > 0:
+                return timeout
+    return None
+
+
 class Tool(BaseModel):
     """Internal tool registration info."""
 
@@ -50,6 +91,7 @@ class Tool(BaseModel):
         default=None, description="Metadata about the function including a pydantic model for tool arguments"
     )
     is_async: bool = Field(description="Whether the tool is async")
+    timeout: float | None = Field(default=None, description="Default timeout in seconds for a call to the tool")
 
     @property
     def name(self) -> str:
@@ -74,7 +116,7 @@ class Tool(BaseModel):
         is_async = inspect.iscoroutinefunction(fn)
 
         func_arg_metadata = FuncMetadata.func_metadata(fn, arg_description=parsed_doc["args"])
-        parameters = func_arg_metadata.arg_model.model_json_schema()
+        parameters = func_arg_metadata.arg_json_schema(title=f"{fn.__name__}Arguments")
 
         sig = inspect.signature(fn)
         output_schema = _get_return_type_schema(sig.return_annotation)
@@ -97,19 +139,72 @@ class Tool(BaseModel):
             output_schema=output_schema,
             fn_metadata=func_arg_metadata,
             is_async=is_async,
+            timeout=_timeout_from_tags(parsed_doc["tags"]),
         )
 
     async def run(
         self,
         arguments: dict[str, Any],
         context: dict[str, Any] | None = None,
+        timeout: float | None = None,
     ) -> Any:
-        """Run the tool with arguments."""
+        """Run the tool with arguments.
+
+        When a timeout applies, sync tools run in a worker thread so the call
+        can be abandoned. The call scope is cancelled on timeout or when the
+        caller is cancelled, which stops further HTTP requests of the tool.
+        Calls selected by the tool profiler are profiled, see
+        `universal_mcp.utils.profiling.enable_tool_profiling`.
+
+        Args:
+            arguments: The tool arguments.
+            context: Optional call context.
+            timeout: Deadline in seconds for this call, overriding the tool's default `timeout`.
+
+        Raises:
+            ToolTimeoutError: If the call did not finish in time.
+            ToolError: If the call failed.
+        """
+        if timeout is None:
+            timeout = self.timeout
+        status = "error"
+        profile_session = profiler.session_for(self.name) if profiler.active else None
+        fn = profile_session.wrap(self.fn, self.is_async) if profile_session else self.fn
+        TOOL_CALLS_IN_FLIGHT.inc(tool=self.name)
         try:
-            return await self.fn_metadata.call_fn_with_arg_validation(
-                self.fn, self.is_async, arguments, None, context=context
-            )
+            with (
+                start_span("Tool.run", attributes={"mcp.tool.name": self.name}),
+                call_scope(self.name, timeout) as scope,
+                profile_session or nullcontext(),
+            ):
+                with (
+                    TOOL_CALL_DURATION.time(tool=self.name, phase="validation"),
+                    start_span("FuncMetadata.validate_arguments"),
+                ):
+                    arguments_parsed = self.fn_metadata.validate_arguments(arguments)
+                call = self.fn_metadata.call_fn(
+                    fn, self.is_async, arguments_parsed, run_sync_in_thread=timeout is not None
+                )
+                try:
+                    with (
+                        TOOL_CALL_DURATION.time(tool=self.name, phase="execution"),
+                        start_span("FuncMetadata.call_fn"),
+                    ):
+                        result = await asyncio.wait_for(call, timeout)
+                except TimeoutError as e:
+                    scope.cancel()
+                    status = "timeout"
+                    raise ToolTimeoutError(f"Tool {self.name} timed out after {timeout}s") from e
+                except asyncio.CancelledError:
+                    scope.cancel()
+                    status = "cancelled"
+                    raise
+            status = "ok"
+            return result
+        except ToolTimeoutError:
+            raise
         except NotAuthorizedError as e:
+            status = "unauthorized"
             message = f"Not authorized to call tool {self.name}: {e.message}"
             return message
         except httpx.HTTPStatusError as e:
@@ -121,3 +216,6 @@ class Tool(BaseModel):
             raise ToolError(message) from e
         except Exception as e:
             raise ToolError(f"Error executing tool {self.name}: {e}") from e
+        finally:
+            TOOL_CALLS_IN_FLIGHT.dec(tool=self.name)
+            TOOL_CALLS.inc(tool=self.name, status=status)
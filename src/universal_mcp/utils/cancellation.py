@@ -0,0 +1,79 @@
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from universal_mcp.exceptions import ToolTimeoutError
+
+
+class CallScope:
+    """Deadline and cancellation state of a running tool call.
+
+    Async tools are cancelled through asyncio; sync tools offloaded to a
+    thread cannot be, so they check their scope with `raise_if_cancelled`
+    (APIApplication does so before every HTTP request) to stop doing work
+    nobody waits for anymore.
+    """
+
+    def __init__(self, tool_name: str, timeout: float | None = None):
+        self.tool_name = tool_name
+        self.timeout = timeout
+        self.deadline = time.monotonic() + timeout if timeout is not None else None
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def remaining(self) -> float | None:
+        """Seconds left before the deadline, or None if the call has no deadline."""
+        if self.deadline is None:
+            return None
+        return max(self.deadline - time.monotonic(), 0.0)
+
+    def raise_if_cancelled(self) -> None:
+        if self.cancelled or self.remaining() == 0.0:
+            raise ToolTimeoutError(f"Tool {self.tool_name} was cancelled or exceeded its {self.timeout}s timeout")
+
+
+_current_scope: ContextVar[CallScope | None] = ContextVar("universal_mcp_call_scope", default=None)
+
+
+def current_call_scope() -> CallScope | None:
+    """Get the scope of the tool call running in the current context, if any."""
+    return _current_scope.get()
+
+
+def raise_if_cancelled() -> None:
+    """Raise ToolTimeoutError if the current tool call was cancelled or is past its deadline."""
+    scope = _current_scope.get()
+    if scope is not None:
+        scope.raise_if_cancelled()
+
+
+def remaining_time(default: float | None = None) -> float | None:
+    """Get the time left for the current tool call, capped by `default`.
+
+    Args:
+        default: Value to use when there is no deadline, e.g. a client's own timeout.
+    """
+    scope = _current_scope.get()
+    remaining = scope.remaining() if scope is not None else None
+    if remaining is None:
+        return default
+    return remaining if default is None else min(remaining, default)
+
+
+@contextmanager
+def call_scope(tool_name: str, timeout: float | None = None) -> Iterator[CallScope]:
+    """Make a new call scope current for the duration of the block."""
+    scope = CallScope(tool_name, timeout)
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_scope.reset(token)
@@ -0,0 +1,340 @@
+import bisect
+import math
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from typing import Any, ClassVar
+
+import httpx
+
+from universal_mcp.utils.tracing import inject_trace_context, start_span
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label(value)}"' for name, value in labels.items()) + "}"
+
+
+class Metric:
+    """A named metric with one value per combination of label values."""
+
+    type: ClassVar[str]
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: dict[tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, Any]) -> tuple[str, ...]:
+        if labels.keys() != set(self.labelnames):
+            raise ValueError(f"Metric {self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def samples(self) -> list[dict[str, Any]]:
+        """Get the current value of every label combination."""
+        with self._lock:
+            items = list(self._values.items())
+        return [
+            {"labels": dict(zip(self.labelnames, key, strict=True)), "value": self._export(value)}
+            for key, value in items
+        ]
+
+    def _export(self, value: Any) -> Any:
+        return value
+
+    def _render(self, labels: dict[str, str], value: Any) -> list[str]:
+        return [f"{self.name}{_format_labels(labels)} {_format_value(value)}"]
+
+    def render(self) -> list[str]:
+        """Render the metric in the Prometheus text exposition format."""
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type}"]
+        for sample in self.samples():
+            lines.extend(self._render(sample["labels"], sample["value"]))
+        return lines
+
+
+class Counter(Metric):
+    """A value that only goes up, such as a number of calls."""
+
+    type = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only be incremented")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(Metric):
+    """A value that goes up and down, such as a number of calls in flight."""
+
+    type = "gauge"
+
+    def set(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram(Metric):
+    """Distribution of observed values, such as latencies, in cumulative buckets."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # Per-bucket (non-cumulative) counts, the overflow bucket last, then count and sum.
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0, 0.0]
+            state[0][index] += 1
+            state[1] += 1
+            state[2] += value
+
+    @contextmanager
+    def time(self, **labels: Any) -> Iterator[None]:
+        """Observe the duration of the block in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def _export(self, value: Any) -> dict[str, Any]:
+        counts, count, total = value[0][:], value[1], value[2]
+        cumulative = 0
+        buckets = {}
+        for bound, bucket_count in zip((*self.buckets, math.inf), counts, strict=True):
+            cumulative += bucket_count
+            buckets[_format_value(bound)] = cumulative
+        return {"count": count, "sum": total, "buckets": buckets}
+
+    def _render(self, labels: dict[str, str], value: dict[str, Any]) -> list[str]:
+        lines = [
+            f"{self.name}_bucket{_format_labels({**labels, 'le': bound})} {count}"
+            for bound, count in value["buckets"].items()
+        ]
+        lines.append(f"{self.name}_count{_format_labels(labels)} {value['count']}")
+        lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(value['sum'])}")
+        return lines
+
+
+class MetricsRegistry:
+    """A set of metrics that can be snapshotted or exposed to Prometheus."""
+
+    def __init__(self):
+        self._metrics: dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: Metric) -> Any:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"Metric {metric.name} is already registered with a different type or labels")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Get or create a counter."""
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Get or create a gauge."""
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram."""
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def get(self, name: str) -> Metric | None:
+        return self._metrics.get(name)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Get the current value of every metric.
+
+        Returns:
+            A dictionary mapping metric names to their type, description and
+            samples. Each sample holds its labels and value; histogram values
+            hold the observation count, sum and cumulative bucket counts.
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return {
+            metric.name: {"type": metric.type, "help": metric.documentation, "samples": metric.samples()}
+            for metric in metrics
+        }
+
+    def render_prometheus(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "\n".join(line for metric in metrics for line in metric.render()) + "\n"
+
+    def reset(self) -> None:
+        """Clear the values of every metric, keeping the metrics registered."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.clear()
+
+
+registry = MetricsRegistry()
+
+TOOL_CALLS = registry.counter(
+    "universal_mcp_tool_calls_total",
+    "Tool calls by outcome (ok, error, timeout, cancelled, unauthorized).",
+    ("tool", "status"),
+)
+TOOL_CALL_DURATION = registry.histogram(
+    "universal_mcp_tool_call_duration_seconds",
+    "Tool call latency by phase (validation, execution, formatting).",
+    ("tool", "phase"),
+)
+TOOL_CALLS_IN_FLIGHT = registry.gauge("universal_mcp_tool_calls_in_flight", "Tool calls currently running.", ("tool",))
+HTTP_REQUESTS = registry.counter(
+    "universal_mcp_http_requests_total",
+    "Upstream HTTP requests made by applications, by response status ('error' if no response).",
+    ("app", "host", "method", "status"),
+)
+HTTP_REQUEST_DURATION = registry.histogram(
+    "universal_mcp_http_request_duration_seconds",
+    "Upstream HTTP request latency until the response headers are received.",
+    ("app", "host", "method"),
+)
+HTTP_REQUESTS_IN_FLIGHT = registry.gauge(
+    "universal_mcp_http_requests_in_flight", "Upstream HTTP requests currently waiting for a response.", ("app", "host")
+)
+
+
+def get_metrics_snapshot() -> dict[str, dict[str, Any]]:
+    """Get the current value of every built-in metric. See `MetricsRegistry.snapshot`."""
+    return registry.snapshot()
+
+
+def render_prometheus() -> str:
+    """Render every built-in metric in the Prometheus text exposition format."""
+    return registry.render_prometheus()
+
+
+class _RequestTracker:
+    """Records metrics and a client span for an outgoing request, and propagates the trace context."""
+
+    def __init__(self, app_name: str, request: httpx.Request):
+        self.app_name = app_name
+        self.host = request.url.host
+        self.method = request.method
+        self.status = "error"
+        self.span = start_span(
+            f"HTTP {self.method}",
+            kind="client",
+            attributes={
+                "universal_mcp.app": app_name,
+                "http.request.method": self.method,
+                "server.address": self.host,
+                "url.path": request.url.path,
+            },
+        )
+        self.request = request
+
+    def record_response(self, response: httpx.Response) -> None:
+        self.status = str(response.status_code)
+        self.span.set_attribute("http.response.status_code", response.status_code)
+
+    def __enter__(self) -> "_RequestTracker":
+        self.span.__enter__()
+        inject_trace_context(self.request.headers)
+        HTTP_REQUESTS_IN_FLIGHT.inc(app=self.app_name, host=self.host)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        elapsed = time.perf_counter() - self.start
+        self.span.__exit__(*exc_info)
+        HTTP_REQUESTS_IN_FLIGHT.dec(app=self.app_name, host=self.host)
+        HTTP_REQUEST_DURATION.observe(elapsed, app=self.app_name, host=self.host, method=self.method)
+        HTTP_REQUESTS.inc(app=self.app_name, host=self.host, method=self.method, status=self.status)
+
+
+class InstrumentedClient(httpx.Client):
+    """httpx client recording the latency and status of requests made by an application.
+
+    Requests are recorded in `send` rather than by a custom transport, so the
+    client keeps honouring the proxy environment variables (httpx ignores them
+    when a transport is passed).
+    """
+
+    def __init__(self, app_name: str, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.app_name = app_name
+
+    def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        with _RequestTracker(self.app_name, request) as tracker:
+            response = super().send(request, **kwargs)
+            tracker.record_response(response)
+            return response
+
+
+class AsyncInstrumentedClient(httpx.AsyncClient):
+    """Async counterpart of `InstrumentedClient`."""
+
+    def __init__(self, app_name: str, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.app_name = app_name
+
+    async def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        with _RequestTracker(self.app_name, request) as tracker:
+            response = await super().send(request, **kwargs)
+            tracker.record_response(response)
+            return response
@@ -0,0 +1,223 @@
+import cProfile
+import functools
+import io
+import os
+import pstats
+import random
+import re
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+TRACEMALLOC_FRAMES = 25
+REPORT_TOP_FUNCTIONS = 40
+REPORT_TOP_ALLOCATIONS = 25
+
+
+def get_default_profile_dir() -> Path:
+    """Get the directory where tool call profiles are written."""
+    return Path.home() / ".universal-mcp" / "profiles"
+
+
+class ProfileSession:
+    """Profiles a single tool call.
+
+    The tool function is wrapped so cProfile runs in whichever thread executes
+    it, including the worker thread of sync tools with a timeout. For async
+    tools, other tasks running on the event loop while the tool awaits are
+    profiled too. Allocations are traced with tracemalloc for the whole call.
+    """
+
+    def __init__(self, profiler: "ToolProfiler", tool_name: str):
+        self.profiler = profiler
+        self.tool_name = tool_name
+        self.profile = cProfile.Profile()
+        self._started_tracemalloc = False
+        self._start_snapshot: tracemalloc.Snapshot | None = None
+
+    def wrap(self, fn: Callable[..., Any], is_async: bool) -> Callable[..., Any]:
+        """Wrap the tool function so its execution is profiled."""
+        if is_async:
+
+            @functools.wraps(fn)
+            async def async_wrapper(**kwargs: Any) -> Any:
+                self.profile.enable()
+                try:
+                    return await fn(**kwargs)
+                finally:
+                    self.profile.disable()
+
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(**kwargs: Any) -> Any:
+            self.profile.enable()
+            try:
+                return fn(**kwargs)
+            finally:
+                self.profile.disable()
+
+        return wrapper
+
+    def __enter__(self) -> "ProfileSession":
+        if self.profiler.trace_allocations:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(TRACEMALLOC_FRAMES)
+                self._started_tracemalloc = True
+            tracemalloc.reset_peak()
+            self._start_snapshot = tracemalloc.take_snapshot()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: BaseException | None, tb: Any) -> None:
+        elapsed = time.perf_counter() - self.start
+        try:
+            allocations = None
+            if self._start_snapshot is not None:
+                _, peak = tracemalloc.get_traced_memory()
+                diff = tracemalloc.take_snapshot().compare_to(self._start_snapshot, "lineno")
+                allocations = (peak, diff)
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+            self.profiler._write(self, elapsed, exc, allocations)
+        except Exception as e:
+            logger.warning(f"Failed to write profile of tool '{self.tool_name}': {e}")
+        finally:
+            self.profiler._finish(self)
+
+
+class ToolProfiler:
+    """Opt-in profiling of individual tool calls, toggled at runtime.
+
+    Calls are profiled when their tool is selected by name or picked by
+    sampling. Each profiled call writes a `.prof` file, loadable with
+    `pstats` or snakeviz, and a `.txt` report with the slowest functions and
+    the largest allocations. Only one call is profiled at a time; calls
+    overlapping a profiled one run unprofiled.
+    """
+
+    def __init__(self):
+        self.output_dir = get_default_profile_dir()
+        self.tool_names: frozenset[str] = frozenset()
+        self.sample_rate = 0.0
+        self.trace_allocations = True
+        self.active = False
+        self._session: ProfileSession | None = None
+        self._lock = threading.Lock()
+
+    def enable(
+        self,
+        tool_names: Iterable[str] | None = None,
+        sample_rate: float = 0.0,
+        output_dir: Path | str | None = None,
+        trace_allocations: bool = True,
+    ) -> None:
+        """Start profiling the selected tool calls.
+
+        Args:
+            tool_names: Full names of the tools whose every call is profiled.
+            sample_rate: Fraction of the calls to other tools that are profiled, from 0 to 1.
+            output_dir: Directory for profiles. Defaults to `get_default_profile_dir()`.
+            trace_allocations: Whether to also trace memory allocations with tracemalloc.
+
+        Raises:
+            TypeError: If `tool_names` is a single string rather than a collection of names.
+            ValueError: If `sample_rate` is not between 0 and 1.
+        """
+        if isinstance(tool_names, str):
+            raise TypeError("tool_names must be a collection of tool names, not a string")
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("Sample rate must be between 0 and 1")
+        self.tool_names = frozenset(tool_names or ())
+        self.sample_rate = sample_rate
+        self.output_dir = Path(output_dir) if output_dir else get_default_profile_dir()
+        self.trace_allocations = trace_allocations
+        self.active = bool(self.tool_names) or sample_rate > 0
+        logger.info(
+            f"Tool profiling {'enabled' if self.active else 'disabled'} "
+            f"(tools: {sorted(self.tool_names) or 'none'}, sample rate: {sample_rate}, output: {self.output_dir})"
+        )
+
+    def disable(self) -> None:
+        """Stop profiling tool calls."""
+        self.active = False
+        self.tool_names = frozenset()
+        self.sample_rate = 0.0
+        logger.info("Tool profiling disabled")
+
+    def status(self) -> dict[str, Any]:
+        return {
+            "active": self.active,
+            "tool_names": sorted(self.tool_names),
+            "sample_rate": self.sample_rate,
+            "output_dir": str(self.output_dir),
+            "trace_allocations": self.trace_allocations,
+        }
+
+    def session_for(self, tool_name: str) -> ProfileSession | None:
+        """Start a profile session if this call of the tool should be profiled."""
+        if tool_name not in self.tool_names and not (self.sample_rate and random.random() < self.sample_rate):
+            return None
+        with self._lock:
+            if self._session is not None:
+                return None
+            self._session = ProfileSession(self, tool_name)
+            return self._session
+
+    def _finish(self, session: ProfileSession) -> None:
+        with self._lock:
+            if self._session is session:
+                self._session = None
+
+    def _write(
+        self,
+        session: ProfileSession,
+        elapsed: float,
+        exc: BaseException | None,
+        allocations: tuple[int, list[tracemalloc.StatisticDiff]] | None,
+    ) -> None:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        safe_name = re.sub(r"[^\w.-]", "_", session.tool_name)
+        stem = self.output_dir / f"{safe_name}-{datetime.now().strftime('%Y%m%dT%H%M%S%f')}-{os.getpid()}"
+        session.profile.create_stats()
+        session.profile.dump_stats(f"{stem}.prof")
+
+        report = io.StringIO()
+        report.write(f"Tool: {session.tool_name}\n")
+        report.write(f"Wall time: {elapsed:.6f}s\n")
+        report.write(f"Outcome: {'error: ' + repr(exc) if exc else 'ok'}\n\n")
+        if session.profile.stats:
+            stats = pstats.Stats(session.profile, stream=report)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(REPORT_TOP_FUNCTIONS)
+        if allocations is not None:
+            peak, diff = allocations
+            report.write(f"Peak traced memory: {peak / 1024:.1f} KiB\n")
+            report.write(f"Top {REPORT_TOP_ALLOCATIONS} allocation sites by size difference:\n")
+            for stat in diff[:REPORT_TOP_ALLOCATIONS]:
+                report.write(f"  {stat}\n")
+        Path(f"{stem}.txt").write_text(report.getvalue())
+        logger.info(f"Wrote profile of tool '{session.tool_name}' to {stem}.prof")
+
+
+profiler = ToolProfiler()
+
+
+def enable_tool_profiling(
+    tool_names: Iterable[str] | None = None,
+    sample_rate: float = 0.0,
+    output_dir: Path | str | None = None,
+    trace_allocations: bool = True,
+) -> None:
+    """Start profiling tool calls. See `ToolProfiler.enable`."""
+    profiler.enable(tool_names, sample_rate, output_dir, trace_allocations)
+
+
+def disable_tool_profiling() -> None:
+    """Stop profiling tool calls."""
+    profiler.disable()
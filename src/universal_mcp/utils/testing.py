@@ -1,8 +1,6 @@
 import os
 from dataclasses import dataclass
 
-from langchain_core.messages import AIMessage, HumanMessage
-from langgraph.prebuilt import create_react_agent
 from loguru import logger
 from pydantic import BaseModel, SecretStr
 from universal_mcp.agentr import AgentrIntegration
@@ -146,6 +144,9 @@ async def execute_automation_test(test_case: AutomationTestCase, app_instance: A
         test_case: Test case to execute
         app_instance: The application instance to test (optional if provided in test_case)
     """
+    from langchain_core.messages import AIMessage, HumanMessage
+    from langgraph.prebuilt import create_react_agent
+
     tool_manager = ToolManager()
 
     if app_instance is None:
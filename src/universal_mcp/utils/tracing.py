@@ -0,0 +1,428 @@
+"""Optional, dependency-free tracing of the tool call pipeline.
+
+Spans follow the OpenTelemetry data model and are exported as OTLP/JSON,
+either to a local file (one export request per line) or to an OTLP/HTTP
+collector. Trace context is propagated with W3C `traceparent` values.
+
+Tracing is off until `configure_tracing` is called; until then `start_span`
+returns a shared no-op span and costs a single global lookup.
+"""
+
+import atexit
+import json
+import queue
+import random
+import re
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Mapping, MutableMapping
+from contextvars import ContextVar, Token
+from pathlib import Path
+from typing import Any, Literal, NamedTuple
+
+import httpx
+
+SpanKind = Literal["internal", "server", "client"]
+
+TRACEPARENT_HEADER = "traceparent"
+DEFAULT_SERVICE_NAME = "universal-mcp"
+DEFAULT_SPAN_QUEUE_SIZE = 2048
+DEFAULT_EXPORT_BATCH_SIZE = 512
+DEFAULT_EXPORT_INTERVAL = 5.0  # seconds
+OTLP_EXPORT_TIMEOUT = 10.0  # seconds
+
+_SPAN_KINDS = {"internal": 1, "server": 2, "client": 3}
+_STATUS_ERROR = 2
+_TRACEPARENT_RE = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+
+class SpanContext(NamedTuple):
+    """Identifies a span within a trace."""
+
+    trace_id: str
+    span_id: str
+
+
+def parse_traceparent(value: str | None) -> SpanContext | None:
+    """Parse a W3C `traceparent` value, returning None if it is missing or invalid."""
+    if not value:
+        return None
+    match = _TRACEPARENT_RE.match(value.strip().lower())
+    if not match or match.group(1) == "0" * 32 or match.group(2) == "0" * 16:
+        return None
+    return SpanContext(match.group(1), match.group(2))
+
+
+def format_traceparent(context: SpanContext) -> str:
+    return f"00-{context.trace_id}-{context.span_id}-01"
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Mapping[str, Any]) -> list[dict[str, Any]]:
+    return [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items()]
+
+
+class Span:
+    """A timed operation within a trace. Use `start_span` to create one."""
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        kind: SpanKind,
+        parent: SpanContext | None,
+        attributes: Mapping[str, Any] | None,
+    ):
+        self._tracer = tracer
+        self.name = name
+        self.kind = kind
+        self.context = SpanContext(
+            parent.trace_id if parent else f"{random.getrandbits(128):032x}",
+            f"{random.getrandbits(64):016x}",
+        )
+        self.parent_id = parent.span_id if parent else None
+        self.attributes: dict[str, Any] = dict(attributes or {})
+        self.events: list[dict[str, Any]] = []
+        self.error: str | None = None
+        self.start_time = time.time_ns()
+        self.end_time: int | None = None
+        self._token: Token | None = None
+
+    @property
+    def is_recording(self) -> bool:
+        return self.end_time is None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def record_exception(self, exception: BaseException) -> None:
+        """Mark the span as failed and record the exception as an event."""
+        self.error = f"{type(exception).__name__}: {exception}"
+        self.events.append(
+            {
+                "name": "exception",
+                "timeUnixNano": str(time.time_ns()),
+                "attributes": _otlp_attributes(
+                    {"exception.type": type(exception).__name__, "exception.message": str(exception)}
+                ),
+            }
+        )
+
+    def end(self) -> None:
+        if self.end_time is None:
+            self.end_time = time.time_ns()
+            self._tracer._on_end(self)
+
+    def to_otlp(self) -> dict[str, Any]:
+        """Encode the span in the OTLP/JSON format."""
+        span: dict[str, Any] = {
+            "traceId": self.context.trace_id,
+            "spanId": self.context.span_id,
+            "name": self.name,
+            "kind": _SPAN_KINDS[self.kind],
+            "startTimeUnixNano": str(self.start_time),
+            "endTimeUnixNano": str(self.end_time or time.time_ns()),
+            "attributes": _otlp_attributes(self.attributes),
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        if self.events:
+            span["events"] = self.events
+        if self.error:
+            span["status"] = {"code": _STATUS_ERROR, "message": self.error}
+        return span
+
+    def __enter__(self) -> "Span":
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type: Any, exc: BaseException | None, tb: Any) -> None:
+        if exc is not None:
+            self.record_exception(exc)
+        if self._token is not None:
+            _current_span.reset(self._token)
+            self._token = None
+        self.end()
+
+
+class _NoOpSpan:
+    """Stands in for a span while tracing is off."""
+
+    is_recording = False
+    context = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def record_exception(self, exception: BaseException) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+    def __enter__(self) -> "_NoOpSpan":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        pass
+
+
+NOOP_SPAN = _NoOpSpan()
+_current_span: ContextVar[Span | None] = ContextVar("universal_mcp_current_span", default=None)
+
+
+class SpanExporter(ABC):
+    """Receives batches of finished spans from the tracer's export thread."""
+
+    @abstractmethod
+    def export(self, spans: list[Span], service_name: str) -> None:
+        """Export a batch of finished spans.
+
+        Args:
+            spans: The finished spans.
+            service_name: Name of the service the spans belong to.
+        """
+
+    def shutdown(self) -> None:  # noqa: B027 - optional hook, nothing to release by default
+        """Release the exporter's resources once the tracer has flushed its last batch."""
+
+    @staticmethod
+    def export_request(spans: list[Span], service_name: str) -> dict[str, Any]:
+        """Build an OTLP `ExportTraceServiceRequest` for a batch of spans."""
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": _otlp_attributes({"service.name": service_name})},
+                    "scopeSpans": [{"scope": {"name": "universal_mcp"}, "spans": [span.to_otlp() for span in spans]}],
+                }
+            ]
+        }
+
+
+class FileSpanExporter(SpanExporter):
+    """Appends each batch of spans to a file as one OTLP/JSON export request per line."""
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")  # noqa: SIM115 - closed in shutdown()
+
+    def export(self, spans: list[Span], service_name: str) -> None:
+        self._file.write(json.dumps(self.export_request(spans, service_name)) + "\n")
+        self._file.flush()
+
+    def shutdown(self) -> None:
+        self._file.close()
+
+
+class OTLPSpanExporter(SpanExporter):
+    """Sends batches of spans to an OTLP/HTTP collector using the JSON encoding."""
+
+    def __init__(self, endpoint: str, headers: Mapping[str, str] | None = None, timeout: float = OTLP_EXPORT_TIMEOUT):
+        """
+        Args:
+            endpoint: Collector URL, e.g. "http://localhost:4318". "/v1/traces" is appended if missing.
+            headers: Extra headers sent with every export, e.g. for authentication.
+            timeout: Time limit in seconds for each export request.
+        """
+        endpoint = endpoint.rstrip("/")
+        self.endpoint = endpoint if endpoint.endswith("/v1/traces") else f"{endpoint}/v1/traces"
+        self._client = httpx.Client(headers=dict(headers or {}), timeout=timeout)
+
+    def export(self, spans: list[Span], service_name: str) -> None:
+        response = self._client.post(self.endpoint, json=self.export_request(spans, service_name))
+        response.raise_for_status()
+
+    def shutdown(self) -> None:
+        self._client.close()
+
+
+class Tracer:
+    """Creates spans and exports finished ones in batches from a background thread.
+
+    Finished spans wait in a bounded queue; when it is full, spans are dropped
+    and counted rather than slowing down the traced code.
+    """
+
+    def __init__(
+        self,
+        exporter: SpanExporter,
+        service_name: str = DEFAULT_SERVICE_NAME,
+        max_queue_size: int = DEFAULT_SPAN_QUEUE_SIZE,
+        batch_size: int = DEFAULT_EXPORT_BATCH_SIZE,
+        export_interval: float = DEFAULT_EXPORT_INTERVAL,
+    ):
+        self.exporter = exporter
+        self.service_name = service_name
+        self.batch_size = batch_size
+        self.export_interval = export_interval
+        self.dropped = 0
+        self._queue: queue.Queue[Span] = queue.Queue(max_queue_size)
+        self._flush_requested = threading.Event()
+        self._stopped = threading.Event()
+        self._worker = threading.Thread(target=self._run, name="universal-mcp-span-exporter", daemon=True)
+        self._worker.start()
+
+    def start_span(
+        self,
+        name: str,
+        kind: SpanKind = "internal",
+        attributes: Mapping[str, Any] | None = None,
+        parent: SpanContext | None = None,
+    ) -> Span:
+        if parent is None:
+            current = _current_span.get()
+            parent = current.context if current is not None else None
+        return Span(self, name, kind, parent, attributes)
+
+    def _on_end(self, span: Span) -> None:
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+
+    def _export_pending(self) -> None:
+        while True:
+            batch: list[Span] = []
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if not batch:
+                return
+            try:
+                self.exporter.export(batch, self.service_name)
+            except Exception as e:
+                print(f"Failed to export {len(batch)} spans: {e}", file=sys.stderr)
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._flush_requested.wait(self.export_interval)
+            self._flush_requested.clear()
+            self._export_pending()
+        self._export_pending()
+
+    def force_flush(self, timeout: float | None = None) -> None:
+        """Export the finished spans now and wait until the queue is drained."""
+        self._flush_requested.set()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self._queue.empty() and self._worker.is_alive():
+            if deadline is not None and time.monotonic() >= deadline:
+                return
+            time.sleep(0.01)
+
+    def shutdown(self) -> None:
+        """Export the remaining spans and stop the export thread."""
+        if self._stopped.is_set():
+            return
+        self._stopped.set()
+        self._flush_requested.set()
+        self._worker.join()
+        self.exporter.shutdown()
+
+
+_tracer: Tracer | None = None
+
+
+def configure_tracing(
+    exporter: SpanExporter | None = None,
+    *,
+    file: Path | str | None = None,
+    otlp_endpoint: str | None = None,
+    otlp_headers: Mapping[str, str] | None = None,
+    service_name: str = DEFAULT_SERVICE_NAME,
+) -> Tracer:
+    """Turn tracing on, replacing any tracer configured before.
+
+    Args:
+        exporter: Exporter receiving finished spans. Takes precedence over `file` and `otlp_endpoint`.
+        file: Append spans to this file as OTLP/JSON.
+        otlp_endpoint: Send spans to this OTLP/HTTP collector.
+        otlp_headers: Extra headers for the collector.
+        service_name: The `service.name` resource attribute of exported spans.
+
+    Raises:
+        ValueError: If no exporter, file or endpoint is given.
+    """
+    global _tracer
+
+    if exporter is None:
+        if otlp_endpoint:
+            exporter = OTLPSpanExporter(otlp_endpoint, headers=otlp_headers)
+        elif file:
+            exporter = FileSpanExporter(file)
+        else:
+            raise ValueError("Tracing needs an exporter, a file or an OTLP endpoint")
+    shutdown_tracing()
+    _tracer = Tracer(exporter, service_name=service_name)
+    atexit.register(_tracer.shutdown)
+    return _tracer
+
+
+def shutdown_tracing() -> None:
+    """Export the remaining spans and turn tracing off."""
+    global _tracer
+
+    tracer, _tracer = _tracer, None
+    if tracer is not None:
+        atexit.unregister(tracer.shutdown)
+        tracer.shutdown()
+
+
+def get_tracer() -> Tracer | None:
+    return _tracer
+
+
+def start_span(
+    name: str,
+    kind: SpanKind = "internal",
+    attributes: Mapping[str, Any] | None = None,
+    parent: SpanContext | None = None,
+) -> Span | _NoOpSpan:
+    """Start a span, to be used as a context manager.
+
+    The span becomes the current span inside the `with` block, is marked
+    failed if the block raises, and ends when the block exits.
+
+    Args:
+        name: Name of the operation.
+        kind: "server" for handling an incoming request, "client" for an outgoing one.
+        attributes: Initial span attributes.
+        parent: Remote parent, e.g. extracted from an incoming `traceparent`. Defaults to the current span.
+    """
+    tracer = _tracer
+    if tracer is None:
+        return NOOP_SPAN
+    return tracer.start_span(name, kind, attributes, parent)
+
+
+def current_span() -> Span | None:
+    return _current_span.get()
+
+
+def inject_trace_context(carrier: MutableMapping[str, Any]) -> MutableMapping[str, Any]:
+    """Add the `traceparent` of the current span to outgoing headers or request metadata."""
+    span = _current_span.get()
+    if span is not None:
+        carrier[TRACEPARENT_HEADER] = format_traceparent(span.context)
+    return carrier
+
+
+def extract_trace_context(carrier: Mapping[str, Any] | None) -> SpanContext | None:
+    """Read the remote parent from incoming headers or request metadata."""
+    if not carrier:
+        return None
+    value = carrier.get(TRACEPARENT_HEADER)
+    return parse_traceparent(value) if isinstance(value, str) else None